@@ -0,0 +1,90 @@
+import time
+
+import pytest
+
+from zion_auth.adapters.memory import InMemoryAdapter, InMemoryUserStore
+from zion_auth.models import User
+
+
+def make_user(id: int, **kwargs) -> User:
+    data = {
+        "id": id,
+        "pid": f"pid-{id}",
+        "hashed_password": "hashed",
+        "email": f"user{id}@example.com",
+        "username": f"user{id}",
+    }
+    data.update(kwargs)
+    return User(**data)
+
+
+@pytest.fixture
+def store() -> InMemoryUserStore:
+    store = InMemoryUserStore()
+    store.seed(make_user(id) for id in range(1, 101))
+    return store
+
+
+@pytest.mark.asyncio
+async def test_lookups_use_indexes(store):
+    # Given
+    adapter = InMemoryAdapter(store)
+
+    # When / Then
+    assert (await adapter.get_by_id(5)).id == 5
+    assert (await adapter.get_by_public_id("pid-6")).id == 6
+    assert (await adapter.get_by_email("user7@example.com")).id == 7
+    assert (await adapter.get_by_username("user8")).id == 8
+    assert (await adapter.get_by_credential("user9@example.com")).id == 9
+    assert (await adapter.get_by_credential("user10")).id == 10
+
+
+@pytest.mark.asyncio
+async def test_lookups_return_none_if_not_found(store):
+    # Given
+    adapter = InMemoryAdapter(store)
+
+    # When / Then
+    assert await adapter.get_by_id(1000) is None
+    assert await adapter.get_by_public_id("unknown") is None
+    assert await adapter.get_by_email("unknown@example.com") is None
+    assert await adapter.get_by_username("unknown") is None
+    assert await adapter.get_by_credential("unknown") is None
+
+
+def test_seed_returns_count_and_replaces_by_id(store):
+    # Given
+    updated = make_user(1, email="changed@example.com")
+
+    # When
+    count = store.seed([updated])
+
+    # Then
+    assert count == 1
+    assert len(store) == 100
+    assert store.get_by_email("changed@example.com") is updated
+    assert store.get_by_email("user1@example.com") is None
+
+
+def test_add_raises_error_on_duplicate_unique_value(store):
+    # Given
+    duplicate = make_user(1000, email="user1@example.com")
+
+    # When / Then
+    with pytest.raises(ValueError):
+        store.add(duplicate)
+
+
+@pytest.mark.asyncio
+async def test_latency_is_applied():
+    # Given
+    store = InMemoryUserStore(latency=0.02, jitter=0.005, seed=42)
+    adapter = InMemoryAdapter(store)
+
+    # When
+    started = time.perf_counter()
+    await adapter.get_by_id(1)
+    elapsed = time.perf_counter() - started
+
+    # Then
+    assert elapsed >= 0.015
@@ -0,0 +1,58 @@
+import importlib
+import sys
+
+import pytest
+
+from zion_utils.registry import Registry
+
+
+ADAPTER_MODULE = "zion_auth.adapters.sqlalchemy.adapter"
+
+
+async def session_dep():
+    yield None
+
+
+async def read_session_dep():
+    yield None
+
+
+@pytest.fixture
+def import_adapter(monkeypatch: pytest.MonkeyPatch):
+    """Import the adapter again, with the session providers registered."""
+    registry = Registry("zion_auth")
+    registry.register("database_session_dep", session_dep)
+    # As if an installed package provided it through an entry point
+    registry.register("database_read_session_dep", read_session_dep)
+    monkeypatch.setattr("zion_auth.providers.registry", registry)
+    monkeypatch.delitem(sys.modules, ADAPTER_MODULE, raising=False)
+
+    def import_adapter():
+        return importlib.import_module(ADAPTER_MODULE)
+
+    yield import_adapter
+    sys.modules.pop(ADAPTER_MODULE, None)
+
+
+def test_lookups_use_the_session_by_default(import_adapter):
+    # When
+    adapter = import_adapter()
+
+    # Then
+    assert adapter.read_session_dependency is session_dep
+
+
+def test_lookups_use_the_read_session_when_set(
+    import_adapter, monkeypatch: pytest.MonkeyPatch
+):
+    # Given
+    monkeypatch.setattr(
+        "zion_auth.settings.settings.database_read_session_dep",
+        "tests.adapters.test_sqlalchemy_adapter.read_session_dep",
+    )
+
+    # When
+    adapter = import_adapter()
+
+    # Then
+    assert adapter.read_session_dependency is read_session_dep
@@ -0,0 +1,91 @@
+import pytest
+
+from zion_auth.adapters.memory import InMemoryAdapter, InMemoryUserStore
+from zion_auth.models import User
+from zion_auth.services.bookkeeping import LoginBookkeepingService
+
+
+@pytest.fixture
+def store() -> InMemoryUserStore:
+    store = InMemoryUserStore()
+    store.seed(
+        User(id=id, pid=f"pid-{id}", hashed_password="hashed", email=f"{id}@x.com")
+        for id in range(1, 4)
+    )
+    return store
+
+
+class RecordingWriter:
+    def __init__(self, adapter: InMemoryAdapter):
+        self.adapter = adapter
+        self.batches = []
+
+    async def __call__(self, activities):
+        self.batches.append(list(activities))
+        await self.adapter.update_login_activity(activities)
+
+
+@pytest.mark.asyncio
+async def test_updates_are_coalesced_per_user(store):
+    # Given
+    writer = RecordingWriter(InMemoryAdapter(store))
+    service = LoginBookkeepingService(writer, flush_interval=60)
+
+    # When
+    async with service:
+        await service.record_failure(1)
+        await service.record_failure(1)
+        await service.record_failure(2)
+        await service.record_success(2)
+        await service.record_failure(2)
+        await service.record_success(3)
+
+    # Then
+    assert len(writer.batches) == 1
+    assert len(writer.batches[0]) == 3
+    assert store.get(1).failed_login_attempts == 2
+    assert store.get(1).last_login_at is None
+    assert store.get(2).failed_login_attempts == 1
+    assert store.get(2).last_login_at is not None
+    assert store.get(3).failed_login_attempts == 0
+    assert store.get(3).last_login_at is not None
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_in_batches(store):
+    # Given
+    writer = RecordingWriter(InMemoryAdapter(store))
+    service = LoginBookkeepingService(writer, flush_interval=60, batch_size=2)
+
+    # When
+    for id in range(1, 4):
+        await service.record_failure(id)
+    await service.flush()
+
+    # Then
+    assert [len(batch) for batch in writer.batches] == [2, 1]
+    assert service.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_write_is_requeued(store):
+    # Given
+    calls = []
+
+    async def failing_writer(activities):
+        calls.append(activities)
+        raise RuntimeError("database is down")
+
+    service = LoginBookkeepingService(failing_writer, flush_interval=60)
+    await service.record_failure(1)
+
+    # When
+    await service.flush()
+    await service.record_failure(1)
+    service.writer = RecordingWriter(InMemoryAdapter(store))
+    await service.flush()
+
+    # Then
+    assert len(calls) == 1
+    assert service.pending_count == 0
+    assert store.get(1).failed_login_attempts == 2
@@ -0,0 +1,140 @@
+import pytest
+
+from zion_auth.exceptions import ImproperlyConfiguredError
+from zion_auth.protocols import DatabaseAdapterProtocol
+from zion_auth.providers import (
+    OPTIONAL_SLOTS,
+    SLOTS,
+    compile_providers,
+    get_provider,
+    refresh_providers,
+    register_providers,
+    skip,
+)
+from zion_auth.services.password import PasswordService
+from zion_auth.services.token import TokenService
+from zion_utils.registry import Registry
+
+
+@pytest.fixture
+def registry(monkeypatch: pytest.MonkeyPatch):
+    registry = Registry("zion_auth")
+    for name, protocol in SLOTS.items():
+        registry.declare(name, protocol, required=name not in OPTIONAL_SLOTS)
+    monkeypatch.setattr("zion_auth.providers.registry", registry)
+    return registry
+
+
+def test_provider_is_resolved_to_direct_reference(registry):
+    # Given
+    registry.register("password_service", "zion_auth.services.password.PasswordService")
+
+    # When
+    provider = get_provider("password_service")
+
+    # Then
+    assert provider is PasswordService
+    assert registry.refs.password_service is PasswordService
+
+
+def test_compile_reports_every_problem(registry):
+    # Given
+    registry.register("password_service", TokenService)
+    registry.register("token_service", "zion_auth.services.token.Unknown")
+
+    # When / Then
+    with pytest.raises(ImproperlyConfiguredError) as error:
+        compile_providers()
+
+    message = str(error.value)
+    assert "doesn't implement PasswordServiceProtocol" in message
+    assert "zion_auth.services.token.Unknown" in message
+    assert "No provider is registered for `service`" in message
+    # Optional slots without a provider are fine
+    assert "database_session_dep" not in message
+
+
+def test_circular_providers_are_detected(registry):
+    # Given
+    registry.register(
+        "login_bookkeeping", lambda: None, requires=["validation_service"]
+    )
+    registry.register(
+        "validation_service", lambda: None, requires=["login_bookkeeping"]
+    )
+
+    # When / Then
+    with pytest.raises(ImproperlyConfiguredError, match="Circular providers"):
+        get_provider("login_bookkeeping")
+
+
+@pytest.mark.usefixtures("registry")
+def test_login_bookkeeping_set_to_none_is_skipped(monkeypatch: pytest.MonkeyPatch):
+    # Given
+    monkeypatch.setattr("zion_auth.providers.settings.login_bookkeeping", None)
+
+    # When
+    register_providers()
+
+    # Then
+    assert get_provider("login_bookkeeping") is skip
+    assert get_provider("login_bookkeeping")() is None
+
+
+class CustomTokenService(TokenService):
+    pass
+
+
+@pytest.mark.usefixtures("registry")
+def test_changed_settings_register_their_providers_again(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    # Given
+    monkeypatch.setattr("zion_auth.providers._registered", {})
+    register_providers()
+    assert get_provider("token_service") is TokenService
+
+    # When
+    monkeypatch.setattr(
+        "zion_auth.providers.settings.token_service",
+        "tests.test_providers.CustomTokenService",
+    )
+    changed = refresh_providers()
+
+    # Then
+    assert changed == ["token_service"]
+    assert get_provider("token_service") is CustomTokenService
+    assert refresh_providers() == []
+
+
+def test_login_bookkeeping_is_optional_but_checked(registry):
+    # Given
+    registry.register("login_bookkeeping", PasswordService)
+
+    # When / Then
+    with pytest.raises(ImproperlyConfiguredError, match="LoginBookkeepingService"):
+        get_provider("login_bookkeeping")
+    assert "login_bookkeeping" in OPTIONAL_SLOTS
+
+
+@pytest.mark.asyncio
+async def test_adapters_ignore_login_activity_by_default():
+    # Given
+    class Adapter(DatabaseAdapterProtocol):
+        async def get_by_id(self, id):
+            return None
+
+        async def get_by_public_id(self, id):
+            return None
+
+        async def get_by_username(self, username):
+            return None
+
+        async def get_by_email(self, email):
+            return None
+
+        async def get_by_credential(self, credential):
+            return None
+
+    # When / Then
+    assert await Adapter().update_login_activity([]) is None
@@ -0,0 +1,47 @@
+import sys
+
+import pytest
+
+from zion_auth.settings import Settings, settings
+from zion_config import settings as config_settings
+from zion_config.reloading import reload_settings
+
+
+@pytest.fixture
+def config_module(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("ZION_SETTINGS_MODULE", "auth_settings")
+    path = tmp_path / "auth_settings.py"
+    path.write_text("AUTH_ACCESS_TOKEN_EXPIRE_MINUTES = 5\n")
+    config_settings.configure("auth_settings")
+    original = dict(settings.__dict__)
+    yield path
+
+    settings.__dict__.update(original)
+    sys.modules.pop("auth_settings", None)
+
+
+@pytest.mark.usefixtures("config_module")
+def test_settings_are_read_from_zion_config(monkeypatch):
+    # Given
+    monkeypatch.setenv("AUTH_REFRESH_TOKEN_EXPIRE_DAYS", "3")
+
+    # When
+    auth_settings = Settings()
+
+    # Then
+    assert auth_settings.access_token_expire_minutes == 5
+    # The environment still takes precedence
+    assert auth_settings.refresh_token_expire_days == 3
+
+
+def test_settings_follow_zion_config_reload(config_module):
+    # Given
+    config_module.write_text("AUTH_ACCESS_TOKEN_EXPIRE_MINUTES = 15\n")
+
+    # When
+    reload_settings()
+
+    # Then
+    assert settings.access_token_expire_minutes == 15
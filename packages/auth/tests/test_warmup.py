@@ -0,0 +1,42 @@
+import pytest
+
+from zion_auth import warmup
+from zion_auth.services.validation import ValidationService
+from zion_utils.warmup import warm_up
+
+
+@pytest.mark.asyncio
+async def test_warm_up_runs_auth_steps(monkeypatch: pytest.MonkeyPatch):
+    # Given
+    monkeypatch.setattr(ValidationService, "_user_validators", None)
+    steps = {
+        "zion_auth.validators": warmup.load_validators,
+        "zion_auth.tokens": warmup.prime_tokens,
+    }
+    monkeypatch.setattr("zion_utils.warmup._steps", steps)
+
+    # When
+    results = await warm_up(entry_points=False)
+
+    # Then
+    assert [result.name for result in results] == list(steps)
+    assert all(result.ok for result in results)
+    assert ValidationService._user_validators is not None
+
+
+@pytest.mark.asyncio
+async def test_warm_up_reports_failing_step(monkeypatch: pytest.MonkeyPatch):
+    # Given
+    def broken_step():
+        raise RuntimeError("broken")
+
+    monkeypatch.setattr("zion_utils.warmup._steps", {"broken": broken_step})
+
+    # When
+    results = await warm_up(entry_points=False, raise_errors=False)
+
+    # Then
+    assert not results[0].ok
+    assert isinstance(results[0].error, RuntimeError)
+    with pytest.raises(ExceptionGroup):
+        await warm_up(entry_points=False)
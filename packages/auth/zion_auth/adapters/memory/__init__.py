@@ -0,0 +1,9 @@
+from .adapter import InMemoryAdapter, InMemoryUserStore, default_store, get_store
+
+
+__all__ = [
+    "InMemoryAdapter",
+    "InMemoryUserStore",
+    "default_store",
+    "get_store",
+]
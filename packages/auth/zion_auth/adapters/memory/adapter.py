@@ -0,0 +1,184 @@
+import asyncio
+import random
+from collections.abc import Iterable, Sequence
+from typing import Annotated
+
+from fastapi import Depends
+
+from zion_auth.models import LoginActivity, User
+from zion_auth.protocols.database_adapter import DatabaseAdapterProtocol
+
+
+class InMemoryUserStore:
+    """Hash indexed user storage for the in-memory adapter.
+
+    Every lookup the adapter supports is a single dict access. The optional
+    latency and jitter are applied on each adapter call to simulate a database
+    round trip; the jitter is drawn from a seeded random generator so the
+    benchmark runs are reproducible.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int | None = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self._random = random.Random(seed)
+
+        self._by_id: dict[int, User] = {}
+        self._id_by_pid: dict[str, int] = {}
+        self._id_by_email: dict[str, int] = {}
+        self._id_by_username: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def add(self, user: User) -> None:
+        """Insert the user or replace the one with the same id."""
+        self._check_unique(self._id_by_pid, user.pid, user.id, "pid")
+        self._check_unique(self._id_by_email, user.email, user.id, "email")
+        self._check_unique(self._id_by_username, user.username, user.id, "username")
+
+        self.remove(user.id)
+
+        self._by_id[user.id] = user
+        self._id_by_pid[user.pid] = user.id
+        if user.email is not None:
+            self._id_by_email[user.email] = user.id
+        if user.username is not None:
+            self._id_by_username[user.username] = user.id
+
+    def seed(self, users: Iterable[User]) -> int:
+        """Bulk insert the users and return how many were added."""
+        count = 0
+        for user in users:
+            self.add(user)
+            count += 1
+        return count
+
+    def remove(self, id: int) -> User | None:
+        user = self._by_id.pop(id, None)
+        if user is None:
+            return None
+
+        self._id_by_pid.pop(user.pid, None)
+        if user.email is not None:
+            self._id_by_email.pop(user.email, None)
+        if user.username is not None:
+            self._id_by_username.pop(user.username, None)
+        return user
+
+    def clear(self) -> None:
+        self._by_id.clear()
+        self._id_by_pid.clear()
+        self._id_by_email.clear()
+        self._id_by_username.clear()
+
+    def get(self, id: int) -> User | None:
+        return self._by_id.get(id)
+
+    def get_by_pid(self, pid: str) -> User | None:
+        return self._get_indexed(self._id_by_pid, pid)
+
+    def get_by_email(self, email: str) -> User | None:
+        return self._get_indexed(self._id_by_email, email)
+
+    def get_by_username(self, username: str) -> User | None:
+        return self._get_indexed(self._id_by_username, username)
+
+    async def wait(self) -> None:
+        """Sleep for the configured latency, if any."""
+        if not self.latency and not self.jitter:
+            return
+
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(-self.jitter, self.jitter)
+        await asyncio.sleep(max(delay, 0.0))
+
+    def _get_indexed(self, index: dict[str, int], key: str) -> User | None:
+        id = index.get(key)
+        if id is None:
+            return None
+        return self._by_id.get(id)
+
+    @staticmethod
+    def _check_unique(index: dict[str, int], key: str | None, id: int, field: str):
+        if key is None:
+            return
+
+        existing_id = index.get(key)
+        if existing_id is not None and existing_id != id:
+            raise ValueError(
+                f"A user with the same {field} already exists: {key} (id={existing_id})"
+            )
+
+
+default_store = InMemoryUserStore()
+
+
+def get_store() -> InMemoryUserStore:
+    return default_store
+
+
+StoreDep = Annotated[InMemoryUserStore, Depends(get_store)]
+
+
+class InMemoryAdapter(DatabaseAdapterProtocol):
+    """Database adapter backed by an `InMemoryUserStore`.
+
+    When used as the `database_adapter` setting, every request shares the
+    module level `default_store`. Benchmarks and tests can create their own
+    store and pass it directly.
+    """
+
+    def __init__(self, store: StoreDep):
+        self.store = store
+
+    async def get_by_id(self, id: int) -> User | None:
+        await self.store.wait()
+        return self.store.get(id)
+
+    async def get_by_public_id(self, id: str) -> User | None:
+        await self.store.wait()
+        return self.store.get_by_pid(id)
+
+    async def get_by_username(self, username: str) -> User | None:
+        await self.store.wait()
+        return self.store.get_by_username(username)
+
+    async def get_by_email(self, email: str) -> User | None:
+        await self.store.wait()
+        return self.store.get_by_email(email)
+
+    async def get_by_credential(self, credential: str) -> User | None:
+        await self.store.wait()
+        return self.store.get_by_email(credential) or self.store.get_by_username(
+            credential
+        )
+
+    async def update_login_activity(self, activities: Sequence[LoginActivity]) -> None:
+        await self.store.wait()
+        for activity in activities:
+            user = self.store.get(activity.user_id)
+            if user is None:
+                continue
+
+            failed_login_attempts = activity.failed_attempts
+            if not activity.reset_failed_attempts:
+                failed_login_attempts += user.failed_login_attempts
+
+            self.store.add(
+                user.model_copy(
+                    update={
+                        "last_login_at": activity.last_login_at or user.last_login_at,
+                        "failed_login_attempts": failed_login_attempts,
+                    }
+                )
+            )
+
+
+__all__ = ["InMemoryAdapter", "InMemoryUserStore", "default_store", "get_store"]
@@ -1,14 +1,17 @@
+from collections.abc import Awaitable, Callable, Sequence
 from typing import Annotated
 
 from fastapi import Depends
 
-from sqlalchemy import or_
+from sqlalchemy import Boolean, DateTime, Integer, bindparam, case, func, or_, update
 from sqlalchemy.exc import NoResultFound, SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from zion_auth.models import User
+from zion_auth.exceptions import ImproperlyConfiguredError
+from zion_auth.models import LoginActivity, User
 from zion_auth.protocols.database_adapter import DatabaseAdapterProtocol
-from zion_auth.utils import import_dependency
+from zion_auth.providers import get_provider, registry
+from zion_auth.settings import settings
 from zion_logger import get_logger
 
 from .models import UserSqlModel
@@ -17,24 +20,32 @@ from .models import UserSqlModel
 logger = get_logger(__name__)
 
 
-SessionDep = Annotated[
-    AsyncSession,
-    Depends(
-        import_dependency(
-            "database_session_dep",
-            no_setting_error="`database_session_dep` value must be provided when using with sqlalchemy adapter.",
-        )
-    ),
-]
+if "database_session_dep" not in registry:
+    raise ImproperlyConfiguredError(
+        "`database_session_dep` value must be provided when using with sqlalchemy adapter."
+    )
+
+session_dependency = get_provider("database_session_dep")
+# Replica reads are opt-in, whatever the installed packages provide
+read_session_dependency = (
+    get_provider("database_read_session_dep")
+    if settings.database_read_session_dep
+    else session_dependency
+)
+
+SessionDep = Annotated[AsyncSession, Depends(session_dependency)]
+ReadSessionDep = Annotated[AsyncSession, Depends(read_session_dependency)]
 
 
 class SqlAlchemyAdapter(DatabaseAdapterProtocol):
-    def __init__(self, session: SessionDep):
+    def __init__(self, session: SessionDep, read_session: ReadSessionDep):
         self.session = session
+        # The same session unless `database_read_session_dep` is set
+        self.read_session = read_session
 
     async def get_by_username(self, username: str) -> User | None:
         try:
-            user = await self.session.get_one(
+            user = await self.read_session.get_one(
                 UserSqlModel, UserSqlModel.username == username
             )
             return self._convert_user_model(user)
@@ -50,7 +61,9 @@ class SqlAlchemyAdapter(DatabaseAdapterProtocol):
 
     async def get_by_email(self, email: str) -> User | None:
         try:
-            user = await self.session.get_one(UserSqlModel, UserSqlModel.email == email)
+            user = await self.read_session.get_one(
+                UserSqlModel, UserSqlModel.email == email
+            )
             return self._convert_user_model(user)
         except NoResultFound:
             return None
@@ -64,7 +77,7 @@ class SqlAlchemyAdapter(DatabaseAdapterProtocol):
 
     async def get_by_id(self, id: int) -> User | None:
         try:
-            user = await self.session.get(UserSqlModel, id)
+            user = await self.read_session.get(UserSqlModel, id)
             if user:
                 return self._convert_user_model(user)
             else:
@@ -79,7 +92,7 @@ class SqlAlchemyAdapter(DatabaseAdapterProtocol):
 
     async def get_by_public_id(self, id: str) -> User | None:
         try:
-            user = await self.session.get_one(UserSqlModel, UserSqlModel.pid == id)
+            user = await self.read_session.get_one(UserSqlModel, UserSqlModel.pid == id)
             return self._convert_user_model(user)
         except SQLAlchemyError as error:
             await logger.aerror(
@@ -91,7 +104,7 @@ class SqlAlchemyAdapter(DatabaseAdapterProtocol):
 
     async def get_by_credential(self, credential: str) -> User | None:
         try:
-            user = await self.session.get_one(
+            user = await self.read_session.get_one(
                 UserSqlModel,
                 or_(
                     UserSqlModel.email == credential,
@@ -109,5 +122,60 @@ class SqlAlchemyAdapter(DatabaseAdapterProtocol):
             )
             raise
 
+    async def update_login_activity(self, activities: Sequence[LoginActivity]) -> None:
+        if not activities:
+            return
+
+        table = UserSqlModel.__table__
+        # A single executemany statement for the whole batch. Failed attempts
+        # are added to the stored counter unless the batch resets it.
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values(
+                last_login_at=func.coalesce(
+                    bindparam("b_last_login_at", type_=DateTime(timezone=True)),
+                    table.c.last_login_at,
+                ),
+                failed_login_attempts=case(
+                    (bindparam("b_reset", type_=Boolean), 0),
+                    else_=table.c.failed_login_attempts,
+                )
+                + bindparam("b_failed", type_=Integer),
+            )
+        )
+        params = [
+            {
+                "b_id": activity.user_id,
+                "b_last_login_at": activity.last_login_at,
+                "b_reset": activity.reset_failed_attempts,
+                "b_failed": activity.failed_attempts,
+            }
+            for activity in activities
+        ]
+
+        try:
+            await self.session.execute(statement, params)
+        except SQLAlchemyError as error:
+            await logger.aerror(
+                "Database error on SqlAlchemyAdapter::update_login_activity()",
+                count=len(activities),
+                error=str(error),
+            )
+            raise
+
+    @classmethod
+    def login_activity_writer(
+        cls, session_factory: async_sessionmaker[AsyncSession]
+    ) -> Callable[[Sequence[LoginActivity]], Awaitable[None]]:
+        """Writer for `LoginBookkeepingService` using its own sessions."""
+
+        async def writer(activities: Sequence[LoginActivity]) -> None:
+            async with session_factory() as session:
+                await cls(session).update_login_activity(activities)
+                await session.commit()
+
+        return writer
+
     def _convert_user_model(self, sql_model: UserSqlModel) -> User:
         return User.model_validate(UserSqlModel)
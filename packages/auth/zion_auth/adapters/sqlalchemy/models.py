@@ -3,7 +3,7 @@ import datetime as dt
 from ulid import ULID
 from zion_auth.settings import settings
 
-from sqlalchemy import Boolean, DateTime, String
+from sqlalchemy import Boolean, DateTime, Integer, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, MappedAsDataclass, mapped_column
 
 
@@ -37,6 +37,18 @@ class UserSqlModel(_get_base()):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
     is_email_verified: Mapped[bool] = mapped_column(Boolean, default=False)
 
+    # Login bookkeeping
+    last_login_at: Mapped[dt.datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        default=None,
+        init=False,
+    )
+    failed_login_attempts: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        init=False,
+    )
+
     # Soft deletion
     deleted_at: Mapped[dt.datetime | None] = mapped_column(
         DateTime(timezone=True),
@@ -1,3 +1,10 @@
+"""FastAPI dependencies of Zion Auth.
+
+The dependencies are built, and their providers resolved, the first time
+each one is imported from this module, not when the module itself is
+imported. See `zion_auth.providers`.
+"""
+
 from typing import Annotated
 
 from fastapi import Depends
@@ -6,48 +13,69 @@ from fastapi.security import OAuth2PasswordBearer
 from zion_auth.models import User
 from zion_auth.protocols import (
     DatabaseAdapterProtocol,
+    LoginBookkeepingServiceProtocol,
     PasswordServiceProtocol,
     TokenServiceProtocol,
     ValidationServiceProtocol,
     ZionAuthServiceProtocol,
 )
+from zion_auth.providers import get_provider
 from zion_auth.settings import settings
-from zion_auth.utils import import_dependency
+from zion_utils.lazy import LazyAttributes
 
 
-DatabaseAdapterDep = Annotated[
-    DatabaseAdapterProtocol,
-    Depends(import_dependency("database_adapter")),
-]
+def _setting_dependency(protocol, setting_name: str):
+    return lambda: Annotated[protocol, Depends(get_provider(setting_name))]
 
-PasswordServiceDep = Annotated[
-    PasswordServiceProtocol,
-    Depends(import_dependency("password_service")),
-]
 
-TokenServiceDep = Annotated[
-    TokenServiceProtocol,
-    Depends(import_dependency("token_service")),
-]
+def _token_dependency():
+    return Annotated[
+        str,
+        Depends(OAuth2PasswordBearer(tokenUrl=settings.oauth2_scheme_token_url)),
+    ]
 
-ValidationServiceDep = Annotated[
-    ValidationServiceProtocol,
-    Depends(import_dependency("validation_service")),
-]
 
-ZionAuthDep = Annotated[
-    ZionAuthServiceProtocol,
-    Depends(import_dependency("service")),
-]
+def _get_current_user():
+    zion_auth_dep = _lazy.getattr("ZionAuthDep")
+    token_dep = _lazy.getattr("TokenDep")
 
-TokenDep = Annotated[
-    str,
-    Depends(OAuth2PasswordBearer(tokenUrl=settings.oauth2_scheme_token_url)),
-]
+    async def get_current_user(zion_auth: zion_auth_dep, token: token_dep) -> User:
+        return await zion_auth.get_current_user(token)
+
+    return get_current_user
+
+
+def _current_user_dependency():
+    return Annotated[User, Depends(_lazy.getattr("get_current_user"))]
+
+
+_lazy = LazyAttributes(
+    __name__,
+    {
+        "DatabaseAdapterDep": _setting_dependency(
+            DatabaseAdapterProtocol, "database_adapter"
+        ),
+        "PasswordServiceDep": _setting_dependency(
+            PasswordServiceProtocol, "password_service"
+        ),
+        "TokenServiceDep": _setting_dependency(TokenServiceProtocol, "token_service"),
+        "ValidationServiceDep": _setting_dependency(
+            ValidationServiceProtocol, "validation_service"
+        ),
+        "LoginBookkeepingDep": _setting_dependency(
+            LoginBookkeepingServiceProtocol | None, "login_bookkeeping"
+        ),
+        "ZionAuthDep": _setting_dependency(ZionAuthServiceProtocol, "service"),
+        "TokenDep": _token_dependency,
+        "get_current_user": _get_current_user,
+        "CurrentUserDep": _current_user_dependency,
+    },
+)
 
 
-async def get_current_user(zion_auth: ZionAuthDep, token: TokenDep) -> User:
-    return await zion_auth.get_current_user(token)
+def __getattr__(name: str):
+    return _lazy.getattr(name)
 
 
-CurrentUserDep = Annotated[User, Depends(get_current_user)]
+def __dir__():
+    return _lazy.dir()
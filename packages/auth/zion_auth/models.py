@@ -14,6 +14,8 @@ class User(BaseModel):
     is_active: bool = True
     is_email_verified: bool = False
     is_deleted: bool = False
+    last_login_at: dt.datetime | None = None
+    failed_login_attempts: int = 0
     deleted_at: dt.datetime | None = None
     created_at: dt.datetime = Field(default_factory=lambda: dt.datetime.now(dt.UTC))
     updated_at: dt.datetime = Field(default_factory=lambda: dt.datetime.now(dt.UTC))
@@ -21,3 +23,27 @@ class User(BaseModel):
 
 class TokenData(BaseModel):
     public_id: str
+
+
+class LoginActivity(BaseModel):
+    """Pending login bookkeeping for a single user.
+
+    When `reset_failed_attempts` is set, the stored counter is replaced with
+    `failed_attempts`. Otherwise `failed_attempts` is added to it.
+    """
+
+    user_id: int
+    last_login_at: dt.datetime | None = None
+    failed_attempts: int = 0
+    reset_failed_attempts: bool = False
+
+    def merge(self, newer: "LoginActivity") -> None:
+        """Fold a later activity of the same user into this one."""
+        if newer.reset_failed_attempts:
+            self.reset_failed_attempts = True
+            self.failed_attempts = newer.failed_attempts
+        else:
+            self.failed_attempts += newer.failed_attempts
+
+        if newer.last_login_at is not None:
+            self.last_login_at = newer.last_login_at
@@ -1,3 +1,4 @@
+from .bookkeeping import LoginBookkeepingServiceProtocol
 from .database_adapter import DatabaseAdapterProtocol
 from .password import PasswordServiceProtocol
 from .token import TokenServiceProtocol
@@ -7,6 +8,7 @@ from .zion_auth import ZionAuthServiceProtocol
 
 __all__ = [
     "DatabaseAdapterProtocol",
+    "LoginBookkeepingServiceProtocol",
     "PasswordServiceProtocol",
     "TokenServiceProtocol",
     "ValidationServiceProtocol",
@@ -0,0 +1,11 @@
+from abc import ABCMeta, abstractmethod
+
+
+class LoginBookkeepingServiceProtocol(metaclass=ABCMeta):
+    @abstractmethod
+    async def record_success(self, user_id: int) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def record_failure(self, user_id: int) -> None:
+        raise NotImplementedError()
@@ -1,6 +1,7 @@
 from abc import ABCMeta, abstractmethod
+from collections.abc import Sequence
 
-from zion_auth.models import User
+from zion_auth.models import LoginActivity, User
 
 
 class DatabaseAdapterProtocol(metaclass=ABCMeta):
@@ -24,5 +25,9 @@ class DatabaseAdapterProtocol(metaclass=ABCMeta):
     async def get_by_credential(self, credential: str) -> User | None:
         raise NotImplementedError
 
+    async def update_login_activity(self, activities: Sequence[LoginActivity]) -> None:
+        """Write the login bookkeeping; adapters without it ignore the activity."""
+        return None
+
 
 __all__ = ["DatabaseAdapterProtocol"]
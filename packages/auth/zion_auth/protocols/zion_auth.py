@@ -2,7 +2,6 @@ from abc import ABCMeta, abstractmethod
 
 from fastapi.security import OAuth2PasswordRequestForm
 
-from zion_auth.deps import TokenDep
 from zion_auth.models import User
 
 
@@ -12,5 +11,5 @@ class ZionAuthServiceProtocol(metaclass=ABCMeta):
         raise NotImplementedError()
 
     @abstractmethod
-    async def get_current_user(self, token: TokenDep) -> User:
+    async def get_current_user(self, token: str) -> User:
         raise NotImplementedError()
@@ -0,0 +1,137 @@
+"""The classes and functions behind the Zion Auth dependencies.
+
+Providers come from the `zion_auth.providers` entry points of the installed
+packages, overridden by the settings naming them. `compile_providers()`
+imports and checks all of them at once, instead of on first use; it's the
+`zion_auth.providers` warm-up step, so `warm_up_lifespan` fails the startup
+on a misconfiguration.
+
+When `zion_config` reloads the settings, the providers whose setting changed
+are registered again. Dependencies already built keep their provider.
+"""
+
+from typing import Any
+
+from zion_auth.exceptions import ImproperlyConfiguredError
+from zion_auth.protocols import (
+    DatabaseAdapterProtocol,
+    LoginBookkeepingServiceProtocol,
+    PasswordServiceProtocol,
+    TokenServiceProtocol,
+    ValidationServiceProtocol,
+    ZionAuthServiceProtocol,
+)
+from zion_auth.settings import settings
+from zion_utils import exceptions
+from zion_utils.registry import Registry
+
+
+try:
+    from zion_config.reloading import subscribe
+except ImportError:  # pragma: no cover
+    subscribe = None
+
+
+ENTRY_POINT_GROUP = "zion_auth.providers"
+
+# Provider names, the settings naming them, and their protocols
+SLOTS = {
+    "service": ZionAuthServiceProtocol,
+    "database_adapter": DatabaseAdapterProtocol,
+    "password_service": PasswordServiceProtocol,
+    "token_service": TokenServiceProtocol,
+    "validation_service": ValidationServiceProtocol,
+    "login_bookkeeping": LoginBookkeepingServiceProtocol,
+    "database_session_dep": None,
+    "database_read_session_dep": None,
+}
+# Only needed by the SqlAlchemy adapter, and by the login bookkeeping
+OPTIONAL_SLOTS = (
+    "database_session_dep",
+    "database_read_session_dep",
+    "login_bookkeeping",
+)
+# Setting these to `None` turns the feature off
+SKIPPABLE_SLOTS = ("login_bookkeeping",)
+
+registry = Registry("zion_auth")
+for _name, _protocol in SLOTS.items():
+    registry.declare(_name, _protocol, required=_name not in OPTIONAL_SLOTS)
+
+
+def skip() -> None:
+    """Provider of the skippable dependencies set to `None` in the settings."""
+    return None
+
+
+# Providers registered from the settings, to spot the changed ones on reload
+_registered: dict[str, Any] = {}
+
+
+def _settings_providers() -> dict[str, Any]:
+    providers = {}
+    for name in SLOTS:
+        target = getattr(settings, name, None)
+        if target:
+            providers[name] = target
+        elif target is None and name in SKIPPABLE_SLOTS:
+            providers[name] = skip
+    return providers
+
+
+def register_providers() -> None:
+    """Register the entry points, then the providers named in the settings."""
+    registry.register_entry_points(ENTRY_POINT_GROUP)
+    for name, target in _settings_providers().items():
+        registry.register(name, target)
+        _registered[name] = target
+
+
+def refresh_providers(_changes: dict[str, Any] | None = None) -> list[str]:
+    """Register the providers whose setting changed, and resolve them.
+
+    Runs after every `zion_config` reload, following `reload_settings()` of
+    `zion_auth.settings`. Returns the names of the registered providers.
+    """
+    changed = {
+        name: target
+        for name, target in _settings_providers().items()
+        if _registered.get(name) != target
+    }
+    for name, target in changed.items():
+        registry.register(name, target)
+        _registered[name] = target
+    for name in changed:
+        get_provider(name)
+    return list(changed)
+
+
+def get_provider(name: str) -> Any:
+    try:
+        return registry.get(name)
+    except exceptions.ImproperlyConfiguredError as error:
+        raise ImproperlyConfiguredError(f"settings::{name}: {error}") from error
+
+
+def compile_providers() -> None:
+    """Import and check every provider, failing on any misconfiguration."""
+    try:
+        registry.compile()
+    except exceptions.ImproperlyConfiguredError as error:
+        raise ImproperlyConfiguredError(str(error)) from error
+
+
+register_providers()
+
+if subscribe is not None:
+    subscribe(refresh_providers)
+
+
+__all__ = [
+    "compile_providers",
+    "get_provider",
+    "refresh_providers",
+    "register_providers",
+    "registry",
+    "skip",
+]
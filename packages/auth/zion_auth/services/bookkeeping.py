@@ -0,0 +1,166 @@
+import asyncio
+import datetime as dt
+from collections.abc import Awaitable, Callable, Sequence
+
+from zion_auth.models import LoginActivity
+from zion_auth.protocols import LoginBookkeepingServiceProtocol
+from zion_auth.settings import settings
+from zion_logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+LoginActivityWriter = Callable[[Sequence[LoginActivity]], Awaitable[None]]
+
+
+class LoginBookkeepingService(LoginBookkeepingServiceProtocol):
+    """Write-behind queue for the login bookkeeping columns.
+
+    Recording a login only updates an in-memory map keyed by the user id, so
+    the login request itself never writes to the database. Updates of the same
+    user are coalesced, and a background task hands them to the `writer` in
+    batches when the flush interval passes or the batch size is reached.
+
+    The service must be started inside the application lifespan, and stopping
+    it flushes everything that is still pending:
+
+    ```python
+    bookkeeping = LoginBookkeepingService(writer)
+    async with bookkeeping:
+        set_login_bookkeeping(bookkeeping)
+        yield
+    ```
+    """
+
+    def __init__(
+        self,
+        writer: LoginActivityWriter,
+        flush_interval: float | None = None,
+        batch_size: int | None = None,
+    ):
+        self.writer = writer
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else settings.login_bookkeeping_flush_interval
+        )
+        self.batch_size = batch_size or settings.login_bookkeeping_batch_size
+
+        self._pending: dict[int, LoginActivity] = {}
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+    async def __aenter__(self) -> "LoginBookkeepingService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def record_success(self, user_id: int) -> None:
+        self._record(
+            LoginActivity(
+                user_id=user_id,
+                last_login_at=dt.datetime.now(dt.UTC),
+                reset_failed_attempts=True,
+            )
+        )
+
+    async def record_failure(self, user_id: int) -> None:
+        self._record(LoginActivity(user_id=user_id, failed_attempts=1))
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+
+        self._closing = False
+        self._task = asyncio.create_task(self._run(), name="zion-auth-bookkeeping")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._closing = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+        # Anything recorded while the last flush was running
+        await self.flush()
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self._pending:
+                return
+
+            pending = self._pending
+            self._pending = {}
+            activities = list(pending.values())
+
+            for start in range(0, len(activities), self.batch_size):
+                batch = activities[start : start + self.batch_size]
+                try:
+                    await self.writer(batch)
+                except Exception as e:
+                    await logger.aerror(
+                        "Could not write login bookkeeping, will retry",
+                        count=len(activities) - start,
+                        error=str(e),
+                    )
+                    self._requeue(activities[start:])
+                    return
+
+    def _record(self, activity: LoginActivity) -> None:
+        existing = self._pending.get(activity.user_id)
+        if existing is None:
+            self._pending[activity.user_id] = activity
+        else:
+            existing.merge(activity)
+
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    def _requeue(self, activities: Sequence[LoginActivity]) -> None:
+        """Put failed activities back, in front of the newer ones."""
+        newer = self._pending
+        self._pending = {activity.user_id: activity for activity in activities}
+        for activity in newer.values():
+            self._record(activity)
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except TimeoutError:
+                pass
+
+            self._wakeup.clear()
+            await self.flush()
+
+
+_login_bookkeeping: LoginBookkeepingServiceProtocol | None = None
+
+
+def set_login_bookkeeping(service: LoginBookkeepingServiceProtocol | None) -> None:
+    global _login_bookkeeping
+    _login_bookkeeping = service
+
+
+def get_login_bookkeeping() -> LoginBookkeepingServiceProtocol | None:
+    """Dependency returning the running bookkeeping service, if there is one."""
+    return _login_bookkeeping
+
+
+__all__ = [
+    "LoginActivityWriter",
+    "LoginBookkeepingService",
+    "get_login_bookkeeping",
+    "set_login_bookkeeping",
+]
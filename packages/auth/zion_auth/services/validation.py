@@ -1,6 +1,5 @@
 import inspect
 from collections.abc import Awaitable, Callable
-from functools import cached_property
 
 from zion_auth.exceptions import ValidationError
 from zion_auth.models import User
@@ -9,15 +8,28 @@ from zion_auth.settings import settings
 from zion_utils.module_loading import import_string
 
 
+UserValidator = Callable[[User], Awaitable[bool] | bool]
+
+
 class ValidationService(ValidationServiceProtocol):
-    _user_validators: list[Callable[[User], Awaitable[bool] | bool]] = []
+    # `(validator, is_coroutine_function)` pairs of `settings.user_validators`
+    _user_validators: tuple[tuple[UserValidator, bool], ...] | None = None
+
+    @classmethod
+    def load_user_validators(cls) -> tuple[tuple[UserValidator, bool], ...]:
+        """Import the validators once; the warm-up does it before any request."""
+        if cls._user_validators is None:
+            validators = (import_string(path) for path in settings.user_validators)
+            cls._user_validators = tuple(
+                (validator, inspect.iscoroutinefunction(validator))
+                for validator in validators
+            )
+        return cls._user_validators
 
     async def is_user_valid(self, user: User) -> bool:
-        self._load_user_validators()
-
         try:
-            for validator in self._user_validators:
-                if inspect.iscoroutinefunction(validator):
+            for validator, is_coroutine_function in self.load_user_validators():
+                if is_coroutine_function:
                     is_valid = await validator(user)
                 else:
                     is_valid = validator(user)
@@ -28,11 +40,3 @@ class ValidationService(ValidationServiceProtocol):
             raise ValidationError(str(e)) from e
 
         return True
-
-    @cached_property
-    def _load_user_validators(self):
-        if not self._user_validators:
-            return
-
-        for validator in settings.user_validators:
-            self._user_validators.append(import_string(validator))
@@ -3,6 +3,7 @@ from fastapi.security import OAuth2PasswordRequestForm
 
 from zion_auth.deps import (
     DatabaseAdapterDep,
+    LoginBookkeepingDep,
     PasswordServiceDep,
     TokenDep,
     TokenServiceDep,
@@ -28,11 +29,13 @@ class ZionAuthService(ZionAuthServiceProtocol):
         password_service: PasswordServiceDep,
         token_service: TokenServiceDep,
         validation_service: ValidationServiceDep,
+        bookkeeping: LoginBookkeepingDep,
     ):
         self.database = database
         self.password_service = password_service
         self.token_service = token_service
         self.validation_service = validation_service
+        self.bookkeeping = bookkeeping
 
     async def login(self, data: OAuth2PasswordRequestForm):
         credential = data.username
@@ -57,6 +60,8 @@ class ZionAuthService(ZionAuthServiceProtocol):
                 data.password, user.hashed_password
             )
             if not is_password_valid:
+                if self.bookkeeping:
+                    await self.bookkeeping.record_failure(user.id)
                 return None
 
             # Validate user
@@ -64,6 +69,9 @@ class ZionAuthService(ZionAuthServiceProtocol):
             if not is_user_valid:
                 return None
 
+            if self.bookkeeping:
+                await self.bookkeeping.record_success(user.id)
+
             return user
         except ValidationError:
             return None
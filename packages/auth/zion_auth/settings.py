@@ -1,12 +1,55 @@
-from typing import Annotated
+import os
+from enum import Enum
+from typing import Annotated, Any
 
 from annotated_doc import Doc
-from pydantic import Field, SecretStr
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, SecretStr, ValidationError
+from pydantic.fields import FieldInfo
+from pydantic_settings import (
+    BaseSettings,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
 
 from zion_auth.enums import CredentialType
 
 
+try:
+    from zion_config import settings as config_settings
+    from zion_config.reloading import subscribe
+    from zion_config.snapshot import load_section, register_section
+except ImportError:  # pragma: no cover
+    config_settings = subscribe = load_section = register_section = None
+
+SNAPSHOT_SECTION = "zion_auth"
+
+_MISSING = object()
+
+
+class ZionConfigSettingsSource(PydanticBaseSettingsSource):
+    """`AUTH_*` values of the zion_config settings module, when there's one.
+
+    They override the defaults, and are overridden by the environment.
+    """
+
+    def get_field_value(
+        self, field: FieldInfo, field_name: str
+    ) -> tuple[Any, str, bool]:
+        value = getattr(config_settings, f"AUTH_{field_name.upper()}", _MISSING)
+        return value, field_name, False
+
+    def __call__(self) -> dict[str, Any]:
+        if config_settings is None or not os.environ.get("ZION_SETTINGS_MODULE"):
+            return {}
+
+        data = {}
+        for field_name, field in self.settings_cls.model_fields.items():
+            value, key, _ = self.get_field_value(field, field_name)
+            if value is not _MISSING:
+                data[key] = value
+        return data
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_ignore_empty=True,
@@ -14,6 +57,23 @@ class Settings(BaseSettings):
         env_prefix="auth_",
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        return (
+            init_settings,
+            env_settings,
+            dotenv_settings,
+            file_secret_settings,
+            ZionConfigSettingsSource(settings_cls),
+        )
+
     service: Annotated[
         str,
         Doc(
@@ -74,6 +134,7 @@ class Settings(BaseSettings):
 
             Zion provides following adapters:
             - SqlAlchemy: `zion_auth.adapters.sqlalchemy.SqlAlchemyAdapter`
+            - In-memory (tests, benchmarks): `zion_auth.adapters.memory.InMemoryAdapter`
             """
         ),
     ] = "zion_auth.adapters.sqlalchemy.SqlAlchemyAdapter"
@@ -85,7 +146,23 @@ class Settings(BaseSettings):
             Database session dependency
 
             SqlAlchemy requires the AsyncSession to make the necessary operations.
-            This setting is required if SqlAlchemy adapter is being used.
+            This setting is required if SqlAlchemy adapter is being used, unless
+            an installed package provides it through the `zion_auth.providers`
+            entry points, like zion_db does.
+            """
+        ),
+    ] = None
+
+    database_read_session_dep: Annotated[
+        str | None,
+        Doc(
+            """
+            Database read session dependency
+
+            Optional session dependency the SqlAlchemy adapter uses for the
+            `get_by_*` lookups, so they can be served by read replicas. With
+            zion_db, set it to `zion_db.engine.async_get_read_db`. Defaults to
+            `database_session_dep`.
             """
         ),
     ] = None
@@ -166,6 +243,40 @@ class Settings(BaseSettings):
         Doc("The token url for the OAuth2PasswordBearer."),
     ] = "/api/v1/auth/login"
 
+    ##
+    # Login Bookkeeping
+    login_bookkeeping: Annotated[
+        str | None,
+        Doc(
+            """
+            Login Bookkeeping Dependency
+
+            The dependency that returns the running service extending
+            `zion_auth.protocols.LoginBookkeepingServiceProtocol`, or `None` to
+            skip recording `last_login_at` and failed login attempts.
+
+            The default dependency returns the service registered with
+            `zion_auth.services.bookkeeping.set_login_bookkeeping()`.
+            """
+        ),
+    ] = "zion_auth.services.bookkeeping.get_login_bookkeeping"
+
+    login_bookkeeping_flush_interval: Annotated[
+        float,
+        Doc("Seconds between the background flushes of the login bookkeeping."),
+    ] = 1.0
+
+    login_bookkeeping_batch_size: Annotated[
+        int,
+        Doc(
+            """
+            Maximum number of users written in a single bookkeeping `UPDATE`.
+
+            Reaching this many pending users also triggers an early flush.
+            """
+        ),
+    ] = 500
+
     ##
     # Validation Service
     validation_service: Annotated[
@@ -197,4 +308,51 @@ class Settings(BaseSettings):
     ] = ["zion_auth.validators.user.is_active"]
 
 
-settings = Settings()
+def dump_settings(settings: Settings) -> dict[str, Any]:
+    """Settings as plain values, with the secrets revealed, for the snapshot."""
+    data = settings.model_dump()
+    for name, value in data.items():
+        if isinstance(value, SecretStr):
+            data[name] = value.get_secret_value()
+        elif isinstance(value, Enum):
+            data[name] = value.value
+    return data
+
+
+def load_settings() -> Settings:
+    """Settings from the zion_config settings snapshot, if there's a fresh one.
+
+    Validating the stored values skips reading the environment. Without
+    zion_config, or a usable snapshot, the settings are read as usual.
+    """
+    if load_section is not None:
+        data = load_section(SNAPSHOT_SECTION)
+        if data is not None:
+            try:
+                return Settings.model_validate(data)
+            except ValidationError:
+                pass
+    return Settings()
+
+
+def reload_settings(_changes: dict[str, Any] | None = None) -> None:
+    """Resolve the settings again, updating `settings` in place.
+
+    Runs after every `zion_config` reload, so values read on use, like the
+    token expiries, follow the settings module and the snapshot. Changed
+    dependency paths are registered again by
+    `zion_auth.providers.refresh_providers()`.
+    """
+    new_settings = load_settings()
+    if new_settings != settings:
+        # A single update, so readers see either the old or the new values
+        settings.__dict__.update(new_settings.__dict__)
+
+
+settings = load_settings()
+
+if register_section is not None:
+    register_section(
+        SNAPSHOT_SECTION, lambda: dump_settings(settings), env_prefixes=("AUTH_",)
+    )
+    subscribe(reload_settings)
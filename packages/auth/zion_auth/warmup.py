@@ -0,0 +1,31 @@
+"""Warm-up steps of Zion Auth, registered as `zion.warmup` entry points.
+
+See `zion_utils.warmup`.
+"""
+
+from zion_auth.enums import TokenType
+from zion_auth.providers import get_provider
+
+
+def load_validators() -> None:
+    """Import the user validators of the validation service."""
+    load_user_validators = getattr(
+        get_provider("validation_service"), "load_user_validators", None
+    )
+    if load_user_validators is not None:
+        load_user_validators()
+
+
+async def prime_tokens() -> None:
+    """Create and verify a token, initializing the JWT backend."""
+    token_service = get_provider("token_service")()
+    token = await token_service.create_access_token({"sub": "warm-up"})
+    await token_service.verify(token, TokenType.ACCESS)
+
+
+async def prime_passwords() -> None:
+    """Hash a password, loading the hashing backend."""
+    await get_provider("password_service")().hash("warm-up")
+
+
+__all__ = ["load_validators", "prime_passwords", "prime_tokens"]
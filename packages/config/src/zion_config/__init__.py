@@ -2,14 +2,31 @@ import importlib
 import os
 from typing import TYPE_CHECKING, Any
 
-from .app_conf import AppConf
+from .app_conf import AppConf, resolve_pending
 from .constants import ENVIRONMENT_VARIABLE
 
 
 class _Settings:
+    """Settings read from the module named by `ZION_SETTINGS_MODULE`.
+
+    The module is imported on the first attribute access, not when
+    `zion_config` is imported, and every value is copied into the instance
+    `__dict__` the first time it's read, so later reads are plain attribute
+    lookups.
+
+    With `ZION_SETTINGS_SNAPSHOT` pointing at a fresh snapshot, see
+    `zion_config.snapshot`, the values are read from it instead, and the
+    module is only imported for names the snapshot doesn't have.
+    """
+
     CONFIG_MODULE_NAME: str
 
     def __init__(self):
+        self.__dict__["_module"] = None
+        self.__dict__["_loaded_names"] = set()
+        self.__dict__["_snapshot_names"] = set()
+
+    def _setup(self):
         config_module_name = os.environ.get(ENVIRONMENT_VARIABLE)
         if not config_module_name:
             raise ImportError(
@@ -18,21 +35,95 @@ class _Settings:
                 f"{ENVIRONMENT_VARIABLE}."
             )
 
-        self.configure(config_module_name)
-
-    def configure(self, config_module_name: str):
-        self.CONFIG_MODULE_NAME = config_module_name
-
-        mod = importlib.import_module(self.CONFIG_MODULE_NAME)
-
-        for config_name in dir(mod):
-            if not config_name.isupper():
-                continue
-
-            config_value = getattr(mod, config_name)
-            setattr(self, config_name, config_value)
+        if not self.configured and self._load_snapshot(config_module_name):
+            return
+        self._load(config_module_name)
+
+    def _load_snapshot(self, config_module_name: str) -> bool:
+        from .snapshot import CONFIG_SECTION, load_section
+
+        values = load_section(CONFIG_SECTION)
+        if values is None:
+            return False
+
+        self.__dict__.update(values)
+        self._snapshot_names.update(values)
+        self.__dict__["CONFIG_MODULE_NAME"] = config_module_name
+        return True
+
+    def _load(self, config_module_name: str):
+        module = importlib.import_module(config_module_name)
+
+        if config_module_name != self.__dict__.get("CONFIG_MODULE_NAME"):
+            for name in self._snapshot_names:
+                self.__dict__.pop(name, None)
+            self._snapshot_names.clear()
+
+        # Values cached from a previous module must not leak into this one
+        for name in self._loaded_names:
+            self.__dict__.pop(name, None)
+        self._loaded_names.clear()
+
+        self.__dict__["_module"] = module
+        self.__dict__["CONFIG_MODULE_NAME"] = config_module_name
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names not in `__dict__` yet
+        if not name.isupper():
+            raise AttributeError(name)
+
+        if self._module is None:
+            self._setup()
+            if name in self.__dict__:
+                return self.__dict__[name]
+
+        # An `AppConf` providing the name writes its configured value here
+        if resolve_pending(name) and name in self.__dict__:
+            return self.__dict__[name]
+
+        value = getattr(self._module, name)
+        self.__dict__[name] = value
+        self._loaded_names.add(name)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Explicitly set values survive loading another module
+        self.__dict__[name] = value
+        self._loaded_names.discard(name)
+        self._snapshot_names.discard(name)
+
+    def _forget(self, names: list[str]) -> None:
+        for name in names:
+            if name in self._loaded_names:
+                self.__dict__.pop(name, None)
+                self._loaded_names.discard(name)
+
+    @property
+    def configured(self) -> bool:
+        return "CONFIG_MODULE_NAME" in self.__dict__
+
+    def configure(self, config_module_name: str | None = None, **overrides: Any):
+        """Load the settings now, from `config_module_name` if given.
+
+        Keyword arguments override values of the module, which is handy in
+        tests:
+
+        ```python
+        settings.configure("tests.settings", DEBUG=False)
+        ```
+        """
+        if config_module_name is not None:
+            self._load(config_module_name)
+        elif not self.configured:
+            self._setup()
+
+        for name, value in overrides.items():
+            self.__dict__[name] = value
+            self._loaded_names.add(name)
 
     def __repr__(self):
+        if not self.configured:
+            return f"<{self.__class__.__name__} [unconfigured]>"
         return f'<{self.__class__.__name__} "{self.CONFIG_MODULE_NAME}">'
 
 
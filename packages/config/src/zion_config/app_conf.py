@@ -1,10 +1,21 @@
 import os
+import threading
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from .constants import ENVIRONMENT_VARIABLE
 from .utils import import_attribute
 
 
+# Unresolved `AppConf` classes by the prefixed names they provide
+_pending: dict[str, "AppConfMetaClass"] = {}
+_lock = threading.RLock()
+# `AppConf` classes whose values were written to the settings
+_resolved: "weakref.WeakSet[AppConfMetaClass]" = weakref.WeakSet()
+
+
 class AppConfOptions:
     names: dict[str, str]
 
@@ -12,11 +23,19 @@ class AppConfOptions:
         self.prefix = prefix
         env_settings = os.environ.get(ENVIRONMENT_VARIABLE, None)
         self.holder_path = getattr(meta, "holder", env_settings)
-        self.holder = import_attribute(self.holder_path)
+        self._holder = None
         self.required = getattr(meta, "required", [])
         self.names = {}
         self.defaults = {}
         self.configured_data = {}
+        self.finalized = False
+
+    @property
+    def holder(self):
+        # Imported on first use, so defining an `AppConf` doesn't load it
+        if self._holder is None:
+            self._holder = import_attribute(self.holder_path)
+        return self._holder
 
     def prefixed_name(self, name: str):
         if name.startswith(self.prefix.upper()):
@@ -57,7 +76,6 @@ class AppConfMetaClass(type):
 
             new_class._meta.names.update(parent._meta.names)
             new_class._meta.defaults.update(parent._meta.defaults)
-            new_class._meta.configured_data.update(parent._meta.configured_data)
 
         attr_names = list(attrs.keys())
         config_names = filter(str.isupper, attr_names)
@@ -69,24 +87,77 @@ class AppConfMetaClass(type):
         for name, value in attrs.items():
             setattr(new_class, name, value)
 
-        from zion.config import settings
-
-        new_class._configure()
-        for name, value in new_class._meta.configured_data.items():
-            prefixed_config_name = new_class._meta.prefixed_name(name)
-            setattr(settings, prefixed_config_name, value)
-            setattr(new_class, name, value)
+        new_class._register()
+        return new_class
 
-        for name in new_class._meta.required:
-            prefixed_config_name = new_class._meta.prefixed_name(name)
-            if not hasattr(new_class._meta.holder, prefixed_config_name):
+    def __getattr__(cls, name: str) -> Any:
+        # Only called for names not set on the class yet
+        meta = cls.__dict__.get("_meta")
+        if meta is None or meta.finalized or name not in meta.names:
+            raise AttributeError(name)
+
+        cls.finalize()
+        return getattr(cls, name)
+
+    def _register(cls):
+        from . import settings
+
+        with _lock:
+            prefixed_names = list(cls._meta.names.values())
+            for prefixed_name in prefixed_names:
+                _pending[prefixed_name] = cls
+        # Values read before this class existed must be resolved through it
+        settings._forget(prefixed_names)
+
+    def finalize(cls):
+        """Resolve the settings of this class, or of every pending one on `AppConf`.
+
+        Runs the `configure_*` callbacks and `configure()` once, writes the
+        prefixed values to `settings` and checks the required settings. It
+        otherwise happens on the first access to one of the settings.
+        """
+        if "_meta" not in cls.__dict__:
+            with _lock:
+                pending = list(dict.fromkeys(_pending.values()))
+            for conf_class in pending:
+                conf_class.finalize()
+            return
+
+        from . import settings
+
+        # Held until the values are written, with the class still pending, so
+        # other threads reading one of its settings wait for them. Callbacks
+        # of this thread can enter again.
+        with _lock:
+            if cls._meta.finalized:
+                return
+            cls._meta.finalized = True
+            try:
+                cls._configure()
+                cls._check_required()
+            except BaseException:
+                cls._meta.finalized = False
+                raise
+
+            for name, value in cls._meta.configured_data.items():
+                prefixed_config_name = cls._meta.prefixed_name(name)
+                setattr(settings, prefixed_config_name, value)
+                setattr(cls, name, value)
+            for prefixed_name in cls._meta.names.values():
+                if _pending.get(prefixed_name) is cls:
+                    del _pending[prefixed_name]
+            _resolved.add(cls)
+
+    def _check_required(cls):
+        for name in cls._meta.required:
+            prefixed_config_name = cls._meta.prefixed_name(name)
+            if not hasattr(cls._meta.holder, prefixed_config_name):
                 raise ValueError(
                     f"The required setting {prefixed_config_name} is missing."
                 )
 
-        return new_class
-
     def _configure(cls):
+        cls._meta.configured_data = {}
         conf = cls()
         for name, prefixed_name in conf._meta.names.items():
             default_value = conf._meta.defaults.get(prefixed_name)
@@ -100,6 +171,66 @@ class AppConfMetaClass(type):
         cls._meta.configured_data = conf.configure()
 
 
+def configure_again(classes) -> dict["AppConfMetaClass", dict[str, Any]]:
+    """Data the classes resolve to now, by class, without applying it.
+
+    Raises like `finalize()` does, leaving the classes untouched.
+    """
+    results = {}
+    for conf_class in classes:
+        previous = conf_class._meta.configured_data
+        try:
+            conf_class._configure()
+            conf_class._check_required()
+            results[conf_class] = conf_class._meta.configured_data
+        finally:
+            conf_class._meta.configured_data = previous
+    return results
+
+
+@contextmanager
+def holder_replaced(old: Any, new: Any) -> Iterator[None]:
+    """Point the classes holding `old`, or that will, at `new`.
+
+    The previous holders are restored when the block raises.
+    """
+    options = [
+        conf_class._meta
+        for conf_class in {*_resolved, *_pending.values()}
+        if conf_class._meta._holder is old
+        or (
+            conf_class._meta._holder is None
+            and conf_class._meta.holder_path == getattr(old, "__name__", None)
+        )
+    ]
+    previous = [meta._holder for meta in options]
+    for meta in options:
+        meta._holder = new
+    try:
+        yield
+    except BaseException:
+        for meta, holder in zip(options, previous, strict=True):
+            meta._holder = holder
+        raise
+
+
+def apply_configured(conf_class: AppConfMetaClass, data: dict[str, Any]) -> None:
+    """Store data returned by `configure_again()` on a resolved class."""
+    conf_class._meta.configured_data = data
+    for name, value in data.items():
+        setattr(conf_class, name, value)
+
+
+def resolve_pending(prefixed_name: str) -> bool:
+    """Finalize the `AppConf` providing `prefixed_name`, if one is pending."""
+    conf_class = _pending.get(prefixed_name)
+    if conf_class is None:
+        return False
+
+    conf_class.finalize()
+    return True
+
+
 class AppConf(metaclass=AppConfMetaClass):
     _meta: AppConfOptions
 
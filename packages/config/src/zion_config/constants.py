@@ -1 +1,2 @@
 ENVIRONMENT_VARIABLE = "ZION_SETTINGS_MODULE"
+SNAPSHOT_ENVIRONMENT_VARIABLE = "ZION_SETTINGS_SNAPSHOT"
@@ -0,0 +1,298 @@
+"""Resolve the settings again while the process is running.
+
+```python
+from zion_config.reloading import subscribe, watch
+
+
+def resize_pool(changes):
+    old_size, new_size = changes["DB_POOL_SIZE"]
+    ...
+
+
+subscribe(resize_pool, names=["DB_POOL_SIZE"])
+watcher = watch()  # Reload when the settings files change, or on SIGHUP
+```
+
+Watchers are threads, which don't survive a fork, so start them in every
+worker process, e.g. from the application lifespan.
+"""
+
+import importlib
+import importlib.util
+import logging
+import os
+import signal
+import sys
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from contextlib import nullcontext
+from types import ModuleType
+from typing import Any
+
+from . import app_conf, settings, snapshot
+from .constants import SNAPSHOT_ENVIRONMENT_VARIABLE
+
+
+logger = logging.getLogger(__name__)
+
+Changes = dict[str, tuple[Any, Any]]
+
+_MISSING = object()
+_DEFAULT_SIGNAL = getattr(signal, "SIGHUP", None)
+
+_lock = threading.Lock()
+_subscribers: list[tuple[Callable[[Changes], None], frozenset[str] | None]] = []
+
+
+def subscribe(
+    callback: Callable[[Changes], None], names: Iterable[str] | None = None
+) -> None:
+    """Call `callback(changes)` after the settings were reloaded.
+
+    `changes` maps the changed names to their `(old, new)` values, where a
+    removed setting's new value is `None`. With `names`, the callback only
+    gets those names and only runs when one of them changed. Without, it
+    runs after every reload, so packages resolving their own settings can
+    refresh them.
+    """
+    _subscribers.append((callback, None if names is None else frozenset(names)))
+
+
+def unsubscribe(callback: Callable[[Changes], None]) -> None:
+    _subscribers[:] = [item for item in _subscribers if item[0] is not callback]
+
+
+def reload_settings() -> Changes:
+    """Resolve the settings again and swap the changed values in at once.
+
+    Values come from a fresh `ZION_SETTINGS_SNAPSHOT` snapshot, the resolved
+    `AppConf` classes and the settings module, which is reloaded, in that
+    order. Names that weren't read yet are read from the reloaded module on
+    first use. When resolving fails, nothing changes and the error is raised.
+
+    Returns the changes passed to the subscribers.
+    """
+    with _lock:
+        if not settings.configured:
+            return {}
+        changes = _swap()
+
+    _notify(changes)
+    return changes
+
+
+def _load_again(module: ModuleType) -> ModuleType:
+    """Run the code of `module` in a new module object.
+
+    Unlike `importlib.reload`, an error leaves the current module untouched
+    instead of half updated. The caller swaps the new one into `sys.modules`.
+    """
+    spec = importlib.util.find_spec(module.__name__)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {module.__name__!r}")
+
+    new_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(new_module)
+    return new_module
+
+
+def _swap() -> Changes:
+    state = settings.__dict__
+    cached = settings._loaded_names | settings._snapshot_names
+
+    snapshot.clear_cache()
+    snapshot_values = snapshot.load_section(snapshot.CONFIG_SECTION) or {}
+
+    previous_module = module = settings._module
+    if module is not None:
+        module = _load_again(module)
+    elif not snapshot_values:
+        module = importlib.import_module(settings.CONFIG_MODULE_NAME)
+
+    # Classes that wrote to the settings, and those providing cached values
+    # the snapshot can't give anymore
+    conf_classes = set(app_conf._resolved)
+    conf_classes.update(
+        app_conf._pending[name]
+        for name in cached - snapshot_values.keys()
+        if name in app_conf._pending
+    )
+    # `AppConf` classes read the values from the settings module object
+    holders = (
+        nullcontext()
+        if previous_module is None
+        else app_conf.holder_replaced(previous_module, module)
+    )
+    with holders:
+        conf_data = app_conf.configure_again(conf_classes)
+    conf_values = {
+        conf_class._meta.prefixed_name(name): value
+        for conf_class, data in conf_data.items()
+        for name, value in data.items()
+    }
+
+    values: dict[str, Any] = {}
+    loaded_names, snapshot_names = set(), set()
+    for name in cached | conf_values.keys() | snapshot_values.keys():
+        if name in snapshot_values:
+            values[name] = snapshot_values[name]
+            snapshot_names.add(name)
+        elif name in conf_values:
+            values[name] = conf_values[name]
+        elif module is not None and hasattr(module, name):
+            values[name] = getattr(module, name)
+            loaded_names.add(name)
+
+    changes = {}
+    for name, value in values.items():
+        old_value = state.get(name, _MISSING)
+        if old_value is not _MISSING and old_value != value:
+            changes[name] = (old_value, value)
+    removed = cached - values.keys()
+    for name in removed:
+        changes[name] = (state[name], None)
+
+    # A single update, so readers see either the old or the new values
+    state.update(values)
+    for name in removed:
+        state.pop(name, None)
+    state["_module"] = module
+    if module is not None:
+        sys.modules[module.__name__] = module
+        parent, _, child = module.__name__.rpartition(".")
+        if parent in sys.modules:
+            setattr(sys.modules[parent], child, module)
+    settings._loaded_names.clear()
+    settings._loaded_names.update(loaded_names)
+    settings._snapshot_names.clear()
+    settings._snapshot_names.update(snapshot_names)
+
+    for conf_class, data in conf_data.items():
+        if conf_class in app_conf._resolved:
+            app_conf.apply_configured(conf_class, data)
+
+    if changes:
+        logger.info("Settings reloaded, changed: %s", ", ".join(sorted(changes)))
+    return changes
+
+
+def _notify(changes: Changes) -> None:
+    for callback, names in list(_subscribers):
+        if names is None:
+            selected = changes
+        else:
+            selected = {name: changes[name] for name in names if name in changes}
+            if not selected:
+                continue
+
+        try:
+            callback(selected)
+        except Exception:
+            logger.exception("Settings subscriber %r failed", callback)
+
+
+class SettingsWatcher:
+    """Reloads the settings when their files change, or when triggered.
+
+    A daemon thread checks the settings module, the snapshot and `files` for
+    changes every `interval` seconds. A failed reload is logged, and retried
+    on the next change.
+    """
+
+    def __init__(self, interval: float = 2.0, files: Sequence[str] = ()):
+        self.interval = interval
+        self.files = list(files)
+        self._event = threading.Event()
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+        self._stats: dict[str, tuple[int, int] | None] = {}
+
+    def _watched_files(self) -> list[str]:
+        files = list(self.files)
+        module = settings._module
+        if module is not None and getattr(module, "__file__", None):
+            files.append(module.__file__)
+        elif settings.configured:
+            spec = importlib.util.find_spec(settings.CONFIG_MODULE_NAME)
+            if spec is not None and spec.origin:
+                files.append(spec.origin)
+
+        snapshot_path = os.environ.get(SNAPSHOT_ENVIRONMENT_VARIABLE)
+        if snapshot_path:
+            files.append(snapshot_path)
+        return files
+
+    def _file_stats(self) -> dict[str, tuple[int, int] | None]:
+        stats = {}
+        for path in self._watched_files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stats[path] = None
+            else:
+                stats[path] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def start(self) -> "SettingsWatcher":
+        self._stats = self._file_stats()
+        self._thread = threading.Thread(
+            target=self._run, name="zion-settings-watcher", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def trigger(self) -> None:
+        """Reload on the watcher thread now, e.g. from a signal handler."""
+        self._event.set()
+
+    def stop(self) -> None:
+        self._stopped = True
+        self._event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def install_signal_handler(self, signum: int) -> None:
+        """Reload when the process receives `signum`; main thread only."""
+        signal.signal(signum, lambda _signum, _frame: self.trigger())
+
+    def _run(self) -> None:
+        while True:
+            triggered = self._event.wait(self.interval)
+            self._event.clear()
+            if self._stopped:
+                return
+
+            stats = self._file_stats()
+            if not triggered and stats == self._stats:
+                continue
+
+            self._stats = stats
+            try:
+                reload_settings()
+            except Exception:
+                logger.exception("Cannot reload the settings")
+
+
+def watch(
+    interval: float = 2.0,
+    files: Sequence[str] = (),
+    signum: int | None = _DEFAULT_SIGNAL,
+) -> SettingsWatcher:
+    """Start a `SettingsWatcher`, also reloading on `signum` if set.
+
+    The signal handler is only installed when called from the main thread.
+    """
+    watcher = SettingsWatcher(interval, files).start()
+    if signum is not None and threading.current_thread() is threading.main_thread():
+        watcher.install_signal_handler(signum)
+    return watcher
+
+
+__all__ = [
+    "SettingsWatcher",
+    "reload_settings",
+    "subscribe",
+    "unsubscribe",
+    "watch",
+]
@@ -0,0 +1,295 @@
+"""Resolved settings frozen into a file that worker processes load in one read.
+
+```bash
+python -m zion_config.snapshot --output /run/app/settings.snapshot \\
+    --include zion_db.conf --include zion_auth.settings
+ZION_SETTINGS_SNAPSHOT=/run/app/settings.snapshot gunicorn ...
+```
+
+The first line of the file is a header with the format version, the checksum
+of the payload and what the values were resolved from: the settings module
+file, and the environment variables under the prefixes of every section. A
+snapshot whose header doesn't match the running process, or whose payload
+doesn't match the checksum, is ignored and settings are resolved as usual.
+"""
+
+import hashlib
+import importlib
+import importlib.util
+import logging
+import math
+import os
+import sys
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+from .constants import ENVIRONMENT_VARIABLE, SNAPSHOT_ENVIRONMENT_VARIABLE
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    import json
+
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+CONFIG_SECTION = "zion_config"
+
+
+class _Section:
+    def __init__(self, dump: Callable[[], dict[str, Any]], env_prefixes: Sequence[str]):
+        self.dump = dump
+        self.env_prefixes = tuple(env_prefixes)
+
+
+_sections: dict[str, _Section] = {}
+# Snapshots read by this process, by path; None when missing or stale
+_snapshots: dict[str, dict[str, Any] | None] = {}
+
+
+def register_section(
+    name: str,
+    dump: Callable[[], dict[str, Any]],
+    env_prefixes: Sequence[str] = (),
+) -> None:
+    """Include the values returned by `dump` in the snapshots written from now on.
+
+    Changing an environment variable starting with one of `env_prefixes`
+    makes the snapshot stale.
+    """
+    _sections[name] = _Section(dump, env_prefixes)
+
+
+def _dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode()
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def is_serializable(value: Any) -> bool:
+    """Whether the value is read back from the snapshot exactly as it is."""
+    value_type = type(value)
+    if value is None or value_type in (str, bool, int):
+        return True
+    if value_type is float:
+        return math.isfinite(value)
+    if value_type is list:
+        return all(is_serializable(item) for item in value)
+    if value_type is dict:
+        return all(
+            type(key) is str and is_serializable(item) for key, item in value.items()
+        )
+    return False
+
+
+def _environment_hash(prefixes: Sequence[str]) -> str:
+    prefixes = tuple(prefix.upper() for prefix in prefixes)
+    items = sorted(
+        (name, value)
+        for name, value in os.environ.items()
+        if name.upper().startswith(prefixes) and name != SNAPSHOT_ENVIRONMENT_VARIABLE
+    )
+    return hashlib.sha256(_dumps(items)).hexdigest()
+
+
+def _file_stats(paths: Sequence[str]) -> dict[str, list[int]]:
+    stats = {}
+    for path in paths:
+        stat = os.stat(path)
+        stats[path] = [stat.st_mtime_ns, stat.st_size]
+    return stats
+
+
+def _is_fresh(header: dict[str, Any]) -> bool:
+    if header.get("version") != SNAPSHOT_VERSION:
+        return False
+    if header.get("settings_module") != os.environ.get(ENVIRONMENT_VARIABLE):
+        return False
+
+    try:
+        if _file_stats(list(header["files"])) != header["files"]:
+            return False
+    except (OSError, KeyError, TypeError):
+        return False
+
+    return header.get("environment") == _environment_hash(header["env_prefixes"])
+
+
+def read_snapshot(path: str) -> dict[str, Any] | None:
+    """The sections of the snapshot, or None if it's missing, stale or corrupt."""
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+
+    header_line, _, payload = data.partition(b"\n")
+    try:
+        header = _loads(header_line)
+        if not isinstance(header, dict) or not _is_fresh(header):
+            logger.warning("Settings snapshot %s is stale, ignoring it", path)
+            return None
+        if hashlib.sha256(payload).hexdigest() != header.get("checksum"):
+            logger.warning("Settings snapshot %s is corrupt, ignoring it", path)
+            return None
+        return _loads(payload)
+    except ValueError:
+        logger.warning("Settings snapshot %s is corrupt, ignoring it", path)
+        return None
+
+
+def load_section(name: str) -> dict[str, Any] | None:
+    """Values of a section of the `ZION_SETTINGS_SNAPSHOT` snapshot, if usable.
+
+    The file is read once per process and shared by every section.
+    """
+    path = os.environ.get(SNAPSHOT_ENVIRONMENT_VARIABLE)
+    if not path:
+        return None
+
+    if path not in _snapshots:
+        _snapshots[path] = read_snapshot(path)
+    snapshot = _snapshots[path]
+    return None if snapshot is None else snapshot.get(name)
+
+
+def clear_cache() -> None:
+    _snapshots.clear()
+
+
+def write_snapshot(path: str, files: Sequence[str] = ()) -> dict[str, Any]:
+    """Resolve every registered section and write them to `path`.
+
+    `files` are checked for changes along with the settings module, for
+    settings modules reading other local files. The file is only readable by
+    its owner, as settings usually hold secrets. Returns the header.
+    """
+    from . import settings
+
+    settings_module = os.environ.get(ENVIRONMENT_VARIABLE)
+    payload = {name: section.dump() for name, section in sorted(_sections.items())}
+    payload_bytes = _dumps(payload)
+
+    watched = list(files)
+    spec = importlib.util.find_spec(settings.CONFIG_MODULE_NAME)
+    if spec is not None and spec.origin and os.path.isfile(spec.origin):
+        watched.insert(0, spec.origin)
+
+    env_prefixes = sorted(
+        {prefix for section in _sections.values() for prefix in section.env_prefixes}
+    )
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "created_at": time.time(),
+        "checksum": hashlib.sha256(payload_bytes).hexdigest(),
+        "settings_module": settings_module,
+        "files": _file_stats([os.path.abspath(file) for file in watched]),
+        "env_prefixes": env_prefixes,
+        "environment": _environment_hash(env_prefixes),
+        "sections": sorted(payload),
+    }
+
+    temporary = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as file:
+        file.write(_dumps(header) + b"\n" + payload_bytes)
+    os.replace(temporary, path)
+    _snapshots.pop(path, None)
+    return header
+
+
+def _dump_config() -> dict[str, Any]:
+    from . import AppConf, settings
+
+    settings.configure()
+    AppConf.finalize()
+
+    names = {name for name in dir(settings._module) if name.isupper()}
+    names.update(name for name in settings.__dict__ if name.isupper())
+
+    values = {}
+    for name in sorted(names):
+        value = getattr(settings, name)
+        if is_serializable(value):
+            values[name] = value
+        else:
+            # Left out of the snapshot, read from the settings module on use
+            logger.info("Setting %s can't be stored in the snapshot", name)
+    return values
+
+
+register_section(CONFIG_SECTION, _dump_config, env_prefixes=("ZION_",))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m zion_config.snapshot",
+        description="Write the resolved settings to a snapshot file.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=os.environ.get(SNAPSHOT_ENVIRONMENT_VARIABLE),
+        help=f"Snapshot path, defaults to ${SNAPSHOT_ENVIRONMENT_VARIABLE}.",
+    )
+    parser.add_argument(
+        "-i",
+        "--include",
+        action="append",
+        default=[],
+        metavar="MODULE",
+        help="Module to import first, for its AppConf classes or sections.",
+    )
+    parser.add_argument(
+        "-f",
+        "--file",
+        action="append",
+        default=[],
+        metavar="PATH",
+        help="Another file whose changes make the snapshot stale.",
+    )
+    arguments = parser.parse_args(argv)
+    if not arguments.output:
+        parser.error(f"--output or ${SNAPSHOT_ENVIRONMENT_VARIABLE} is required")
+
+    # Resolve from the sources, not from the snapshot being replaced
+    os.environ.pop(SNAPSHOT_ENVIRONMENT_VARIABLE, None)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    sys.path.insert(0, os.getcwd())
+    for module_name in arguments.include:
+        importlib.import_module(module_name)
+
+    header = write_snapshot(arguments.output, arguments.file)
+    print(f"Wrote {arguments.output}: {', '.join(header['sections'])}")
+    return 0
+
+
+__all__ = [
+    "clear_cache",
+    "is_serializable",
+    "load_section",
+    "read_snapshot",
+    "register_section",
+    "write_snapshot",
+]
+
+
+if __name__ == "__main__":
+    # Run through the imported module, where the sections are registered
+    from zion_config.snapshot import main as snapshot_main
+
+    sys.exit(snapshot_main())
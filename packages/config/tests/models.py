@@ -1,4 +1,4 @@
-from zion.config import AppConf
+from zion_config import AppConf
 
 
 class TestConf(AppConf):
@@ -1,8 +1,11 @@
+import threading
+import time
+
 import pytest
 
 
 def test_basic_functionality():
-    from zion.config import AppConf, settings
+    from zion_config import AppConf, settings
 
     class Conf(AppConf):
         SOME_CONFIG = "some value"
@@ -14,7 +17,7 @@ def test_basic_functionality():
 
 
 def test_appconf_uses_value_from_setting_file():
-    from zion.config import AppConf, settings
+    from zion_config import AppConf, settings
 
     class Conf(AppConf):
         SOME_CONFIG = True
@@ -31,7 +34,7 @@ def test_appconf_uses_value_from_setting_file():
 
 
 def test_appconf_meta_required_passes():
-    from zion.config import AppConf, settings
+    from zion_config import AppConf, settings
 
     # User must define `TEST_SOME_SETTING` in the settings
     class Conf(AppConf):
@@ -45,21 +48,22 @@ def test_appconf_meta_required_passes():
 
 
 def test_appconf_meta_required_throws_error():
-    from zion.config import AppConf
+    from zion_config import AppConf
 
     # User must define `TEST_REQUIRED_FIELD` in the settings
-    with pytest.raises(ValueError):
+    class Conf(AppConf):
+        SOME_SETTING = "some value"
 
-        class Conf(AppConf):
-            SOME_SETTING = "some value"
+        class Meta:
+            prefix = "test"
+            required = ["REQUIRED_FIELD"]
 
-            class Meta:
-                prefix = "test"
-                required = ["REQUIRED_FIELD"]
+    with pytest.raises(ValueError):
+        Conf.finalize()
 
 
 def test_configure_method_overrides_setting_module_value():
-    from zion.config import AppConf, settings
+    from zion_config import AppConf, settings
 
     class Conf(AppConf):
         SOME_SETTING = "some value"
@@ -80,7 +84,7 @@ def test_configure_method_overrides_setting_module_value():
 
 
 def test_configure_method_overrides():
-    from zion.config import AppConf, settings
+    from zion_config import AppConf, settings
 
     class Conf(AppConf):
         NEW_SETTING = "some value"
@@ -98,3 +102,79 @@ def test_configure_method_overrides():
 
     assert settings.TEST_NEW_SETTING == "something"
     assert Conf.NEW_SETTING == "something"
+
+
+def test_appconf_is_resolved_on_first_access():
+    from zion_config import AppConf, settings
+
+    calls = []
+
+    class Conf(AppConf):
+        SOME_SETTING = "some value"
+
+        class Meta:
+            prefix = "lazy"
+
+        def configure_some_setting(self, value):
+            calls.append(value)
+            return value.upper()
+
+    # Defining the class doesn't run the callbacks
+    assert calls == []
+
+    assert settings.LAZY_SOME_SETTING == "SOME VALUE"
+    assert Conf.SOME_SETTING == "SOME VALUE"
+    # Callbacks run only once
+    assert calls == ["some value"]
+
+
+def test_appconf_finalize_resolves_every_pending_conf():
+    from zion_config import AppConf, settings
+
+    class FirstConf(AppConf):
+        VALUE = 1
+
+        class Meta:
+            prefix = "first"
+
+    class SecondConf(AppConf):
+        VALUE = 2
+
+        class Meta:
+            prefix = "second"
+
+    AppConf.finalize()
+
+    assert settings.__dict__["FIRST_VALUE"] == 1
+    assert settings.__dict__["SECOND_VALUE"] == 2
+
+
+def test_concurrent_first_access_waits_for_the_values():
+    from zion_config import AppConf, settings
+
+    configuring = threading.Event()
+    read = []
+
+    class Conf(AppConf):
+        SLOW = "slow"
+        DEFAULT_ONLY = "default"
+
+        class Meta:
+            prefix = "race"
+
+        def configure_slow(self, value):
+            configuring.set()
+            time.sleep(0.05)
+            return value
+
+    def read_default_only():
+        configuring.wait(1)
+        read.append(settings.RACE_DEFAULT_ONLY)
+
+    reader = threading.Thread(target=read_default_only)
+    reader.start()
+
+    assert settings.RACE_SLOW == "slow"
+    reader.join(1)
+    assert read == ["default"]
+    assert Conf.DEFAULT_ONLY == "default"
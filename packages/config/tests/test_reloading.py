@@ -0,0 +1,188 @@
+import sys
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def settings_module(tmp_path, monkeypatch):
+    from zion_config import settings
+
+    # Rewrites within the same second must not be read from stale bytecode
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("ZION_SETTINGS_MODULE", "reloading.settings")
+    (tmp_path / "reloading").mkdir()
+    (tmp_path / "reloading" / "__init__.py").write_text("")
+    path = tmp_path / "reloading" / "settings.py"
+    path.write_text("LOG_LEVEL = 'INFO'\nPOOL_SIZE = 5\n")
+    settings.configure("reloading.settings")
+    yield path
+
+    settings.configure("tests.settings")
+    sys.modules.pop("reloading.settings", None)
+    sys.modules.pop("reloading", None)
+
+
+def test_reload_swaps_changed_values_and_notifies(settings_module):
+    from zion_config import settings
+    from zion_config.reloading import reload_settings, subscribe, unsubscribe
+
+    # Given
+    received = []
+    subscribe(received.append, names=["LOG_LEVEL"])
+    assert settings.LOG_LEVEL == "INFO"
+    assert settings.POOL_SIZE == 5
+
+    # When
+    settings_module.write_text("LOG_LEVEL = 'DEBUG'\nPOOL_SIZE = 5\n")
+    changes = reload_settings()
+    unsubscribe(received.append)
+
+    # Then
+    assert changes == {"LOG_LEVEL": ("INFO", "DEBUG")}
+    assert received == [{"LOG_LEVEL": ("INFO", "DEBUG")}]
+    assert settings.LOG_LEVEL == "DEBUG"
+
+
+def test_failed_reload_keeps_values(settings_module):
+    from zion_config import settings
+    from zion_config.reloading import reload_settings
+
+    # Given
+    assert settings.LOG_LEVEL == "INFO"
+
+    # When
+    settings_module.write_text("LOG_LEVEL = \n")
+    with pytest.raises(SyntaxError):
+        reload_settings()
+
+    # Then
+    assert settings.LOG_LEVEL == "INFO"
+
+
+def test_reload_failing_at_runtime_keeps_the_module(settings_module):
+    from zion_config import settings
+    from zion_config.reloading import reload_settings
+
+    # Given
+    assert settings.LOG_LEVEL == "INFO"
+    module = sys.modules["reloading.settings"]
+
+    # When
+    settings_module.write_text(
+        "LOG_LEVEL = 'DEBUG'\nPOOL_SIZE = 6\nraise RuntimeError('boom')\n"
+    )
+    with pytest.raises(RuntimeError, match="boom"):
+        reload_settings()
+
+    # Then
+    assert sys.modules["reloading.settings"] is module
+    assert (module.LOG_LEVEL, module.POOL_SIZE) == ("INFO", 5)
+    assert settings.LOG_LEVEL == "INFO"
+    assert settings.POOL_SIZE == 5
+
+
+def test_reload_swaps_the_module(settings_module):
+    from zion_config import settings
+    from zion_config.reloading import reload_settings
+
+    # Given
+    module = sys.modules["reloading.settings"]
+
+    # When
+    settings_module.write_text("LOG_LEVEL = 'INFO'\nPOOL_SIZE = 6\n")
+    reload_settings()
+
+    # Then
+    assert sys.modules["reloading.settings"] is not module
+    assert sys.modules["reloading"].settings is sys.modules["reloading.settings"]
+    assert settings.POOL_SIZE == 6
+
+
+def test_reload_resolves_appconf_again(settings_module):
+    from zion_config import AppConf, settings
+    from zion_config.reloading import reload_settings
+
+    # Given
+    class Conf(AppConf):
+        SIZE = 1
+
+        class Meta:
+            prefix = "reload"
+
+        def configure_size(self, value):
+            return value * 10
+
+    settings_module.write_text("LOG_LEVEL = 'INFO'\nRELOAD_SIZE = 2\n")
+    reload_settings()
+    assert settings.RELOAD_SIZE == 20
+
+    # When
+    settings_module.write_text("LOG_LEVEL = 'INFO'\nRELOAD_SIZE = 3\n")
+    changes = reload_settings()
+
+    # Then
+    assert changes["RELOAD_SIZE"] == (20, 30)
+    assert settings.RELOAD_SIZE == 30
+    assert Conf.SIZE == 30
+
+
+def test_failed_appconf_reload_keeps_the_module(settings_module):
+    from zion_config import AppConf, app_conf, settings
+    from zion_config.reloading import reload_settings
+
+    # Given
+    class Conf(AppConf):
+        LIMIT = 1
+
+        class Meta:
+            prefix = "failing"
+
+        def configure_limit(self, value):
+            if value < 0:
+                raise ValueError("negative limit")
+            return value
+
+    settings_module.write_text("LOG_LEVEL = 'INFO'\nFAILING_LIMIT = 2\n")
+    reload_settings()
+    module = sys.modules["reloading.settings"]
+    assert settings.FAILING_LIMIT == 2
+    assert Conf._meta.holder is module
+
+    # When
+    settings_module.write_text("LOG_LEVEL = 'INFO'\nFAILING_LIMIT = -1\n")
+    with pytest.raises(ValueError, match="negative limit"):
+        reload_settings()
+
+    # Then
+    assert Conf._meta.holder is module
+    assert sys.modules["reloading.settings"] is module
+    assert settings.FAILING_LIMIT == 2
+    # Later reloads must not resolve it again
+    app_conf._resolved.discard(Conf)
+
+
+def test_watcher_reloads_when_triggered(settings_module):
+    from zion_config import settings
+    from zion_config.reloading import SettingsWatcher, subscribe, unsubscribe
+
+    # Given
+    reloaded = threading.Event()
+
+    def on_reload(_changes):
+        reloaded.set()
+
+    subscribe(on_reload)
+    watcher = SettingsWatcher(interval=60).start()
+    assert settings.POOL_SIZE == 5
+
+    # When
+    settings_module.write_text("LOG_LEVEL = 'INFO'\nPOOL_SIZE = 10\n")
+    watcher.trigger()
+
+    # Then
+    assert reloaded.wait(5)
+    watcher.stop()
+    unsubscribe(on_reload)
+    assert settings.POOL_SIZE == 10
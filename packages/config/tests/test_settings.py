@@ -5,14 +5,49 @@ import pytest
 
 def test_settings_is_loading_from_environment_variable():
     os.environ["ZION_SETTINGS_MODULE"] = "tests.settings"
-    from zion.config import settings
+    from zion_config import settings
 
     assert settings.SIMPLE_VALUE is True
 
 
 def test_settings_throwing_error_if_module_not_found():
     os.environ["ZION_SETTINGS_MODULE"] = "non_existent.module.settings"
-    from zion.config import _Settings
+    from zion_config import _Settings
 
+    settings = _Settings()
     with pytest.raises(ImportError):
-        _Settings()
+        settings.SIMPLE_VALUE  # noqa: B018
+
+    os.environ["ZION_SETTINGS_MODULE"] = "tests.settings"
+
+
+def test_settings_module_is_loaded_on_first_access():
+    os.environ["ZION_SETTINGS_MODULE"] = "tests.settings"
+    from zion_config import _Settings
+
+    settings = _Settings()
+    assert settings.configured is False
+
+    assert settings.SIMPLE_VALUE is True
+    assert settings.configured is True
+    # The value is cached on the instance
+    assert settings.__dict__["SIMPLE_VALUE"] is True
+
+
+def test_settings_missing_value_raises_attribute_error():
+    os.environ["ZION_SETTINGS_MODULE"] = "tests.settings"
+    from zion_config import _Settings
+
+    settings = _Settings()
+    assert not hasattr(settings, "NOT_DEFINED")
+
+
+def test_settings_configure_with_overrides():
+    from zion_config import _Settings
+
+    settings = _Settings()
+    settings.configure("tests.settings", SIMPLE_VALUE=False)
+
+    assert settings.CONFIG_MODULE_NAME == "tests.settings"
+    assert settings.SIMPLE_VALUE is False
+    assert settings.TEST_SOME_SETTING == "overriden value"
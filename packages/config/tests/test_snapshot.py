@@ -0,0 +1,93 @@
+import os
+
+import pytest
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, monkeypatch):
+    from zion_config import snapshot
+
+    path = str(tmp_path / "settings.snapshot")
+    monkeypatch.setenv("ZION_SETTINGS_MODULE", "tests.settings")
+    monkeypatch.setenv("ZION_SETTINGS_SNAPSHOT", path)
+    snapshot.clear_cache()
+    yield path
+    snapshot.clear_cache()
+
+
+def test_settings_are_loaded_from_snapshot(snapshot_path):
+    from zion_config import _Settings
+    from zion_config.snapshot import write_snapshot
+
+    # Given
+    write_snapshot(snapshot_path)
+    settings = _Settings()
+
+    # When
+    value = settings.SIMPLE_VALUE
+
+    # Then
+    assert value is True
+    assert settings.configured is True
+    # The settings module isn't needed for values in the snapshot
+    assert settings._module is None
+    assert os.stat(snapshot_path).st_mode & 0o777 == 0o600
+
+
+def test_snapshot_is_ignored_when_environment_changes(snapshot_path, monkeypatch):
+    from zion_config.snapshot import load_section, write_snapshot
+
+    # Given
+    write_snapshot(snapshot_path)
+
+    # When
+    monkeypatch.setenv("ZION_SOME_SETTING", "changed")
+
+    # Then
+    assert load_section("zion_config") is None
+
+
+def test_snapshot_is_ignored_when_payload_is_corrupt(snapshot_path):
+    from zion_config import _Settings
+    from zion_config.snapshot import write_snapshot
+
+    # Given
+    write_snapshot(snapshot_path)
+    with open(snapshot_path, "rb") as file:
+        data = file.read()
+    with open(snapshot_path, "wb") as file:
+        file.write(data.replace(b"true", b"fals"))
+    settings = _Settings()
+
+    # When
+    value = settings.SIMPLE_VALUE
+
+    # Then
+    assert value is True
+    assert settings._module is not None
+
+
+def test_registered_section_is_written(snapshot_path):
+    from zion_config import snapshot
+
+    # Given
+    snapshot.register_section(
+        "tests", lambda: {"values": [1, 2.5, "a"]}, env_prefixes=("TESTS_",)
+    )
+
+    # When
+    header = snapshot.write_snapshot(snapshot_path)
+
+    # Then
+    assert "TESTS_" in header["env_prefixes"]
+    assert snapshot.load_section("tests") == {"values": [1, 2.5, "a"]}
+    del snapshot._sections["tests"]
+
+
+def test_only_serializable_values_are_stored():
+    from zion_config.snapshot import is_serializable
+
+    assert is_serializable({"a": [1, 2.0, None, True]})
+    assert not is_serializable((1, 2))
+    assert not is_serializable({1: "a"})
+    assert not is_serializable(float("nan"))
@@ -0,0 +1,102 @@
+"""Insert throughput and unique index size of the `PidMixin` strategies.
+
+Every strategy gets its own table with an integer primary key and a unique
+`pid` column. Rows are inserted in batches, each batch in its own
+transaction, like an application doing bulk writes over time.
+
+Usage:
+
+```bash
+python benchmarks/pid_strategies.py --rows 200000
+python benchmarks/pid_strategies.py --url postgresql+asyncpg://localhost/bench
+```
+
+Index sizes are read from `dbstat` on SQLite and `pg_relation_size` on
+Postgres.
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from zion_db.pid import GENERATORS, PID_LENGTHS
+
+
+def build_table(metadata: MetaData, strategy: str) -> Table:
+    return Table(
+        f"bench_pid_{strategy}",
+        metadata,
+        Column("id", Integer, primary_key=True, autoincrement=True),
+        Column("pid", String(PID_LENGTHS[strategy]), nullable=False),
+        Column("payload", String(32), nullable=False),
+    )
+
+
+async def index_size(engine: AsyncEngine, index_name: str) -> int:
+    async with engine.connect() as connection:
+        if engine.dialect.name == "postgresql":
+            query = text("SELECT pg_relation_size(:name)")
+        elif engine.dialect.name == "sqlite":
+            query = text("SELECT sum(pgsize) FROM dbstat WHERE name = :name")
+        else:
+            return 0
+        return (await connection.scalar(query, {"name": index_name})) or 0
+
+
+async def run(url: str, rows: int, batch_size: int) -> None:
+    engine = create_async_engine(url)
+    metadata = MetaData()
+    tables = {strategy: build_table(metadata, strategy) for strategy in GENERATORS}
+
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.drop_all)
+        await connection.run_sync(metadata.create_all)
+        for table in tables.values():
+            await connection.execute(
+                text(f"CREATE UNIQUE INDEX ix_{table.name}_pid ON {table.name} (pid)")
+            )
+
+    print(f"{'strategy':<10}{'gen us/id':>12}{'rows/s':>12}{'index KiB':>12}")
+    for strategy, table in tables.items():
+        generate = GENERATORS[strategy]
+
+        started = time.perf_counter()
+        for _ in range(10_000):
+            generate()
+        generation_us = (time.perf_counter() - started) / 10_000 * 1e6
+
+        statement = insert(table)
+        started = time.perf_counter()
+        for offset in range(0, rows, batch_size):
+            batch = [
+                {"pid": generate(), "payload": "x" * 32}
+                for _ in range(min(batch_size, rows - offset))
+            ]
+            async with engine.begin() as connection:
+                await connection.execute(statement, batch)
+        elapsed = time.perf_counter() - started
+
+        size = await index_size(engine, f"ix_{table.name}_pid")
+        print(
+            f"{strategy:<10}{generation_us:>12.2f}{rows / elapsed:>12.0f}"
+            f"{size / 1024:>12.0f}"
+        )
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="sqlite+aiosqlite:///pid_benchmark.db")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.url, args.rows, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,29 @@
-from .base import DbBaseModel
-from .deps import DbSessionDep
+from zion_utils.lazy import LazyAttributes
+
+
+# Importing `zion_db` doesn't load SQLAlchemy or FastAPI until one is used
+_lazy = LazyAttributes(
+    __name__,
+    {
+        "DbBaseModel": "zion_db.base.DbBaseModel",
+        "DbLazySessionDep": "zion_db.deps.DbLazySessionDep",
+        "DbReadSessionDep": "zion_db.deps.DbReadSessionDep",
+        "DbSessionDep": "zion_db.deps.DbSessionDep",
+    },
+)
+
+
+def __getattr__(name: str):
+    return _lazy.getattr(name)
+
+
+def __dir__():
+    return _lazy.dir()
+
 
 __all__ = [
     "DbBaseModel",
+    "DbLazySessionDep",
+    "DbReadSessionDep",
     "DbSessionDep",
 ]
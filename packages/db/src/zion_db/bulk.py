@@ -0,0 +1,210 @@
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
+from itertools import batched
+from typing import Any, cast
+
+from sqlalchemy import Insert, Row, Table, insert
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from zion_db.base import DbBaseModel
+from zion_db.conf import settings
+from zion_db.mixins import utcnow
+
+
+RowData = Mapping[str, Any]
+
+
+def _chunk_size(chunk_size: int | None) -> int:
+    return chunk_size or settings.DB_BULK_CHUNK_SIZE
+
+
+def _table(model: type[DbBaseModel]) -> Table:
+    return cast(Table, model.__table__)
+
+
+def _returning(model: type[DbBaseModel], statement: Insert, returning: Sequence[str]):
+    columns = [getattr(model, name) for name in returning]
+    return statement.returning(*columns, sort_by_parameter_order=True)
+
+
+def build_upsert(
+    session: AsyncSession,
+    model: type[DbBaseModel],
+    index_elements: Sequence[str],
+    update_columns: Sequence[str],
+) -> Insert:
+    """`INSERT ... ON CONFLICT` / `ON DUPLICATE KEY UPDATE` for the bound dialect.
+
+    An `updated_at` column is always touched on conflict, with the Python
+    side time `TimestampMixin` uses.
+    """
+    table = _table(model)
+    dialect = session.get_bind().dialect.name
+
+    match dialect:
+        case "postgresql" | "sqlite":
+            module = postgresql if dialect == "postgresql" else sqlite
+            statement = module.insert(model)
+            values: dict[str, Any] = {
+                name: statement.excluded[name] for name in update_columns
+            }
+            if "updated_at" in table.columns:
+                values["updated_at"] = utcnow()
+            return statement.on_conflict_do_update(
+                index_elements=list(index_elements), set_=values
+            )
+        case "mysql" | "mariadb":
+            statement = mysql.insert(model)
+            values = {name: statement.inserted[name] for name in update_columns}
+            if "updated_at" in table.columns:
+                values["updated_at"] = utcnow()
+            return statement.on_duplicate_key_update(values)
+        case _:
+            raise NotImplementedError(f"Upsert is not supported for {dialect}")
+
+
+def _upsert_chunks(
+    session: AsyncSession,
+    model: type[DbBaseModel],
+    rows: Iterable[RowData],
+    index_elements: Sequence[str],
+    update_columns: Sequence[str] | None,
+    chunk_size: int | None,
+) -> Iterator[tuple[Insert, list[RowData]]]:
+    """Pair each chunk with its upsert statement.
+
+    Without `update_columns`, the keys of the first row except the conflict
+    columns are updated, so generated values like `pid` or `created_at` are
+    never overwritten.
+    """
+    statement = None
+    for chunk in batched(rows, _chunk_size(chunk_size)):
+        if statement is None:
+            if update_columns is None:
+                update_columns = [
+                    name for name in chunk[0] if name not in index_elements
+                ]
+            statement = build_upsert(session, model, index_elements, update_columns)
+        yield statement, list(chunk)
+
+
+async def iter_insert(
+    session: AsyncSession,
+    model: type[DbBaseModel],
+    rows: Iterable[RowData],
+    returning: Sequence[str] = ("id",),
+    chunk_size: int | None = None,
+) -> AsyncIterator[Row]:
+    """Insert the rows chunk by chunk and yield the `RETURNING` rows in order.
+
+    Each chunk is a single `insertmanyvalues` statement, and only one chunk
+    of input and output is held in memory at a time. Columns left out of the
+    rows get their Python or server defaults.
+    """
+    statement = _returning(model, insert(model), returning)
+    for chunk in batched(rows, _chunk_size(chunk_size)):
+        result = await session.execute(statement, list(chunk))
+        for row in result:
+            yield row
+
+
+async def bulk_insert(
+    session: AsyncSession,
+    model: type[DbBaseModel],
+    rows: Iterable[RowData],
+    chunk_size: int | None = None,
+) -> int:
+    """Insert the rows chunk by chunk and return the number of rows."""
+    statement = insert(model)
+    count = 0
+    for chunk in batched(rows, _chunk_size(chunk_size)):
+        await session.execute(statement, list(chunk))
+        count += len(chunk)
+    return count
+
+
+async def iter_upsert(
+    session: AsyncSession,
+    model: type[DbBaseModel],
+    rows: Iterable[RowData],
+    index_elements: Sequence[str],
+    update_columns: Sequence[str] | None = None,
+    returning: Sequence[str] = ("id",),
+    chunk_size: int | None = None,
+) -> AsyncIterator[Row]:
+    """Upsert the rows chunk by chunk and yield the `RETURNING` rows in order.
+
+    MySQL has no `RETURNING`; use `bulk_upsert()` there.
+    """
+    chunks = _upsert_chunks(
+        session, model, rows, index_elements, update_columns, chunk_size
+    )
+    for statement, chunk in chunks:
+        result = await session.execute(_returning(model, statement, returning), chunk)
+        for row in result:
+            yield row
+
+
+async def bulk_upsert(
+    session: AsyncSession,
+    model: type[DbBaseModel],
+    rows: Iterable[RowData],
+    index_elements: Sequence[str],
+    update_columns: Sequence[str] | None = None,
+    chunk_size: int | None = None,
+) -> int:
+    """Upsert the rows chunk by chunk and return the number of input rows."""
+    chunks = _upsert_chunks(
+        session, model, rows, index_elements, update_columns, chunk_size
+    )
+    count = 0
+    for statement, chunk in chunks:
+        await session.execute(statement, chunk)
+        count += len(chunk)
+    return count
+
+
+async def copy_insert(
+    session: AsyncSession,
+    model: type[DbBaseModel],
+    rows: Iterable[RowData],
+    columns: Sequence[str],
+    chunk_size: int | None = None,
+) -> int:
+    """Load the rows with Postgres `COPY` through asyncpg.
+
+    This is the fastest path for large loads, but it skips the Python side
+    column defaults and `RETURNING`: every column that has no server default
+    must be part of `columns`.
+    """
+    connection = await session.connection()
+    dialect = connection.dialect
+    if dialect.name != "postgresql" or dialect.driver != "asyncpg":
+        raise NotImplementedError(
+            f"COPY requires postgresql+asyncpg, not {dialect.name}+{dialect.driver}"
+        )
+
+    table = _table(model)
+    raw_connection = await connection.get_raw_connection()
+    driver_connection: Any = raw_connection.driver_connection
+
+    count = 0
+    for chunk in batched(rows, _chunk_size(chunk_size)):
+        await driver_connection.copy_records_to_table(
+            table.name,
+            records=[tuple(row[name] for name in columns) for row in chunk],
+            columns=list(columns),
+            schema_name=table.schema,
+        )
+        count += len(chunk)
+    return count
+
+
+__all__ = [
+    "build_upsert",
+    "bulk_insert",
+    "bulk_upsert",
+    "copy_insert",
+    "iter_insert",
+    "iter_upsert",
+]
@@ -0,0 +1,295 @@
+import hashlib
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import FrozenResult
+from sqlalchemy.orm import ORMExecuteState, Session, loading
+from sqlalchemy.sql.util import find_tables
+from sqlalchemy.util import LRUCache
+
+from zion_config.utils import import_attribute
+from zion_db.conf import settings
+from zion_db.session import TrackedSession
+
+
+# Execution option naming the region a `select()` is cached in
+CACHE_REGION = "cache_region"
+
+# Session info key with the tables written in the current transaction
+_WRITTEN_TABLES = "zion_cache_written_tables"
+
+
+class CacheBackend(metaclass=ABCMeta):
+    """Storage of a cache region.
+
+    Values are `FrozenResult` objects; backends shared between processes
+    have to serialize them, e.g. with `pickle`. Generation counters must not
+    be evicted before the entries, or stale entries would become valid again.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float | None) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_generations(self, tables: Sequence[str]) -> list[int]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def increment_generations(self, tables: Iterable[str]) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError()
+
+
+class MemoryBackend(CacheBackend):
+    """Process local LRU storage holding at most `max_size` entries."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float | None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_generations(self, tables: Sequence[str]) -> list[int]:
+        return [self._generations.get(table, 0) for table in tables]
+
+    def increment_generations(self, tables: Iterable[str]) -> None:
+        with self._lock:
+            for table in tables:
+                self._generations[table] = self._generations.get(table, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CacheRegion:
+    """Named cache of query results with its own TTL and storage.
+
+    Keys are built from the SQL string of the statement, its parameters and
+    the generation of every table it reads. Writing to a table increments its
+    generation, which makes every cached result reading it unreachable.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float | None,
+        backend: CacheBackend,
+        statement_cache_size: int | None = None,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        # SQL strings of the statements, by their structural cache key; an LRU
+        # like the compiled cache of the engine, so it doesn't grow with every
+        # distinct statement
+        self._statement_cache: LRUCache[Any, str] = LRUCache(
+            statement_cache_size or settings.DB_CACHE_STATEMENT_CACHE_SIZE
+        )
+
+    def make_key(self, state: ORMExecuteState, tables: Sequence[str]) -> str | None:
+        cache_key = state.statement._generate_cache_key()
+        if cache_key is None:
+            return None
+
+        statement_key = cache_key.to_offline_string(
+            self._statement_cache, state.statement, state.parameters or {}
+        )
+        generations = self.backend.get_generations(tables)
+        digest = hashlib.blake2b(
+            f"{statement_key}|{generations}".encode(), digest_size=16
+        )
+        return f"{self.name}:{digest.hexdigest()}"
+
+    def get(self, key: str) -> FrozenResult | None:
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: FrozenResult) -> None:
+        self.backend.set(key, value, self.ttl)
+
+    def invalidate(self, tables: Iterable[str]) -> None:
+        self.backend.increment_generations(tables)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+
+regions: dict[str, CacheRegion] = {}
+
+
+def configure_region(
+    name: str,
+    ttl: float | None = None,
+    max_size: int | None = None,
+    backend: CacheBackend | None = None,
+    statement_cache_size: int | None = None,
+) -> CacheRegion:
+    """Create, or replace, the cache region called `name`."""
+    if backend is None:
+        backend = MemoryBackend(max_size or settings.DB_CACHE_MAX_SIZE)
+    region = CacheRegion(
+        name,
+        ttl=settings.DB_CACHE_TTL if ttl is None else ttl,
+        backend=backend,
+        statement_cache_size=statement_cache_size,
+    )
+    regions[name] = region
+    return region
+
+
+def get_region(name: str) -> CacheRegion:
+    region = regions.get(name)
+    if region is not None:
+        return region
+
+    options = settings.DB_CACHE_REGIONS.get(name)
+    if options is None:
+        raise ValueError(f"Unknown cache region {name!r}")
+
+    options = dict(options)
+    if isinstance(options.get("backend"), str):
+        options["backend"] = import_attribute(options["backend"])()
+    return configure_region(name, **options)
+
+
+def invalidate_tables(tables: Iterable[str]) -> None:
+    """Drop the cached results reading any of `tables` from every region."""
+    tables = list(tables)
+    for region in regions.values():
+        region.invalidate(tables)
+
+
+@event.listens_for(TrackedSession, "do_orm_execute")
+def _cache_select(state: ORMExecuteState) -> Any:
+    """Serve `select()` statements with a `cache_region` option from cache.
+
+    ```python
+    countries = await session.scalars(
+        select(Country).execution_options(cache_region="reference")
+    )
+    ```
+    """
+    region_name = state.execution_options.get(CACHE_REGION)
+    if region_name is None or not state.is_select:
+        return None
+
+    tables = sorted({table.name for table in find_tables(state.statement)})
+    written = state.session.info.get(_WRITTEN_TABLES)
+    if written and not written.isdisjoint(tables):
+        # The transaction sees its own uncommitted writes, don't cache those
+        return None
+
+    region = get_region(region_name)
+    key = region.make_key(state, tables)
+    if key is None:
+        return None
+
+    frozen = region.get(key)
+    if frozen is None:
+        frozen = state.invoke_statement().freeze()
+        region.set(key, frozen)
+
+    return loading.merge_frozen_result(
+        state.session, state.statement, frozen, load=False
+    )()
+
+
+def _mark_written(session: Session, tables: Iterable[str]) -> None:
+    tables = set(tables)
+    if not tables:
+        return
+
+    session.info.setdefault(_WRITTEN_TABLES, set()).update(tables)
+    # Stop this session from reading results cached before its writes
+    invalidate_tables(tables)
+
+
+@event.listens_for(TrackedSession, "do_orm_execute")
+def _track_bulk_writes(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        _mark_written(
+            state.session,
+            (table.name for table in find_tables(state.statement, include_crud=True)),
+        )
+
+
+@event.listens_for(TrackedSession, "after_flush")
+def _track_flushed_writes(session: Session, _flush_context: Any) -> None:
+    _mark_written(
+        session,
+        (
+            table.name
+            for instance in (*session.new, *session.dirty, *session.deleted)
+            for table in inspect(instance).mapper.tables
+        ),
+    )
+
+
+@event.listens_for(TrackedSession, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    # Results cached by other sessions between the flush and the commit
+    # still hold the old rows
+    written = session.info.pop(_WRITTEN_TABLES, None)
+    if written:
+        invalidate_tables(written)
+
+
+@event.listens_for(TrackedSession, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    session.info.pop(_WRITTEN_TABLES, None)
+
+
+__all__ = [
+    "CACHE_REGION",
+    "CacheBackend",
+    "CacheRegion",
+    "MemoryBackend",
+    "configure_region",
+    "get_region",
+    "invalidate_tables",
+]
@@ -1,9 +1,82 @@
+from typing import Any
+
 from zion_config import AppConf, settings
 
 
 class Conf(AppConf):
     DATABASE_URI = ""
     MODEL_MODULES: list[str] = []
+    # Path of a manifest of the modules of MODEL_MODULES adding tables or
+    # models, refreshed when their files change. None imports every module
+    # of the packages on each run.
+    MODEL_MANIFEST: str | None = None
+    # Modules imported along with the manifest's, like those only
+    # registering event listeners
+    MODEL_EXTRA_MODULES: list[str] = []
+
+    # Connection pool, passed to `create_async_engine`. POOL_CLASS, a class or
+    # its dotted path, replaces the default pool of the dialect, e.g.
+    # "sqlalchemy.pool.NullPool". The sizes only apply to queue pools.
+    POOL_CLASS: str | type | None = None
+    POOL_SIZE = 5
+    MAX_OVERFLOW = 10
+    POOL_TIMEOUT = 30.0
+    POOL_RECYCLE = -1
+    POOL_PRE_PING = False
+    POOL_USE_LIFO = False
+    # Whether the `zion_db.pool` warm-up step opens POOL_SIZE connections
+    WARM_UP_POOL = True
+
+    # Seconds a statement may run before the database cancels it, None for
+    # no limit. A session can override it with `info["statement_timeout"]`.
+    STATEMENT_TIMEOUT: float | None = None
+
+    # Read replicas for `DbReadSessionDep`, they share the pool settings
+    REPLICA_URIS: list[str] = []
+    # Seconds a replica with failing connections is left out of the rotation
+    REPLICA_RETRY_AFTER = 30.0
+    # Seconds reads stay on the primary after a commit that wrote, 0 disables
+    READ_YOUR_WRITES_WINDOW = 0.0
+
+    # `zion_db.instrumentation`: statement timing on every engine, slow query
+    # log threshold in seconds (None disables it) and the number of repeats of
+    # a statement in one request reported as a possible N+1
+    QUERY_INSTRUMENTATION = True
+    SLOW_QUERY_THRESHOLD: float | None = 0.5
+    N_PLUS_ONE_THRESHOLD = 10
+
+    # `zion_db.cache` regions, e.g. {"reference": {"ttl": 600, "max_size": 200}}.
+    # A region's "backend" is a dotted path to a `CacheBackend` class.
+    CACHE_REGIONS: dict[str, dict[str, Any]] = {}
+    CACHE_TTL = 300.0
+    CACHE_MAX_SIZE = 1000
+    # SQL strings of the distinct cached statements kept per region
+    CACHE_STATEMENT_CACHE_SIZE = 500
+
+    # `PidMixin` generator: "nanoid", or the time ordered "ulid" or "uuid7"
+    PID_STRATEGY = "nanoid"
+
+    # Hide `SoftDeleteMixin` rows from ORM queries unless asked for
+    SOFT_DELETE_FILTER = True
+
+    # `zion_db.purge` soft deleted row retention
+    PURGE_RETENTION_DAYS = 30
+    PURGE_BATCH_SIZE = 500
+    PURGE_PAUSE = 0.1
+
+    # Alembic runs: seconds DDL may wait for a lock and a statement may run,
+    # and the `zion_db.migrations.backfill()` batches
+    MIGRATION_LOCK_TIMEOUT: float | None = 5.0
+    MIGRATION_STATEMENT_TIMEOUT: float | None = None
+    MIGRATION_BATCH_SIZE = 1000
+    MIGRATION_BATCH_PAUSE = 0.1
+
+    # Rows per statement for the `zion_db.bulk` helpers
+    BULK_CHUNK_SIZE = 1000
+
+    # `zion_db.pagination` defaults
+    PAGE_SIZE = 50
+    STREAM_FETCH_SIZE = 1000
 
     class Meta:
         prefix = "db"
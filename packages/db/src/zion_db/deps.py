@@ -3,6 +3,13 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from zion_db.engine import async_get_db
+from zion_db.engine import async_get_db, async_get_lazy_db, async_get_read_db
+from zion_db.session import LazySession
 
 DbSessionDep = Annotated[AsyncSession, Depends(async_get_db)]
+
+# Reads go to a replica, writes and reads after a write to the primary
+DbReadSessionDep = Annotated[AsyncSession, Depends(async_get_read_db)]
+
+# Released right after the path operation, before the response is sent
+DbLazySessionDep = Annotated[LazySession, Depends(async_get_lazy_db, scope="function")]
@@ -0,0 +1,178 @@
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import pkgutil
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from zion_db.base import DbBaseModel
+from zion_db.conf import settings
+from zion_logger import get_logger
+
+
+logger = get_logger(__name__)
+
+MANIFEST_VERSION = 2
+
+
+def import_models(package_name: str) -> None:
+    """Import every module of a package so its models register on the metadata.
+
+    A plain module is only imported.
+    """
+    package = importlib.import_module(package_name)
+    if not hasattr(package, "__path__"):
+        return
+
+    for _, module_name, _ in pkgutil.walk_packages(
+        package.__path__, package.__name__ + "."
+    ):
+        importlib.import_module(module_name)
+
+
+def _source_files(packages: list[str]) -> dict[str, tuple[int, int]]:
+    """`(mtime_ns, size)` of every Python file of the packages."""
+    files = {}
+    for package_name in packages:
+        spec = importlib.util.find_spec(package_name)
+        for location in (spec and spec.submodule_search_locations) or []:
+            for root, dirs, names in os.walk(location):
+                dirs[:] = [name for name in dirs if name != "__pycache__"]
+                for name in names:
+                    if name.endswith(".py"):
+                        path = os.path.join(root, name)
+                        stat = os.stat(path)
+                        files[path] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def _file_hash(path: str) -> str:
+    return hashlib.sha1(Path(path).read_bytes(), usedforsecurity=False).hexdigest()
+
+
+def _is_fresh(manifest: dict[str, Any], packages: list[str]) -> bool:
+    if manifest.get("version") != MANIFEST_VERSION:
+        return False
+    if manifest.get("packages") != packages:
+        return False
+
+    recorded = manifest.get("files", {})
+    current = _source_files(packages)
+    if current.keys() != recorded.keys():
+        return False
+
+    for path, (mtime, size) in current.items():
+        recorded_mtime, recorded_size, recorded_hash = recorded[path]
+        if size != recorded_size:
+            return False
+        # A checkout can touch files without changing them
+        if mtime != recorded_mtime and _file_hash(path) != recorded_hash:
+            return False
+    return True
+
+
+def read_manifest(path: str, packages: list[str]) -> list[str] | None:
+    """Model modules listed in the manifest, or None if it's missing or stale."""
+    try:
+        manifest = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(manifest, dict) or not _is_fresh(manifest, packages):
+        return None
+    return manifest["modules"]
+
+
+def _registrations() -> tuple[int, int]:
+    return len(DbBaseModel.metadata.tables), len(DbBaseModel.registry.mappers)
+
+
+def _import_recording(module_name: str, modules: list[str]) -> ModuleType:
+    """Import a module, recording it if it adds tables or maps models.
+
+    A module imported earlier can't be checked, so it's recorded as well.
+    """
+    imported = module_name in sys.modules
+    before = _registrations()
+    module = importlib.import_module(module_name)
+    if imported or _registrations() != before:
+        modules.append(module_name)
+    return module
+
+
+def _import_package_recording(package_name: str, modules: list[str]) -> None:
+    package = _import_recording(package_name, modules)
+    for _, module_name, is_package in pkgutil.iter_modules(
+        getattr(package, "__path__", []), package_name + "."
+    ):
+        if is_package:
+            _import_package_recording(module_name, modules)
+        else:
+            _import_recording(module_name, modules)
+
+
+def write_manifest(path: str, packages: list[str]) -> list[str]:
+    """Import the packages and record the modules registering on the metadata.
+
+    A module is recorded when importing it adds tables to
+    `DbBaseModel.metadata` or maps models. Modules only registering event
+    listeners can't be told apart, list them in `DB_MODEL_EXTRA_MODULES`.
+    """
+    recorded: list[str] = []
+    for package_name in packages:
+        _import_package_recording(package_name, recorded)
+    modules = sorted(set(recorded))
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "packages": packages,
+        "modules": modules,
+        "files": {
+            path: [mtime, size, _file_hash(path)]
+            for path, (mtime, size) in _source_files(packages).items()
+        },
+    }
+
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        Path(temporary).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+        os.replace(temporary, path)
+    except OSError as error:
+        logger.warning("Cannot write model manifest", path=path, error=str(error))
+    return modules
+
+
+def import_model_modules(packages: list[str] | None = None) -> None:
+    """Import the models of `DB_MODEL_MODULES`, or of the given packages.
+
+    With `DB_MODEL_MANIFEST` set, only the modules recorded in the manifest
+    are imported, along with `DB_MODEL_EXTRA_MODULES`. A missing or stale
+    manifest, one whose files were added, removed or changed, falls back to
+    importing every module of the packages and is written again.
+    """
+    packages = list(settings.DB_MODEL_MODULES if packages is None else packages)
+    manifest_path = settings.DB_MODEL_MANIFEST
+    if not manifest_path:
+        for package_name in packages:
+            import_models(package_name)
+        return
+
+    modules = read_manifest(manifest_path, packages)
+    if modules is None:
+        write_manifest(manifest_path, packages)
+        return
+
+    for module_name in [*modules, *settings.DB_MODEL_EXTRA_MODULES]:
+        importlib.import_module(module_name)
+
+
+__all__ = [
+    "import_model_modules",
+    "import_models",
+    "read_manifest",
+    "write_manifest",
+]
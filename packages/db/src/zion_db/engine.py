@@ -1,18 +1,248 @@
+import os
+import threading
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
 
+from zion_config.utils import import_attribute
+from zion_db import cache  # noqa: F401  # registers the session listeners
 from zion_db.conf import settings
+from zion_db.instrumentation import instrument_engine
+from zion_db.pool import MeteredAsyncAdaptedQueuePool, MeteredQueuePool
+from zion_db.routing import ROUTER_KEY, ReplicaRouter, RoutingSession
+from zion_db.session import LazySession, TrackedSession
+from zion_db.timeouts import install_statement_timeouts
+from zion_logger import get_logger
 
-async_engine = create_async_engine(settings.DB_DATABASE_URI, echo=False, future=True)
 
-local_session = async_sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+logger = get_logger(__name__)
+
+
+def get_pool_class(uri: str) -> type[Pool]:
+    """`DB_POOL_CLASS`, or the default pool of the dialect.
+
+    The default queue pools are replaced by their metered versions; other
+    pools, like the `StaticPool` of in-memory SQLite, are kept.
+    """
+    poolclass = settings.DB_POOL_CLASS
+    if poolclass is not None:
+        return import_attribute(poolclass) if isinstance(poolclass, str) else poolclass
+
+    url = make_url(uri)
+    poolclass = url.get_dialect(_is_async=True).get_pool_class(url)
+    if poolclass is AsyncAdaptedQueuePool:
+        return MeteredAsyncAdaptedQueuePool
+    if poolclass is QueuePool:
+        return MeteredQueuePool
+    return poolclass
+
+
+def get_engine_options(uri: str) -> dict[str, Any]:
+    poolclass = get_pool_class(uri)
+    options: dict[str, Any] = {
+        "echo": False,
+        "future": True,
+        "poolclass": poolclass,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    # Only queue pools are sized
+    if issubclass(poolclass, QueuePool):
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_use_lifo=settings.DB_POOL_USE_LIFO,
+        )
+    return options
+
+
+def create_engine(uri: str) -> AsyncEngine:
+    engine = create_async_engine(uri, **get_engine_options(uri))
+    if settings.DB_QUERY_INSTRUMENTATION:
+        instrument_engine(engine)
+    install_statement_timeouts(engine)
+    return engine
+
+
+class EngineRegistry:
+    """Creates the engine and the sessionmaker on first use.
+
+    Importing `zion_db` doesn't need a database URI or load the dialect;
+    both happen the first time a session or the engine is requested. Replica
+    engines are only created when a read session is first requested.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engine: AsyncEngine | None = None
+        self._sessionmaker: async_sessionmaker[AsyncSession] | None = None
+        self._router: ReplicaRouter | None = None
+        self._read_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+
+    @property
+    def is_initialized(self) -> bool:
+        return self._engine is not None
+
+    def get_engine(self) -> AsyncEngine:
+        engine = self._engine
+        if engine is None:
+            engine, _ = self._initialize()
+        return engine
+
+    def get_sessionmaker(self) -> async_sessionmaker[AsyncSession]:
+        maker = self._sessionmaker
+        if maker is None:
+            _, maker = self._initialize()
+        return maker
+
+    def get_router(self) -> ReplicaRouter | None:
+        if self._read_sessionmaker is None:
+            self._initialize_replicas()
+        return self._router
+
+    def get_read_sessionmaker(self) -> async_sessionmaker[AsyncSession]:
+        maker = self._read_sessionmaker
+        if maker is None:
+            maker = self._initialize_replicas()
+        return maker
+
+    async def dispose(self) -> None:
+        with self._lock:
+            engine = self._engine
+            router = self._router
+            self._engine = None
+            self._sessionmaker = None
+            self._router = None
+            self._read_sessionmaker = None
+
+        if engine is not None:
+            await engine.dispose()
+        if router is not None:
+            for replica in router.replicas:
+                await replica.dispose()
+
+    def reset_after_fork(self) -> None:
+        """Drop the connection pools inherited from the parent process.
+
+        Pooled connections belong to the parent, so they're abandoned without
+        being closed; the child opens its own on first use. Engines, and their
+        compiled statement caches, are kept.
+        """
+        self._lock = threading.Lock()
+
+        engines = [self._engine] if self._engine is not None else []
+        if self._router is not None:
+            self._router.reset_after_fork()
+            engines.extend(self._router.replicas)
+
+        for engine in engines:
+            engine.sync_engine.dispose(close=False)
+
+    def _initialize(
+        self,
+    ) -> tuple[AsyncEngine, async_sessionmaker[AsyncSession]]:
+        with self._lock:
+            if self._engine is not None and self._sessionmaker is not None:
+                return self._engine, self._sessionmaker
+
+            engine = create_engine(settings.DB_DATABASE_URI)
+            maker = async_sessionmaker(
+                bind=engine,
+                class_=AsyncSession,
+                sync_session_class=TrackedSession,
+                expire_on_commit=False,
+            )
+            self._engine, self._sessionmaker = engine, maker
+            return engine, maker
+
+    def _initialize_replicas(self) -> async_sessionmaker[AsyncSession]:
+        engine, maker = self._initialize()
+
+        with self._lock:
+            if self._read_sessionmaker is not None:
+                return self._read_sessionmaker
+
+            if not settings.DB_REPLICA_URIS:
+                # Without replicas, read sessions are regular sessions
+                self._read_sessionmaker = maker
+                return maker
+
+            router = ReplicaRouter(
+                primary=engine,
+                replicas=[create_engine(uri) for uri in settings.DB_REPLICA_URIS],
+                retry_after=settings.DB_REPLICA_RETRY_AFTER,
+                read_your_writes=settings.DB_READ_YOUR_WRITES_WINDOW,
+            )
+            read_maker = async_sessionmaker(
+                bind=engine,
+                class_=AsyncSession,
+                sync_session_class=RoutingSession,
+                expire_on_commit=False,
+                info={ROUTER_KEY: router},
+            )
+            self._router, self._read_sessionmaker = router, read_maker
+            return read_maker
+
+
+registry = EngineRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=registry.reset_after_fork)
+
+
+def get_engine() -> AsyncEngine:
+    return registry.get_engine()
+
+
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return registry.get_sessionmaker()
+
+
+def get_read_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return registry.get_read_sessionmaker()
+
+
+async def dispose_engine() -> None:
+    await registry.dispose()
 
 
 async def async_get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with local_session() as db:
+    async with registry.get_sessionmaker()() as db:
+        yield db
+
+
+async def async_get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    async with registry.get_read_sessionmaker()() as db:
         yield db
+
+
+async def async_get_lazy_db() -> AsyncGenerator[LazySession, None]:
+    lazy_session = LazySession(registry.get_sessionmaker())
+    try:
+        yield lazy_session
+    finally:
+        await lazy_session.close()
+        if lazy_session.timer.checkouts:
+            await logger.adebug(
+                "Database connection released",
+                checkouts=lazy_session.timer.checkouts,
+                checkout_ms=round(lazy_session.checkout_time * 1000, 3),
+            )
+
+
+def __getattr__(name: str):
+    # `async_engine` and `local_session` used to be created at import time
+    if name == "async_engine":
+        return registry.get_engine()
+    if name == "local_session":
+        return registry.get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
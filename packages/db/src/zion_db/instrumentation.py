@@ -0,0 +1,223 @@
+import asyncio
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from zion_db.conf import settings
+from zion_db.pool import CHECKOUT_WAIT_KEY
+from zion_logger import get_logger
+
+
+logger = get_logger(__name__)
+
+_STARTED_AT = "_zion_started_at"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize_sql(statement: str) -> str:
+    """Statement with literals and placeholders replaced by `?`.
+
+    Statements differing only in their values, or in the length of an `IN`
+    list, normalize to the same string.
+    """
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER_LIST.sub("(...)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+@dataclass(frozen=True, slots=True)
+class SlowQuery:
+    statement: str
+    duration: float
+    rows: int
+    pool_wait: float
+
+
+def log_slow_query(query: SlowQuery) -> None:
+    logger.warning(
+        "Slow query",
+        statement=normalize_sql(query.statement),
+        duration_ms=round(query.duration * 1000, 3),
+        rows=query.rows,
+        pool_wait_ms=round(query.pool_wait * 1000, 3),
+    )
+
+
+class QueryStats:
+    """Statements run while a `track_queries()` block is active."""
+
+    def __init__(self):
+        self.count = 0
+        self.rows = 0
+        self.total_time = 0.0
+        self.pool_wait = 0.0
+        self.statements: Counter[str] = Counter()
+        self.slow_queries: list[SlowQuery] = []
+
+    def record(self, statement: str, duration: float, rows: int, pool_wait: float):
+        self.count += 1
+        self.rows += rows
+        self.total_time += duration
+        self.pool_wait += pool_wait
+        self.statements[statement] += 1
+
+    def repeated_statements(
+        self, threshold: int | None = None
+    ) -> list[tuple[str, int]]:
+        """Normalized statements run at least `threshold` times, a N+1 sign."""
+        threshold = threshold or settings.DB_N_PLUS_ONE_THRESHOLD
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "zion_query_stats", default=None
+)
+
+
+def get_query_stats() -> QueryStats | None:
+    return _query_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the statements run in this block, e.g. during a request.
+
+    Slow queries of the block are logged when it ends.
+    """
+    stats = QueryStats()
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+        for query in stats.slow_queries:
+            log_slow_query(query)
+
+
+def _before_cursor_execute(
+    _conn: Connection,
+    _cursor: Any,
+    _statement: str,
+    _parameters: Any,
+    context: Any,
+    _executemany: bool,
+) -> None:
+    setattr(context, _STARTED_AT, time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    _parameters: Any,
+    context: Any,
+    _executemany: bool,
+) -> None:
+    duration = time.perf_counter() - getattr(context, _STARTED_AT)
+    # Charge the checkout wait to the first statement on the connection
+    pool_wait = conn.info.pop(CHECKOUT_WAIT_KEY, 0.0)
+
+    stats = _query_stats.get()
+    threshold = settings.DB_SLOW_QUERY_THRESHOLD
+    if stats is None and (threshold is None or duration < threshold):
+        return
+
+    rows = max(cursor.rowcount, 0)
+    if stats is not None:
+        stats.record(normalize_sql(statement), duration, rows, pool_wait)
+
+    if threshold is not None and duration >= threshold:
+        query = SlowQuery(statement, duration, rows, pool_wait)
+        if stats is not None:
+            stats.slow_queries.append(query)
+        else:
+            _defer_log(query)
+
+
+def _defer_log(query: SlowQuery) -> None:
+    # Log once the running statement's caller got its result, not in the
+    # middle of the execution being measured
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        log_slow_query(query)
+    else:
+        loop.call_soon(log_slow_query, query)
+
+
+def instrument_engine(engine: AsyncEngine | Engine) -> None:
+    """Time the statements of an engine.
+
+    Without an active `track_queries()` block, statements under
+    `DB_SLOW_QUERY_THRESHOLD` only cost two `perf_counter()` calls and a
+    few attribute lookups. Slow queries are logged after the statement:
+    at the end of the `track_queries()` block, or on the next iteration of
+    the event loop.
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryTrackingMiddleware:
+    """ASGI middleware tracking the statements of every HTTP request.
+
+    Logs the slow queries of a request once it's done, and a warning when a
+    normalized statement runs at least `DB_N_PLUS_ONE_THRESHOLD` times in it.
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            await self.app(scope, receive, send)
+
+        for statement, count in stats.repeated_statements():
+            await logger.awarning(
+                "Possible N+1 query",
+                path=scope["path"],
+                statement=statement,
+                count=count,
+                queries=stats.count,
+            )
+
+
+__all__ = [
+    "QueryStats",
+    "QueryTrackingMiddleware",
+    "SlowQuery",
+    "get_query_stats",
+    "instrument_engine",
+    "normalize_sql",
+    "track_queries",
+]
@@ -0,0 +1,127 @@
+import asyncio
+import gc
+import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from sqlalchemy.orm import configure_mappers
+
+from zion_db.conf import settings
+from zion_db.discovery import import_model_modules
+from zion_db.engine import dispose_engine, get_engine
+from zion_logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def preload(freeze: bool = True) -> None:
+    """Prepare the database layer in the parent of a preforking server.
+
+    Imports `DB_MODEL_MODULES`, configures the mappers and creates the engine
+    without connecting, so every worker shares them copy-on-write instead of
+    building its own. Forked workers drop the inherited pool and connect on
+    first use. With `freeze`, the objects created so far are moved out of
+    the garbage collector's reach, so collections in the workers don't touch,
+    and copy, their memory pages.
+
+    Call it from the app module loaded with `--preload`, or from gunicorn's
+    `on_starting` hook.
+    """
+    started = time.perf_counter()
+    import_model_modules()
+    configure_mappers()
+    get_engine()
+    if freeze:
+        gc.freeze()
+
+    logger.info(
+        "Database preloaded",
+        pid=os.getpid(),
+        preload_ms=round((time.perf_counter() - started) * 1000, 2),
+    )
+
+
+async def open_connections(count: int) -> int:
+    """Open `count` pooled connections at once and return them to the pool.
+
+    The connections are checked out concurrently so the pool ends up with
+    `count` distinct, established connections instead of reusing one.
+    """
+    if count <= 0:
+        return 0
+
+    engine = get_engine()
+    connections = [engine.connect() for _ in range(count)]
+    try:
+        await asyncio.gather(*(connection.start() for connection in connections))
+    finally:
+        await asyncio.gather(
+            *(connection.close() for connection in connections),
+            return_exceptions=True,
+        )
+    return count
+
+
+async def warm_up(connections: int | None = None) -> None:
+    """Configure the mappers and fill the pool before serving traffic.
+
+    By default the pool is filled up to `DB_POOL_SIZE`.
+    """
+    if connections is None:
+        connections = settings.DB_POOL_SIZE
+
+    started = time.perf_counter()
+    configure_mappers()
+    mappers_done = time.perf_counter()
+
+    opened = await open_connections(connections)
+    finished = time.perf_counter()
+
+    await logger.ainfo(
+        "Database warm-up completed",
+        connections=opened,
+        configure_mappers_ms=round((mappers_done - started) * 1000, 2),
+        open_connections_ms=round((finished - mappers_done) * 1000, 2),
+    )
+
+
+def configure_models() -> None:
+    """Warm-up step importing `DB_MODEL_MODULES` and configuring the mappers."""
+    import_model_modules()
+    configure_mappers()
+
+
+async def fill_pool() -> None:
+    """Warm-up step opening `DB_POOL_SIZE` connections, if `DB_WARM_UP_POOL`."""
+    if settings.DB_WARM_UP_POOL:
+        await open_connections(settings.DB_POOL_SIZE)
+
+
+@asynccontextmanager
+async def db_lifespan(
+    _app: Any = None, connections: int | None = None
+) -> AsyncIterator[None]:
+    """FastAPI lifespan warming up the database and disposing the pool on exit.
+
+    ```python
+    app = FastAPI(lifespan=db_lifespan)
+    ```
+    """
+    await warm_up(connections)
+    try:
+        yield
+    finally:
+        await dispose_engine()
+
+
+__all__ = [
+    "configure_models",
+    "db_lifespan",
+    "fill_pool",
+    "open_connections",
+    "preload",
+    "warm_up",
+]
@@ -1,6 +1,4 @@
 import asyncio
-import importlib
-import pkgutil
 from logging.config import fileConfig
 
 from alembic import context
@@ -10,6 +8,8 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from zion_db.base import DbBaseModel
 from zion_db.conf import settings
+from zion_db.discovery import import_model_modules
+from zion_db.migrations import apply_timeouts, check_dry_run, is_dry_run
 
 # This is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -21,16 +21,7 @@ if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
 
-def import_models(package_name: str):
-    package = importlib.import_module(package_name)
-    for _, module_name, _ in pkgutil.walk_packages(
-        package.__path__, package.__name__ + "."
-    ):
-        importlib.import_module(module_name)
-
-
-for db_model in settings.DB_MODEL_MODULES:
-    import_models(db_model)
+import_model_modules()
 
 target_metadata = DbBaseModel.metadata
 
@@ -56,7 +47,32 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    dry_run = is_dry_run()
+    if dry_run:
+        check_dry_run(connection.dialect)
+    # One transaction per migration, so locks are released between them and
+    # `zion_db.migrations` helpers can step out of it
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        transaction_per_migration=not dry_run,
+        # A dry run is a single transaction that's rolled back
+        transactional_ddl=True if dry_run else None,
+    )
+    apply_timeouts(
+        connection,
+        lock_timeout=settings.DB_MIGRATION_LOCK_TIMEOUT,
+        statement_timeout=settings.DB_MIGRATION_STATEMENT_TIMEOUT,
+    )
+    # Session settings outlive the transaction they autobegan
+    if connection.in_transaction():
+        connection.commit()
+
+    if dry_run:
+        with connection.begin() as transaction:
+            context.run_migrations()
+            transaction.rollback()
+        return
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,277 @@
+"""Helpers for migrations that run against a database serving traffic.
+
+```python
+from sqlalchemy import column, true
+
+from zion_db import migrations
+
+
+def upgrade() -> None:
+    migrations.set_timeouts(lock_timeout=2)
+    migrations.create_index_concurrently("ix_user_email", "user", ["email"])
+    migrations.backfill(
+        "user", {"is_active": true()}, where=column("is_active").is_(None)
+    )
+```
+
+Run `alembic -x dry_run=1 upgrade head` to log how many rows every helper
+would touch. Plain `op` calls still run, inside a transaction that's rolled
+back at the end, so dry runs are refused on databases whose DDL commits
+implicitly, like MySQL, MariaDB and SQLite.
+"""
+
+import time
+from collections.abc import Sequence
+from typing import Any
+
+from alembic import context, op
+from alembic.ddl.impl import DefaultImpl
+from alembic.util import CommandError
+from sqlalchemy import ColumnElement, TableClause, column, func, select, text, update
+from sqlalchemy.engine import Connection, Dialect
+from sqlalchemy.sql import table as table_clause
+
+from zion_db.conf import settings
+from zion_logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def is_dry_run() -> bool:
+    value = context.get_x_argument(as_dictionary=True).get("dry_run", "")
+    return value.lower() in ("1", "true", "yes")
+
+
+def check_dry_run(dialect: Dialect) -> None:
+    """Refuse dry runs where rolling back the migration transaction keeps the DDL."""
+    if not DefaultImpl.get_by_dialect(dialect).transactional_ddl:
+        raise CommandError(
+            f"Dry runs need transactional DDL, which {dialect.name} doesn't have"
+        )
+
+
+def apply_timeouts(
+    connection: Connection,
+    lock_timeout: float | None = None,
+    statement_timeout: float | None = None,
+    local: bool = False,
+) -> None:
+    """Limit how long DDL waits for locks and how long statements run.
+
+    With `local`, the Postgres timeouts only last until the end of the
+    current transaction. MySQL and MariaDB have no transaction scoped
+    variant, so they're always set for the session.
+    """
+    dialect = connection.dialect
+    scope = "LOCAL" if local else "SESSION"
+
+    if dialect.name == "postgresql":
+        if lock_timeout is not None:
+            connection.exec_driver_sql(
+                f"SET {scope} lock_timeout = {int(lock_timeout * 1000)}"
+            )
+        if statement_timeout is not None:
+            connection.exec_driver_sql(
+                f"SET {scope} statement_timeout = {int(statement_timeout * 1000)}"
+            )
+    elif dialect.name == "mysql":
+        if lock_timeout is not None:
+            connection.exec_driver_sql(
+                f"SET SESSION lock_wait_timeout = {max(int(lock_timeout), 1)}"
+            )
+        if statement_timeout is not None:
+            if getattr(dialect, "is_mariadb", False):
+                connection.exec_driver_sql(
+                    f"SET SESSION max_statement_time = {statement_timeout}"
+                )
+            else:
+                connection.exec_driver_sql(
+                    f"SET SESSION max_execution_time = {int(statement_timeout * 1000)}"
+                )
+
+
+def set_timeouts(
+    lock_timeout: float | None = None, statement_timeout: float | None = None
+) -> None:
+    """Override `DB_MIGRATION_*_TIMEOUT` for the running migration only."""
+    apply_timeouts(op.get_bind(), lock_timeout, statement_timeout, local=True)
+
+
+def _as_table(table: str | TableClause, *columns: str) -> Any:
+    if isinstance(table, TableClause):
+        return table
+    return table_clause(table, *(column(name) for name in columns))
+
+
+def estimate_rows(
+    table: str | TableClause, where: ColumnElement[bool] | None = None
+) -> int:
+    """Rows a step would touch; the planner estimate for whole Postgres tables."""
+    connection = op.get_bind()
+    target = _as_table(table)
+
+    if where is None and connection.dialect.name == "postgresql":
+        estimate = connection.scalar(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:t)"),
+            {"t": target.name},
+        )
+        if estimate is not None and estimate >= 0:
+            return estimate
+
+    statement = select(func.count()).select_from(target)
+    if where is not None:
+        statement = statement.where(where)
+    return connection.scalar(statement) or 0
+
+
+def _log_estimate(
+    step: str, table: str | TableClause, rows: int, **kwargs: Any
+) -> None:
+    logger.info(
+        "Migration dry run",
+        step=step,
+        table=_as_table(table).name,
+        estimated_rows=rows,
+        **kwargs,
+    )
+
+
+def create_index_concurrently(
+    index_name: str,
+    table: str,
+    columns: Sequence[str],
+    unique: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Build an index without blocking writes to the table.
+
+    On Postgres the index is built with `CREATE INDEX CONCURRENTLY` outside the
+    migration transaction. Other databases get a regular `CREATE INDEX`.
+    """
+    if is_dry_run():
+        _log_estimate("create_index", table, estimate_rows(table), index=index_name)
+        return
+
+    if op.get_bind().dialect.name != "postgresql":
+        op.create_index(index_name, table, list(columns), unique=unique, **kwargs)
+        return
+
+    with context.get_context().autocommit_block():
+        if _is_invalid_index(index_name, kwargs.get("schema")):
+            # Left behind by a failed build; `IF NOT EXISTS` would keep it
+            logger.warning("Rebuilding invalid index", index=index_name)
+            op.drop_index(
+                index_name,
+                table_name=table,
+                schema=kwargs.get("schema"),
+                postgresql_concurrently=True,
+            )
+        op.create_index(
+            index_name,
+            table,
+            list(columns),
+            unique=unique,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+            **kwargs,
+        )
+
+
+def _is_invalid_index(index_name: str, schema: str | None = None) -> bool:
+    name = f"{schema}.{index_name}" if schema else index_name
+    valid = op.get_bind().scalar(
+        text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+        {"name": name},
+    )
+    return valid is False
+
+
+def drop_index_concurrently(index_name: str, table: str) -> None:
+    if is_dry_run():
+        _log_estimate("drop_index", table, 0, index=index_name)
+        return
+
+    if op.get_bind().dialect.name != "postgresql":
+        op.drop_index(index_name, table_name=table)
+        return
+
+    with context.get_context().autocommit_block():
+        op.drop_index(
+            index_name, table_name=table, postgresql_concurrently=True, if_exists=True
+        )
+
+
+def backfill(
+    table: str | TableClause,
+    values: dict[str, Any],
+    where: ColumnElement[bool] | None = None,
+    key: str = "id",
+    batch_size: int | None = None,
+    pause: float | None = None,
+) -> int:
+    """Update a large table in short batches, outside the migration transaction.
+
+    Rows are walked in `key` order, which must be unique and indexed, and
+    every batch is its own autocommitted `UPDATE` covering a key range,
+    followed by `pause` seconds of sleep. Each batch only holds its row
+    locks briefly, and replicas get time to catch up.
+
+    Returns the number of updated rows.
+    """
+    batch_size = batch_size or settings.DB_MIGRATION_BATCH_SIZE
+    pause = settings.DB_MIGRATION_BATCH_PAUSE if pause is None else pause
+    target = _as_table(table, key, *values)
+    key_column = target.c[key]
+
+    if is_dry_run():
+        rows = estimate_rows(target, where)
+        _log_estimate("backfill", target, rows, batches=-(-rows // batch_size))
+        return rows
+
+    find_upper = select(key_column).order_by(key_column).limit(batch_size)
+    if where is not None:
+        find_upper = find_upper.where(where)
+
+    updated = 0
+    last_key = None
+    with context.get_context().autocommit_block():
+        connection = op.get_bind()
+        while True:
+            batch = find_upper
+            if last_key is not None:
+                batch = batch.where(key_column > last_key)
+            upper = connection.scalar(select(func.max(batch.subquery().c[key])))
+            if upper is None:
+                break
+
+            statement = update(target).where(key_column <= upper).values(values)
+            if last_key is not None:
+                statement = statement.where(key_column > last_key)
+            if where is not None:
+                statement = statement.where(where)
+
+            updated += connection.execute(statement).rowcount
+            last_key = upper
+            logger.info(
+                "Backfilled batch",
+                table=target.name,
+                last_key=last_key,
+                total_rows=updated,
+            )
+            if pause:
+                time.sleep(pause)
+
+    return updated
+
+
+__all__ = [
+    "apply_timeouts",
+    "backfill",
+    "check_dry_run",
+    "create_index_concurrently",
+    "drop_index_concurrently",
+    "estimate_rows",
+    "is_dry_run",
+    "set_timeouts",
+]
@@ -1,9 +1,14 @@
 import datetime as dt
 
-from nanoid import generate
-from sqlalchemy import Boolean, DateTime, String
+from sqlalchemy import Boolean, DateTime, Index, String, column, false
 from sqlalchemy.orm import Mapped, MappedAsDataclass, mapped_column
 
+from zion_db.conf import settings
+from zion_db.pid import get_pid_generator
+
+
+_generate_pid = get_pid_generator(settings.DB_PID_STRATEGY)
+
 
 class IdMixin(MappedAsDataclass):
     id: Mapped[int] = mapped_column(
@@ -18,27 +23,47 @@ class PidMixin(MappedAsDataclass):
 
     The incremental integer primary keys might cause security vulnerabilities
     since they are easily guessable.
+
+    The `DB_PID_STRATEGY` setting selects the generator: random `nanoid`
+    (default), or time ordered `ulid` or `uuid7`, which keep inserts into
+    the unique index sequential. The column length isn't limited, whatever
+    the strategy; `zion_db.pid.PID_LENGTHS` has the width of each one.
     """
 
     pid: Mapped[str] = mapped_column(
         String,
-        default_factory=lambda: generate(),
+        default_factory=_generate_pid,
+        insert_default=_generate_pid,
         unique=True,
         init=False,
     )
 
 
+def utcnow() -> dt.datetime:
+    return dt.datetime.now(dt.UTC)
+
+
 class TimestampMixin(MappedAsDataclass):
+    """Creation and update timestamps
+
+    The timestamps are always set in Python, also for bulk inserts that
+    leave the columns out, so every row stores them in the same format.
+    Database clocks, like SQLite's second precision `now()`, would store
+    values that don't compare correctly with the Python ones.
+    """
+
     created_at: Mapped[dt.datetime] = mapped_column(
         DateTime(timezone=True),
-        default_factory=lambda: dt.datetime.now(dt.UTC),
+        default_factory=utcnow,
+        insert_default=utcnow,
         init=False,
     )
 
     updated_at: Mapped[dt.datetime] = mapped_column(
         DateTime(timezone=True),
-        default_factory=lambda: dt.datetime.now(dt.UTC),
-        onupdate=lambda: dt.datetime.now(dt.UTC),
+        default_factory=utcnow,
+        insert_default=utcnow,
+        onupdate=utcnow,
         init=False,
     )
 
@@ -60,3 +85,26 @@ class SoftDeleteMixin(MappedAsDataclass):
     def soft_delete(self) -> None:
         self.is_deleted = True
         self.deleted_at = dt.datetime.now(dt.UTC)
+
+
+def soft_delete_index(name: str, *columns: str, unique: bool = False) -> Index:
+    """Partial index over the rows that are not soft deleted.
+
+    Deleted rows are left out of the index, so it stays small as they pile up,
+    and a unique index lets a value be reused after its row is deleted. On
+    databases without partial indexes it's a regular index.
+
+    ```python
+    class User(IdMixin, SoftDeleteMixin, DbBaseModel):
+        __tablename__ = "users"
+        __table_args__ = (soft_delete_index("ix_users_email", "email", unique=True),)
+    ```
+    """
+    where = column("is_deleted") == false()
+    return Index(
+        name,
+        *columns,
+        unique=unique,
+        postgresql_where=where,
+        sqlite_where=where,
+    )
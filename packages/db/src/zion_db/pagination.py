@@ -0,0 +1,174 @@
+import base64
+import binascii
+import datetime as dt
+import json
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Select, UnaryExpression, bindparam, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from zion_db.conf import settings
+
+
+KeysetColumns = Sequence[InstrumentedAttribute]
+
+
+@dataclass(frozen=True, slots=True)
+class Page[T]:
+    items: list[T]
+    next_cursor: str | None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+def keyset_by_id(model: Any) -> KeysetColumns:
+    """Keyset for models using `IdMixin`."""
+    return (model.id,)
+
+
+def keyset_by_created_at(model: Any) -> KeysetColumns:
+    """Keyset for models using `IdMixin` and `TimestampMixin`."""
+    return (model.created_at, model.id)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = [
+        value.isoformat() if isinstance(value, dt.datetime) else value
+        for value in values
+    ]
+    data = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, keys: KeysetColumns) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+    if not isinstance(payload, list) or len(payload) != len(keys):
+        raise ValueError("Invalid pagination cursor")
+
+    values = []
+    for key, value in zip(keys, payload, strict=True):
+        if isinstance(value, str) and key.type.python_type is dt.datetime:
+            value = dt.datetime.fromisoformat(value)
+        values.append(value)
+    return values
+
+
+def _check_ordering(statement: Select, keys: KeysetColumns) -> None:
+    if statement._order_by_clauses:
+        raise ValueError(
+            "paginate() orders the rows by the keys, remove the ORDER BY of the "
+            "statement"
+        )
+    for key in keys:
+        if isinstance(key, UnaryExpression):
+            raise ValueError(
+                f"Pass {key} as a plain column, all keys are sorted in the "
+                "direction given by `descending`"
+            )
+
+
+async def paginate[T](
+    session: AsyncSession,
+    statement: Select[tuple[T]],
+    keys: KeysetColumns,
+    cursor: str | None = None,
+    limit: int | None = None,
+    descending: bool = False,
+) -> Page[T]:
+    """Seek pagination over an entity `select()`.
+
+    Rows are ordered by `keys`, which must be unique together, and the next
+    page starts right after the last key of the previous one. Every page costs
+    the same regardless of its depth, unlike `OFFSET`.
+
+    ```python
+    page = await paginate(session, select(User), keyset_by_id(User), cursor)
+    ```
+
+    A single row comparison only seeks correctly when every key is sorted
+    in the same direction, so a statement with its own `ORDER BY`, or keys
+    with their own direction, raise `ValueError`.
+    """
+    _check_ordering(statement, keys)
+    limit = limit or settings.DB_PAGE_SIZE
+
+    if cursor is not None:
+        values = decode_cursor(cursor, keys)
+        # Bound with the column types, so the values are stored and compared
+        # in the same format as the column
+        row_key = tuple_(*keys)
+        cursor_key = tuple_(
+            *(
+                bindparam(None, value, type_=key.type)
+                for key, value in zip(keys, values, strict=True)
+            )
+        )
+        statement = statement.where(
+            row_key < cursor_key if descending else row_key > cursor_key
+        )
+
+    order_by = [key.desc() if descending else key.asc() for key in keys]
+    statement = statement.order_by(*order_by).limit(limit + 1)
+
+    items = list((await session.scalars(statement)).all())
+    if len(items) <= limit:
+        return Page(items=items, next_cursor=None)
+
+    items = items[:limit]
+    last = items[-1]
+    next_cursor = encode_cursor([getattr(last, key.key) for key in keys])
+    return Page(items=items, next_cursor=next_cursor)
+
+
+async def stream_scalars[T](
+    session: AsyncSession,
+    statement: Select[tuple[T]],
+    fetch_size: int | None = None,
+) -> AsyncIterator[T]:
+    """Iterate over a query with a server-side cursor.
+
+    Only `fetch_size` rows are buffered at a time, so exporting a whole table
+    runs in constant memory.
+    """
+    statement = statement.execution_options(
+        yield_per=fetch_size or settings.DB_STREAM_FETCH_SIZE
+    )
+    result = await session.stream_scalars(statement)
+    async for item in result:
+        yield item
+
+
+async def stream_chunks[T](
+    session: AsyncSession,
+    statement: Select[tuple[T]],
+    fetch_size: int | None = None,
+) -> AsyncIterator[Sequence[T]]:
+    """Like `stream_scalars()`, but yields lists of up to `fetch_size` items."""
+    statement = statement.execution_options(
+        yield_per=fetch_size or settings.DB_STREAM_FETCH_SIZE
+    )
+    result = await session.stream_scalars(statement)
+    async for partition in result.partitions():
+        yield partition
+
+
+__all__ = [
+    "Page",
+    "decode_cursor",
+    "encode_cursor",
+    "keyset_by_created_at",
+    "keyset_by_id",
+    "paginate",
+    "stream_chunks",
+    "stream_scalars",
+]
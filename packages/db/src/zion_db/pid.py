@@ -0,0 +1,128 @@
+import base64
+import os
+import threading
+import time
+from collections.abc import Callable
+
+from nanoid import generate
+
+
+CROCKFORD_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_BASE32_TO_CROCKFORD = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567", CROCKFORD_ALPHABET.encode()
+)
+
+# Width of the generated strings, used for the `pid` column length
+PID_LENGTHS = {
+    "ulid": 26,
+    "uuid7": 36,
+    "nanoid": 21,
+}
+
+
+class MonotonicGenerator:
+    """Time ordered identifiers that also sort correctly within a millisecond.
+
+    The first id of a millisecond gets random bits; the following ones in the
+    same millisecond increment them by one, as the ULID spec and RFC 9562
+    (method 2) describe. Ids are strictly increasing per process, which keeps
+    B-tree inserts at the right edge of the index even in bulk.
+    """
+
+    timestamp_bits = 48
+
+    def __init__(self, random_bits: int):
+        self.random_bits = random_bits
+        self._max_random = (1 << random_bits) - 1
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def next_value(self) -> tuple[int, int]:
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                # Leave headroom so increments rarely overflow
+                self._last_random = int.from_bytes(
+                    os.urandom((self.random_bits + 7) // 8)
+                ) & (self._max_random >> 1)
+            elif self._last_random < self._max_random:
+                self._last_random += 1
+            else:
+                # Overflow or a clock going backwards: borrow the next ms
+                self._last_ms += 1
+                self._last_random = 0
+            return self._last_ms, self._last_random
+
+    def reset(self) -> None:
+        # A forked child must not continue the sequence of its parent
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+
+class UlidGenerator(MonotonicGenerator):
+    def __init__(self):
+        super().__init__(random_bits=80)
+
+    def __call__(self) -> str:
+        timestamp, randomness = self.next_value()
+        value = (timestamp << self.random_bits) | randomness
+        # 26 characters cover 130 bits; left align the 128 bit value in 17
+        # bytes so the standard base32 groups line up with the ULID ones.
+        encoded = base64.b32encode((value << 6).to_bytes(17))
+        return encoded.translate(_BASE32_TO_CROCKFORD)[:26].decode()
+
+
+class Uuid7Generator(MonotonicGenerator):
+    def __init__(self):
+        # 12 bits of rand_a and 62 bits of rand_b
+        super().__init__(random_bits=74)
+
+    def __call__(self) -> str:
+        timestamp, randomness = self.next_value()
+        rand_a = randomness >> 62
+        rand_b = randomness & ((1 << 62) - 1)
+        value = (timestamp << 80) | (0x7 << 76) | (rand_a << 64) | (0b10 << 62) | rand_b
+        hex_value = f"{value:032x}"
+        return (
+            f"{hex_value[:8]}-{hex_value[8:12]}-{hex_value[12:16]}-"
+            f"{hex_value[16:20]}-{hex_value[20:]}"
+        )
+
+
+def nanoid() -> str:
+    return generate()
+
+
+ulid = UlidGenerator()
+uuid7 = Uuid7Generator()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=ulid.reset)
+    os.register_at_fork(after_in_child=uuid7.reset)
+
+GENERATORS: dict[str, Callable[[], str]] = {
+    "ulid": ulid,
+    "uuid7": uuid7,
+    "nanoid": nanoid,
+}
+
+
+def get_pid_generator(strategy: str) -> Callable[[], str]:
+    try:
+        return GENERATORS[strategy]
+    except KeyError:
+        raise ValueError(
+            f"Unknown pid strategy {strategy!r}, use one of: {', '.join(GENERATORS)}"
+        ) from None
+
+
+__all__ = [
+    "PID_LENGTHS",
+    "get_pid_generator",
+    "nanoid",
+    "ulid",
+    "uuid7",
+]
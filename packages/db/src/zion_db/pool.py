@@ -0,0 +1,132 @@
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+# Connection info key holding the wait of the latest checkout
+CHECKOUT_WAIT_KEY = "zion_checkout_wait"
+
+
+class CheckoutStats:
+    """Checkout wait time totals of a single pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_wait += wait
+            if wait > self.max_wait:
+                self.max_wait = wait
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+
+class MeteredPoolMixin:
+    """Measures how long `Pool.connect()` waits for a connection.
+
+    The measured time includes waiting for a free connection, opening a new
+    one in overflow and the pre-ping, which is the time a request is blocked
+    before it can run its first statement.
+    """
+
+    checkout_stats: CheckoutStats
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = CheckoutStats()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.checkout_stats.record_timeout()
+            raise
+        wait = time.perf_counter() - started
+        self.checkout_stats.record(wait)
+        connection.info[CHECKOUT_WAIT_KEY] = wait
+        return connection
+
+
+class MeteredQueuePool(MeteredPoolMixin, QueuePool):
+    pass
+
+
+class MeteredAsyncAdaptedQueuePool(MeteredPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    checkout_timeouts: int
+    checkout_wait_total: float
+    checkout_wait_max: float
+
+    @property
+    def checkout_wait_avg(self) -> float:
+        if not self.checkouts:
+            return 0.0
+        return self.checkout_wait_total / self.checkouts
+
+
+def get_pool_stats(engine: AsyncEngine | None = None) -> PoolStats:
+    """Snapshot of the connection pool of the given or the default engine."""
+    if engine is None:
+        from zion_db.engine import get_engine
+
+        engine = get_engine()
+
+    pool: Pool = engine.pool
+    is_queue = isinstance(pool, QueuePool)
+    stats = getattr(pool, "checkout_stats", None)
+
+    return PoolStats(
+        size=pool.size() if is_queue else 0,
+        checked_out=pool.checkedout() if is_queue else 0,
+        idle=pool.checkedin() if is_queue else 0,
+        overflow=max(pool.overflow(), 0) if is_queue else 0,
+        checkouts=stats.count if stats else 0,
+        checkout_timeouts=stats.timeouts if stats else 0,
+        checkout_wait_total=stats.total_wait if stats else 0.0,
+        checkout_wait_max=stats.max_wait if stats else 0.0,
+    )
+
+
+def reset_pool_stats(engine: AsyncEngine | None = None) -> None:
+    if engine is None:
+        from zion_db.engine import get_engine
+
+        engine = get_engine()
+
+    stats = getattr(engine.pool, "checkout_stats", None)
+    if stats is not None:
+        stats.reset()
+
+
+__all__ = [
+    "MeteredAsyncAdaptedQueuePool",
+    "MeteredQueuePool",
+    "PoolStats",
+    "get_pool_stats",
+    "reset_pool_stats",
+]
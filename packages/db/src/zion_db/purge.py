@@ -0,0 +1,115 @@
+import asyncio
+import datetime as dt
+from typing import Any
+
+from sqlalchemy import Table, delete, insert, select, true
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from zion_db.conf import settings
+from zion_db.session import INCLUDE_DELETED
+from zion_logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+async def purge_soft_deleted(
+    model: Any,
+    older_than: dt.timedelta | None = None,
+    archive_to: Any = None,
+    batch_size: int | None = None,
+    pause: float | None = None,
+    max_batches: int | None = None,
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+) -> int:
+    """Delete soft deleted rows older than the retention window.
+
+    The model must use `IdMixin` and `SoftDeleteMixin`. Rows are walked in
+    `id` order, `batch_size` at a time, and every batch runs in its own short
+    transaction followed by `pause` seconds of sleep. Locks are only held for
+    one batch, and replicas get time to catch up between batches.
+
+    When `archive_to` is a model or a table, each batch is copied into it in
+    the same transaction before it's deleted. Only the columns the two tables
+    share are copied.
+
+    Returns the number of purged rows.
+    """
+    if older_than is None:
+        older_than = dt.timedelta(days=settings.DB_PURGE_RETENTION_DAYS)
+    batch_size = batch_size or settings.DB_PURGE_BATCH_SIZE
+    pause = settings.DB_PURGE_PAUSE if pause is None else pause
+
+    if session_factory is None:
+        from zion_db.engine import get_sessionmaker
+
+        session_factory = get_sessionmaker()
+
+    cutoff = dt.datetime.now(dt.UTC) - older_than
+    table: Table = model.__table__
+    archive_table: Table | None = getattr(archive_to, "__table__", archive_to)
+
+    find_batch = (
+        select(model.id)
+        .where(model.is_deleted == true(), model.deleted_at < cutoff)
+        .order_by(model.id)
+        .limit(batch_size)
+        .execution_options(**{INCLUDE_DELETED: True})
+    )
+
+    purged = 0
+    batches = 0
+    last_id: int | None = None
+
+    while max_batches is None or batches < max_batches:
+        async with session_factory() as session, session.begin():
+            statement = find_batch
+            if last_id is not None:
+                statement = statement.where(model.id > last_id)
+
+            ids = list((await session.scalars(statement)).all())
+            if not ids:
+                break
+
+            if archive_table is not None:
+                columns = [
+                    column.name
+                    for column in archive_table.columns
+                    if column.name in table.columns
+                ]
+                await session.execute(
+                    insert(archive_table).from_select(
+                        columns,
+                        select(*(table.c[name] for name in columns)).where(
+                            table.c.id.in_(ids)
+                        ),
+                    )
+                )
+
+            await session.execute(
+                delete(table).where(table.c.id.in_(ids)),
+            )
+
+        purged += len(ids)
+        batches += 1
+        last_id = ids[-1]
+
+        await logger.ainfo(
+            "Purged soft deleted rows",
+            table=table.name,
+            archived_to=archive_table.name if archive_table is not None else None,
+            batch=batches,
+            batch_rows=len(ids),
+            total_rows=purged,
+            last_id=last_id,
+        )
+
+        if len(ids) < batch_size:
+            break
+        if pause:
+            await asyncio.sleep(pause)
+
+    return purged
+
+
+__all__ = ["purge_soft_deleted"]
@@ -0,0 +1,175 @@
+import itertools
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import CompoundSelect, Select, event
+from sqlalchemy.engine import Engine, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransactionOrigin
+
+from zion_db.session import TrackedSession
+
+
+ROUTER_KEY = "zion_router"
+REPLICA_KEY = "zion_replica"
+WROTE_KEY = "zion_wrote"
+
+# Session info key forcing every statement of the session to the primary
+USE_PRIMARY = "use_primary"
+
+# Execution option marking a textual statement as safe for a replica
+READ_ONLY = "read_only"
+
+
+class ReplicaRouter:
+    """Chooses between the primary and the healthy read replicas.
+
+    A replica whose connections fail is skipped for `retry_after` seconds.
+    With a `read_your_writes` window, reads of every routed session go to the
+    primary for that many seconds after a session of this process committed
+    a write.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: list[AsyncEngine],
+        retry_after: float = 30.0,
+        read_your_writes: float = 0.0,
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self.retry_after = retry_after
+        self.read_your_writes = read_your_writes
+
+        self._lock = threading.Lock()
+        self._cycle = itertools.cycle(range(len(replicas)))
+        self._unhealthy_until: dict[int, float] = {}
+        self._last_write_at = 0.0
+
+        for index, replica in enumerate(replicas):
+            event.listen(
+                replica.sync_engine, "handle_error", self._error_handler(index)
+            )
+
+    def choose_replica(self) -> int | None:
+        """Index of the next healthy replica, None when there's none."""
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.replicas)):
+                index = next(self._cycle)
+                if self._unhealthy_until.get(index, 0.0) <= now:
+                    return index
+        return None
+
+    def is_healthy(self, index: int) -> bool:
+        return self._unhealthy_until.get(index, 0.0) <= time.monotonic()
+
+    def mark_unhealthy(self, index: int) -> None:
+        with self._lock:
+            self._unhealthy_until[index] = time.monotonic() + self.retry_after
+
+    def reset_after_fork(self) -> None:
+        self._lock = threading.Lock()
+
+    def record_write(self) -> None:
+        self._last_write_at = time.monotonic()
+
+    def in_write_window(self) -> bool:
+        return (
+            self.read_your_writes > 0
+            and time.monotonic() - self._last_write_at < self.read_your_writes
+        )
+
+    def _error_handler(self, index: int):
+        def handle_error(context: ExceptionContext) -> None:
+            # Connection failures have no connection, lost ones are disconnects
+            if context.connection is None or context.is_disconnect:
+                self.mark_unhealthy(index)
+
+        return handle_error
+
+
+def is_read_only(clause: Any) -> bool:
+    """Whether a statement can run on a replica.
+
+    Only `select()` statements without `FOR UPDATE` are known to be reads.
+    Textual statements go to the primary unless they're marked with
+    `execution_options(read_only=True)`.
+    """
+    if isinstance(clause, (Select, CompoundSelect)):
+        return getattr(clause, "_for_update_arg", None) is None
+    if clause is not None and hasattr(clause, "get_execution_options"):
+        return bool(clause.get_execution_options().get(READ_ONLY, False))
+    return False
+
+
+class RoutingSession(TrackedSession):
+    """Sends reads to a replica and everything else to the primary.
+
+    A session sticks to the replica it picked first, so its reads are
+    consistent with each other, until that replica is marked unhealthy.
+    Statements that aren't provably reads, see `is_read_only()`, statements
+    in a transaction opened with `session.begin()`, and every statement
+    after the session's first write go to the primary.
+    """
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Engine:
+        router: ReplicaRouter | None = self.info.get(ROUTER_KEY)
+        if router is None:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+
+        primary = router.primary.sync_engine
+        if (
+            self._flushing
+            or self.info.get(WROTE_KEY)
+            or self.info.get(USE_PRIMARY)
+            or not is_read_only(clause)
+            or self._in_explicit_transaction()
+            or router.in_write_window()
+        ):
+            return primary
+
+        index = self.info.get(REPLICA_KEY)
+        if index is None or not router.is_healthy(index):
+            index = router.choose_replica()
+            if index is None:
+                return primary
+            self.info[REPLICA_KEY] = index
+        return router.replicas[index].sync_engine
+
+    def _in_explicit_transaction(self) -> bool:
+        transaction = self.get_transaction()
+        return (
+            transaction is not None
+            and transaction.origin is not SessionTransactionOrigin.AUTOBEGIN
+        )
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _mark_orm_write(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info[WROTE_KEY] = True
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_flush_write(session: Session, flush_context: Any) -> None:  # noqa: ARG001
+    session.info[WROTE_KEY] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _record_commit(session: Session) -> None:
+    if session.info.pop(WROTE_KEY, False):
+        router: ReplicaRouter | None = session.info.get(ROUTER_KEY)
+        if router is not None:
+            router.record_write()
+
+
+__all__ = [
+    "READ_ONLY",
+    "USE_PRIMARY",
+    "ReplicaRouter",
+    "RoutingSession",
+    "is_read_only",
+]
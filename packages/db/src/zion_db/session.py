@@ -0,0 +1,141 @@
+import time
+from typing import Any
+
+from sqlalchemy import event, false
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import (
+    ORMExecuteState,
+    Session,
+    SessionTransaction,
+    with_loader_criteria,
+)
+
+from zion_db.conf import settings
+from zion_db.mixins import SoftDeleteMixin
+
+
+CHECKOUT_STATS_KEY = "zion_checkout_stats"
+
+# Execution option, or session info key, that disables the soft delete filter
+INCLUDE_DELETED = "include_deleted"
+
+
+class CheckoutTimer:
+    """How long a session held a pooled connection."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.total = 0.0
+        self._started_at: float | None = None
+
+    @property
+    def is_checked_out(self) -> bool:
+        return self._started_at is not None
+
+    def start(self) -> None:
+        if self._started_at is None:
+            self._started_at = time.perf_counter()
+            self.checkouts += 1
+
+    def stop(self) -> None:
+        if self._started_at is not None:
+            self.total += time.perf_counter() - self._started_at
+            self._started_at = None
+
+
+class TrackedSession(Session):
+    """Session reporting connection checkouts to a `CheckoutTimer` in its info."""
+
+
+@event.listens_for(TrackedSession, "after_begin")
+def _start_checkout_timer(session: Session, transaction, connection) -> None:  # noqa: ARG001
+    timer = session.info.get(CHECKOUT_STATS_KEY)
+    if timer is not None:
+        timer.start()
+
+
+@event.listens_for(TrackedSession, "after_transaction_end")
+def _stop_checkout_timer(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is not None:
+        return
+
+    timer = session.info.get(CHECKOUT_STATS_KEY)
+    if timer is not None:
+        timer.stop()
+
+
+@event.listens_for(TrackedSession, "do_orm_execute")
+def _hide_soft_deleted(state: ORMExecuteState) -> None:
+    """Filter out soft deleted rows of every `SoftDeleteMixin` model.
+
+    The criteria also applies to relationship and eager loads. Pass
+    `execution_options(include_deleted=True)` to a statement, or set
+    `session.info["include_deleted"]`, to see the deleted rows.
+    """
+    if (
+        not state.is_select
+        or state.is_column_load
+        or not settings.DB_SOFT_DELETE_FILTER
+        or state.execution_options.get(INCLUDE_DELETED, False)
+        or state.session.info.get(INCLUDE_DELETED, False)
+    ):
+        return
+
+    state.statement = state.statement.options(
+        with_loader_criteria(
+            SoftDeleteMixin,
+            lambda cls: cls.is_deleted == false(),
+            include_aliases=True,
+        )
+    )
+
+
+class LazySession:
+    """Request scoped session created on first use.
+
+    Endpoints that never run a statement don't construct an `AsyncSession` at
+    all, and the connection itself is only checked out when the first
+    statement runs. Attribute access is proxied, so it can be used as an
+    `AsyncSession`. Call `release()` after the last statement to give the
+    connection back before the rest of the request runs.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self._session_factory = session_factory
+        self._session: AsyncSession | None = None
+        self.timer = CheckoutTimer()
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory(info={CHECKOUT_STATS_KEY: self.timer})
+        return self._session
+
+    @property
+    def is_used(self) -> bool:
+        return self._session is not None
+
+    @property
+    def checkout_time(self) -> float:
+        return self.timer.total
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+    async def release(self) -> None:
+        """Return the connection to the pool, keeping loaded objects usable."""
+        if self._session is not None and self.timer.is_checked_out:
+            await self._session.close()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+__all__ = [
+    "INCLUDE_DELETED",
+    "CheckoutTimer",
+    "LazySession",
+    "TrackedSession",
+]
@@ -0,0 +1,163 @@
+import asyncio
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session, SessionTransaction
+
+from zion_db.conf import settings
+from zion_db.session import TrackedSession
+
+
+# Session info key overriding `DB_STATEMENT_TIMEOUT` for one session
+STATEMENT_TIMEOUT = "statement_timeout"
+
+# Connection info keys: the timeout of the current transaction, and the
+# deadline of the running statement for drivers without a server side timeout
+_APPLIED_KEY = "zion_statement_timeout"
+_DEADLINE_KEY = "zion_statement_deadline"
+
+# SQLite virtual machine instructions between two deadline checks
+_SQLITE_PROGRESS_STEPS = 1000
+
+
+def apply_statement_timeout(connection: Connection, timeout: float | None) -> None:
+    """Limit how long each statement of the current transaction may run.
+
+    Call it inside the transaction. On Postgres it's a `SET LOCAL`, sent on
+    every begin: it ends with the transaction, while a plain `SET` issued in
+    a transaction is undone when it rolls back. MySQL session variables
+    aren't transactional, so they're only sent when they differ from the
+    ones already set on the pooled connection. `None` removes the limit.
+    """
+    milliseconds = int(timeout * 1000) if timeout else 0
+    dialect = connection.dialect
+    if dialect.name == "postgresql":
+        # Without a limit, the one of the previous transaction is gone already
+        if milliseconds:
+            connection.exec_driver_sql(f"SET LOCAL statement_timeout = {milliseconds}")
+    elif dialect.name == "mysql" and connection.info.get(_APPLIED_KEY) != timeout:
+        if getattr(dialect, "is_mariadb", False):
+            connection.exec_driver_sql(
+                f"SET SESSION max_statement_time = {milliseconds / 1000}"
+            )
+        else:
+            connection.exec_driver_sql(
+                f"SET SESSION max_execution_time = {milliseconds}"
+            )
+
+    connection.info[_APPLIED_KEY] = timeout
+
+
+@event.listens_for(TrackedSession, "after_begin")
+def _apply_session_timeout(
+    session: Session,
+    _transaction: SessionTransaction,
+    connection: Connection,
+) -> None:
+    timeout = session.info.get(STATEMENT_TIMEOUT, settings.DB_STATEMENT_TIMEOUT)
+    apply_statement_timeout(connection, timeout)
+
+
+def _install_sqlite_deadline(dbapi_connection: Any, connection_record: Any) -> None:
+    deadline: list[float | None] = [None]
+    connection_record.info[_DEADLINE_KEY] = deadline
+
+    def check_deadline() -> int:
+        # A non zero return interrupts the statement
+        return int(deadline[0] is not None and time.monotonic() > deadline[0])
+
+    dbapi_connection.await_(
+        dbapi_connection.driver_connection.set_progress_handler(
+            check_deadline, _SQLITE_PROGRESS_STEPS
+        )
+    )
+
+
+def _start_sqlite_deadline(conn: Connection, *_args: Any) -> None:
+    deadline = conn.info.get(_DEADLINE_KEY)
+    if deadline is not None:
+        timeout = conn.info.get(_APPLIED_KEY)
+        deadline[0] = time.monotonic() + timeout if timeout else None
+
+
+def install_statement_timeouts(engine: AsyncEngine) -> None:
+    """Enforce statement timeouts on drivers lacking a server side setting.
+
+    Postgres and MySQL need nothing here. On SQLite a progress handler
+    interrupts statements running past their deadline.
+    """
+    sync_engine = engine.sync_engine
+    if (
+        sync_engine.dialect.name != "sqlite"
+        or sync_engine.dialect.driver != "aiosqlite"
+    ):
+        return
+
+    event.listen(sync_engine, "connect", _install_sqlite_deadline)
+    event.listen(sync_engine, "before_cursor_execute", _start_sqlite_deadline)
+
+
+class CancelOnDisconnectMiddleware:
+    """ASGI middleware cancelling a request once its client disconnects.
+
+    The request runs in its own task, which is cancelled when the server
+    reports `http.disconnect` before the response is complete. The running
+    statement is cancelled with it, and its connection leaves the pool
+    checkout right away instead of when the database finishes. The request
+    body is read ahead of the application to notice the disconnect.
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        messages: asyncio.Queue = asyncio.Queue()
+        response_complete = False
+        disconnected = False
+
+        async def send_wrapper(message: Any) -> None:
+            nonlocal response_complete
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                response_complete = True
+
+        app_task = asyncio.ensure_future(self.app(scope, messages.get, send_wrapper))
+
+        async def watch_disconnect() -> None:
+            nonlocal disconnected
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                if message["type"] == "http.disconnect":
+                    if not response_complete:
+                        disconnected = True
+                        app_task.cancel()
+                    return
+
+        watcher = asyncio.create_task(watch_disconnect())
+        try:
+            await app_task
+        except asyncio.CancelledError:
+            current_task = asyncio.current_task()
+            # Nobody is left to send a response to
+            if not disconnected or (current_task and current_task.cancelling()):
+                raise
+        finally:
+            watcher.cancel()
+
+
+__all__ = [
+    "STATEMENT_TIMEOUT",
+    "CancelOnDisconnectMiddleware",
+    "apply_statement_timeout",
+    "install_statement_timeouts",
+]
@@ -0,0 +1,52 @@
+import os
+
+
+os.environ["ZION_SETTINGS_MODULE"] = "tests.settings"
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from zion_db import engine as engine_module
+from zion_db.base import DbBaseModel
+from zion_db.conf import settings
+from zion_db.engine import EngineRegistry, create_engine
+from zion_db.session import TrackedSession
+
+from . import models  # noqa: F401  # registers the test models
+
+
+@pytest.fixture
+def database_uri(tmp_path) -> str:
+    return f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+
+
+@pytest_asyncio.fixture
+async def engine(database_uri):
+    engine = create_engine(database_uri)
+    async with engine.begin() as connection:
+        await connection.run_sync(DbBaseModel.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        sync_session_class=TrackedSession,
+        expire_on_commit=False,
+    )
+
+
+@pytest_asyncio.fixture
+async def registry(monkeypatch: pytest.MonkeyPatch, database_uri):
+    """A fresh default engine registry using the temporary database."""
+    monkeypatch.setattr(settings, "DB_DATABASE_URI", database_uri)
+    registry = EngineRegistry()
+    monkeypatch.setattr(engine_module, "registry", registry)
+    async with registry.get_engine().begin() as connection:
+        await connection.run_sync(DbBaseModel.metadata.create_all)
+    yield registry
+    await registry.dispose()
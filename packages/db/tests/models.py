@@ -0,0 +1,35 @@
+import datetime as dt
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from zion_db.base import DbBaseModel
+from zion_db.mixins import (
+    IdMixin,
+    PidMixin,
+    SoftDeleteMixin,
+    TimestampMixin,
+    soft_delete_index,
+)
+
+
+class Item(IdMixin, PidMixin, TimestampMixin, DbBaseModel):
+    __tablename__ = "items"
+
+    name: Mapped[str] = mapped_column(String, unique=True)
+    price: Mapped[int] = mapped_column(default=0)
+
+
+class Note(IdMixin, SoftDeleteMixin, DbBaseModel):
+    __tablename__ = "notes"
+    __table_args__ = (soft_delete_index("ix_notes_title", "title", unique=True),)
+
+    title: Mapped[str] = mapped_column(String)
+
+
+class ArchivedNote(DbBaseModel):
+    __tablename__ = "archived_notes"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String)
+    deleted_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True))
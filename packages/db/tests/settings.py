@@ -0,0 +1,2 @@
+DB_DATABASE_URI = "sqlite+aiosqlite:///:memory:"
+DB_MODEL_MODULES = ["tests.models"]
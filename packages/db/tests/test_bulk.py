@@ -0,0 +1,97 @@
+import datetime as dt
+
+import pytest
+from sqlalchemy import func, select
+
+from zion_db.bulk import bulk_insert, bulk_upsert, iter_insert, iter_upsert
+
+from .models import Item
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_in_chunks(session_factory):
+    # Given
+    rows = ({"name": f"item {number}"} for number in range(25))
+
+    # When
+    async with session_factory() as session, session.begin():
+        count = await bulk_insert(session, Item, rows, chunk_size=10)
+
+    # Then
+    async with session_factory() as session:
+        assert count == 25
+        assert await session.scalar(select(func.count()).select_from(Item)) == 25
+
+
+@pytest.mark.asyncio
+async def test_iter_insert_returns_rows_in_order(session_factory):
+    # Given
+    rows = [{"name": f"item {number}"} for number in range(5)]
+
+    # When
+    async with session_factory() as session, session.begin():
+        returned = [
+            row
+            async for row in iter_insert(
+                session, Item, rows, returning=("id", "pid"), chunk_size=2
+            )
+        ]
+
+    # Then
+    async with session_factory() as session:
+        items = (await session.scalars(select(Item).order_by(Item.id))).all()
+    assert [row.id for row in returned] == [item.id for item in items]
+    assert [row.pid for row in returned] == [item.pid for item in items]
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_sets_timestamps_like_the_orm(session_factory):
+    # Given
+    before = dt.datetime.now(dt.UTC).replace(tzinfo=None)
+
+    # When
+    async with session_factory() as session, session.begin():
+        session.add(Item(name="orm"))
+        await bulk_insert(session, Item, [{"name": "bulk"}])
+
+    # Then
+    async with session_factory() as session:
+        items = (await session.scalars(select(Item).order_by(Item.id))).all()
+    for item in items:
+        assert isinstance(item.created_at, dt.datetime)
+        # Python side values keep their microseconds
+        assert item.created_at.replace(tzinfo=None) >= before
+        assert item.pid
+
+
+@pytest.mark.asyncio
+async def test_upsert_updates_existing_rows(session_factory):
+    # Given
+    async with session_factory() as session, session.begin():
+        await bulk_insert(session, Item, [{"name": "a", "price": 1}])
+    async with session_factory() as session:
+        original = await session.scalar(select(Item))
+
+    # When
+    async with session_factory() as session, session.begin():
+        count = await bulk_upsert(
+            session,
+            Item,
+            [{"name": "a", "price": 2}, {"name": "b", "price": 3}],
+            index_elements=["name"],
+        )
+        returned = [
+            row
+            async for row in iter_upsert(
+                session, Item, [{"name": "b", "price": 4}], index_elements=["name"]
+            )
+        ]
+
+    # Then
+    async with session_factory() as session:
+        items = (await session.scalars(select(Item).order_by(Item.name))).all()
+    assert count == 2
+    assert [(item.name, item.price) for item in items] == [("a", 2), ("b", 4)]
+    assert returned[0].id == items[1].id
+    assert items[0].pid == original.pid
+    assert items[0].updated_at > original.updated_at
@@ -0,0 +1,84 @@
+import pytest
+from sqlalchemy import literal_column, select, update
+
+from zion_db import cache
+from zion_db.cache import CACHE_REGION, MemoryBackend, configure_region
+
+from .models import Item
+
+
+@pytest.fixture(autouse=True)
+def _regions(monkeypatch):
+    monkeypatch.setattr(cache, "regions", {})
+
+
+def cached(statement):
+    return statement.execution_options(**{CACHE_REGION: "items"})
+
+
+@pytest.mark.asyncio
+async def test_select_is_served_from_cache(session_factory):
+    # Given
+    region = configure_region("items", ttl=60)
+    async with session_factory() as session, session.begin():
+        session.add(Item(name="first"))
+
+    # When
+    async with session_factory() as session:
+        first = (await session.scalars(cached(select(Item.name)))).all()
+        second = (await session.scalars(cached(select(Item.name)))).all()
+
+    # Then
+    assert first == second == ["first"]
+    assert (region.misses, region.hits) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_committed_writes_invalidate_cached_results(session_factory):
+    # Given
+    region = configure_region("items", ttl=60)
+    async with session_factory() as session, session.begin():
+        session.add(Item(name="first"))
+    async with session_factory() as session:
+        await session.scalars(cached(select(Item.name)))
+
+    # When
+    async with session_factory() as session, session.begin():
+        await session.execute(update(Item).values(name="renamed"))
+    async with session_factory() as session, session.begin():
+        session.add(Item(name="second"))
+    async with session_factory() as session:
+        names = (await session.scalars(cached(select(Item.name)))).all()
+
+    # Then
+    assert sorted(names) == ["renamed", "second"]
+    assert region.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_statement_cache_is_bounded(session_factory):
+    # Given
+    region = configure_region("items", ttl=60, statement_cache_size=10)
+
+    # When
+    async with session_factory() as session:
+        for number in range(100):
+            statement = select(Item.name, literal_column(str(number)))
+            await session.execute(cached(statement))
+
+    # Then
+    assert 0 < len(region._statement_cache) <= 15
+
+
+def test_memory_backend_evicts_least_recently_used():
+    # Given
+    backend = MemoryBackend(max_size=2)
+    backend.set("a", 1, ttl=None)
+    backend.set("b", 2, ttl=None)
+
+    # When
+    backend.get("a")
+    backend.set("c", 3, ttl=None)
+
+    # Then
+    assert (backend.get("a"), backend.get("b"), backend.get("c")) == (1, None, 3)
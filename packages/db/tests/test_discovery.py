@@ -0,0 +1,127 @@
+import os
+import sys
+import textwrap
+
+import pytest
+from sqlalchemy import event
+
+from zion_db.base import DbBaseModel
+from zion_db.conf import settings
+from zion_db.discovery import import_model_modules, read_manifest, write_manifest
+
+
+SOURCES = {
+    "shop/__init__.py": "",
+    "shop/helpers.py": "VALUE = 1\n",
+    "shop/tables.py": """
+        from sqlalchemy import Column, Integer, Table
+
+        from zion_db.base import DbBaseModel
+
+
+        carts = Table("carts", DbBaseModel.metadata, Column("id", Integer, primary_key=True))
+    """,
+    "shop/hooks/__init__.py": "",
+    "shop/hooks/listeners.py": """
+        from sqlalchemy import event
+
+        from zion_db.base import DbBaseModel
+
+
+        @event.listens_for(DbBaseModel.metadata, "before_create")
+        def before_create(*_args, **_kwargs):
+            pass
+    """,
+    "shop_extra.py": """
+        from sqlalchemy import Column, Integer, Table
+
+        from zion_db.base import DbBaseModel
+
+
+        extras = Table("extras", DbBaseModel.metadata, Column("id", Integer, primary_key=True))
+    """,
+}
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A temporary `shop` package, and a `shop_extra` module next to it."""
+    for name, source in SOURCES.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(source))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+
+    listeners = sys.modules.get("shop.hooks.listeners")
+    if listeners is not None:
+        event.remove(DbBaseModel.metadata, "before_create", listeners.before_create)
+    for table in ("carts", "extras"):
+        if table in DbBaseModel.metadata.tables:
+            DbBaseModel.metadata.remove(DbBaseModel.metadata.tables[table])
+    for name in list(sys.modules):
+        if name == "shop" or name.startswith(("shop.", "shop_extra")):
+            del sys.modules[name]
+
+
+def test_manifest_records_modules_adding_tables(project):
+    # Given
+    import shop_extra  # noqa: F401
+
+    manifest = str(project / "manifest.json")
+
+    # When
+    modules = write_manifest(manifest, ["shop"])
+
+    # Then
+    assert modules == ["shop.tables"]
+    assert read_manifest(manifest, ["shop"]) == modules
+
+
+def test_manifest_is_stale_once_a_file_changes(project):
+    # Given
+    manifest = str(project / "manifest.json")
+    write_manifest(manifest, ["shop"])
+
+    # When
+    helpers = project / "shop" / "helpers.py"
+    helpers.write_text("VALUE = 22\n")
+    os.utime(helpers, ns=(0, 0))
+
+    # Then
+    assert read_manifest(manifest, ["shop"]) is None
+
+
+def test_import_model_modules_uses_the_manifest(project, monkeypatch):
+    # Given
+    manifest = str(project / "manifest.json")
+    monkeypatch.setattr(settings, "DB_MODEL_MANIFEST", manifest)
+    import_model_modules(["shop"])
+    del sys.modules["shop.helpers"]
+
+    # When
+    import_model_modules(["shop"])
+
+    # Then
+    assert "shop.helpers" not in sys.modules
+    assert "carts" in DbBaseModel.metadata.tables
+
+
+def test_extra_modules_are_imported_with_the_manifest(project, monkeypatch):
+    # Given
+    manifest = str(project / "manifest.json")
+    monkeypatch.setattr(settings, "DB_MODEL_MANIFEST", manifest)
+    monkeypatch.setattr(settings, "DB_MODEL_EXTRA_MODULES", ["shop.hooks.listeners"])
+    import_model_modules(["shop"])
+    del sys.modules["shop.hooks.listeners"]
+    event.remove(
+        DbBaseModel.metadata,
+        "before_create",
+        sys.modules["shop.hooks"].listeners.before_create,
+    )
+
+    # When
+    import_model_modules(["shop"])
+
+    # Then
+    assert "shop.hooks.listeners" in sys.modules
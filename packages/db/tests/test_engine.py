@@ -0,0 +1,109 @@
+import pytest
+from sqlalchemy import text
+
+from zion_db import engine as engine_module
+from zion_db.conf import settings
+from zion_db.engine import EngineRegistry
+from zion_db.lifespan import db_lifespan, fill_pool, open_connections, preload
+from zion_db.pool import get_pool_stats
+
+
+@pytest.mark.asyncio
+async def test_engine_is_created_on_first_use():
+    # Given
+    registry = EngineRegistry()
+    assert not registry.is_initialized
+
+    # When
+    async with registry.get_sessionmaker()() as session:
+        value = await session.scalar(text("SELECT 1"))
+
+    # Then
+    assert value == 1
+    assert registry.is_initialized
+    assert registry.get_engine() is registry.get_engine()
+    await registry.dispose()
+
+
+@pytest.mark.asyncio
+async def test_dispose_forgets_the_engine(registry):
+    # Given
+    engine = registry.get_engine()
+
+    # When
+    await registry.dispose()
+
+    # Then
+    assert not registry.is_initialized
+    assert registry.get_engine() is not engine
+
+
+@pytest.mark.asyncio
+async def test_open_connections_fills_the_pool(registry):
+    # When
+    opened = await open_connections(3)
+
+    # Then
+    stats = get_pool_stats(registry.get_engine())
+    assert opened == 3
+    assert stats.idle == 3
+    assert stats.checked_out == 0
+
+
+@pytest.mark.asyncio
+async def test_lifespan_warms_up_and_disposes(registry):
+    # When
+    async with db_lifespan(connections=2):
+        idle = get_pool_stats(registry.get_engine()).idle
+
+    # Then
+    assert idle == 2
+    assert not registry.is_initialized
+
+
+@pytest.mark.asyncio
+async def test_reset_after_fork_drops_the_inherited_pool(registry):
+    # Given
+    engine = registry.get_engine()
+    await open_connections(2)
+    inherited = engine.pool
+
+    # When
+    registry.reset_after_fork()
+
+    # Then
+    assert registry.get_engine() is engine
+    assert engine.pool is not inherited
+    assert get_pool_stats(engine).idle == 0
+    async with engine.connect() as connection:
+        assert await connection.scalar(text("SELECT 1")) == 1
+
+
+def test_preload_creates_the_engine_without_connecting(monkeypatch, database_uri):
+    # Given
+    monkeypatch.setattr(settings, "DB_DATABASE_URI", database_uri)
+    registry = EngineRegistry()
+    monkeypatch.setattr(engine_module, "registry", registry)
+
+    # When
+    preload(freeze=False)
+
+    # Then
+    assert registry.is_initialized
+    assert get_pool_stats(registry.get_engine()).idle == 0
+    assert registry.get_engine().pool.checkedout() == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("enabled", "idle"), [(True, 2), (False, 0)])
+async def test_fill_pool_can_be_turned_off(registry, monkeypatch, enabled, idle):
+    # Given
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 2)
+    monkeypatch.setattr(settings, "DB_WARM_UP_POOL", enabled)
+    await registry.dispose()
+
+    # When
+    await fill_pool()
+
+    # Then
+    assert get_pool_stats(registry.get_engine()).idle == idle
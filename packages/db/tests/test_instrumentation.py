@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from structlog.testing import capture_logs
+
+from zion_db.conf import settings
+from zion_db.instrumentation import (
+    QueryTrackingMiddleware,
+    normalize_sql,
+    track_queries,
+)
+
+from .models import Item
+
+
+@pytest.fixture
+def log_every_query(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "DB_SLOW_QUERY_THRESHOLD", 0)
+
+
+def test_normalize_sql():
+    assert normalize_sql("SELECT * FROM t WHERE a = 'x' AND b = 10") == (
+        "SELECT * FROM t WHERE a = ? AND b = ?"
+    )
+    assert normalize_sql("SELECT * FROM t WHERE id IN (?, ?,  ?)") == (
+        "SELECT * FROM t WHERE id IN (...)"
+    )
+
+
+@pytest.mark.asyncio
+async def test_track_queries_counts_repeated_statements(session_factory):
+    async with session_factory() as session:
+        with track_queries() as stats:
+            for id in range(3):
+                await session.get(Item, id)
+
+    statement, count = stats.repeated_statements(threshold=3)[0]
+    assert stats.count == 3
+    assert count == 3
+    assert statement.startswith("SELECT items.")
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("log_every_query")
+async def test_slow_queries_are_logged_after_the_block(session_factory):
+    async with session_factory() as session:
+        with capture_logs() as logs:
+            with track_queries() as stats:
+                await session.scalars(select(Item))
+                logged_during_block = list(logs)
+
+    assert len(stats.slow_queries) == 1
+    assert logged_during_block == []
+    assert [log["event"] for log in logs] == ["Slow query"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("log_every_query")
+async def test_untracked_slow_queries_are_logged_later(session_factory):
+    async with session_factory() as session:
+        with capture_logs() as logs:
+            await session.scalars(select(Item))
+            logged_with_result = list(logs)
+            await asyncio.sleep(0)
+
+    assert logged_with_result == []
+    assert logs[0]["event"] == "Slow query"
+    assert logs[0]["statement"].startswith("SELECT items.")
+
+
+@pytest.mark.asyncio
+async def test_middleware_reports_n_plus_one(session_factory):
+    async def app(_scope, _receive, _send):
+        async with session_factory() as session:
+            for id in range(settings.DB_N_PLUS_ONE_THRESHOLD):
+                await session.get(Item, id)
+
+    middleware = QueryTrackingMiddleware(app)
+    with capture_logs() as logs:
+        await middleware({"type": "http", "path": "/items"}, None, None)
+
+    assert logs[0]["event"] == "Possible N+1 query"
+    assert logs[0]["count"] == settings.DB_N_PLUS_ONE_THRESHOLD
@@ -0,0 +1,135 @@
+import argparse
+
+import pytest
+from alembic.config import Config
+from alembic.operations import Operations
+from alembic.runtime.environment import EnvironmentContext
+from alembic.script import ScriptDirectory
+from alembic.util import CommandError
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    column,
+    create_engine,
+    func,
+    inspect,
+    select,
+)
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from structlog.testing import capture_logs
+
+from zion_db import migrations
+
+
+WIDGETS = Table(
+    "widgets",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("price", Integer, nullable=False, default=0),
+)
+
+
+@pytest.fixture
+def migration(tmp_path, database_uri):
+    """Run the test body as a migration, with the `-x` arguments it's given."""
+    engine = create_engine(database_uri.replace("+aiosqlite", ""))
+    with engine.begin() as connection:
+        WIDGETS.create(connection)
+        connection.execute(
+            WIDGETS.insert(),
+            [{"id": number} for number in range(1, 8)],
+        )
+
+    def run(body, *x_arguments):
+        config = Config()
+        config.set_main_option("script_location", str(tmp_path))
+        config.cmd_opts = argparse.Namespace(x=list(x_arguments))
+        environment = EnvironmentContext(config, ScriptDirectory(str(tmp_path)))
+        with engine.connect() as connection, environment:
+            environment.configure(connection=connection)
+            with Operations.context(environment.get_context()):
+                result = body()
+            connection.commit()
+        return result
+
+    yield engine, run
+    engine.dispose()
+
+
+def test_backfill_updates_in_batches(migration):
+    # Given
+    engine, run = migration
+
+    # When
+    updated = run(
+        lambda: migrations.backfill(
+            WIDGETS, {"price": 5}, where=column("id") > 2, batch_size=2, pause=0
+        )
+    )
+
+    # Then
+    with engine.connect() as connection:
+        prices = connection.execute(select(WIDGETS.c.price).order_by(WIDGETS.c.id))
+        assert prices.scalars().all() == [0, 0, 5, 5, 5, 5, 5]
+    assert updated == 5
+
+
+def test_dry_run_only_logs_estimates(migration):
+    # Given
+    engine, run = migration
+
+    # When
+    with capture_logs() as logs:
+        rows = run(
+            lambda: migrations.backfill(WIDGETS, {"price": 5}, batch_size=3),
+            "dry_run=1",
+        )
+        run(
+            lambda: migrations.create_index_concurrently(
+                "ix_widgets_price", "widgets", ["price"]
+            ),
+            "dry_run=1",
+        )
+
+    # Then
+    with engine.connect() as connection:
+        total = connection.scalar(select(func.sum(WIDGETS.c.price)))
+    assert total == 0
+    assert rows == 7
+    assert [(log["step"], log["estimated_rows"]) for log in logs] == [
+        ("backfill", 7),
+        ("create_index", 7),
+    ]
+    assert logs[0]["batches"] == 3
+    assert "ix_widgets_price" not in {
+        index["name"] for index in inspect(engine).get_indexes("widgets")
+    }
+
+
+def test_create_index_concurrently_falls_back_to_a_regular_index(migration):
+    # Given
+    engine, run = migration
+
+    # When
+    run(
+        lambda: migrations.create_index_concurrently(
+            "ix_widgets_price", "widgets", ["price"]
+        )
+    )
+
+    # Then
+    assert "ix_widgets_price" in {
+        index["name"] for index in inspect(engine).get_indexes("widgets")
+    }
+
+
+def test_dry_runs_need_transactional_ddl():
+    # When
+    migrations.check_dry_run(postgresql.dialect())
+
+    # Then
+    for dialect in (mysql.dialect(), sqlite.dialect()):
+        with pytest.raises(CommandError, match="transactional DDL"):
+            migrations.check_dry_run(dialect)
@@ -0,0 +1,96 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from zion_db.bulk import bulk_insert
+from zion_db.pagination import (
+    decode_cursor,
+    keyset_by_created_at,
+    keyset_by_id,
+    paginate,
+    stream_chunks,
+    stream_scalars,
+)
+
+from .models import Item
+
+
+@pytest_asyncio.fixture
+async def items(session_factory):
+    # Rows from the ORM and from bulk inserts share one timestamp format
+    async with session_factory() as session, session.begin():
+        session.add_all([Item(name=f"orm {number}") for number in range(3)])
+        await session.flush()
+        await bulk_insert(
+            session, Item, [{"name": f"bulk {number}"} for number in range(4)]
+        )
+
+
+async def collect_pages(session, keys, descending=False):
+    names, cursor = [], None
+    # A cursor that doesn't move on would page forever
+    for _ in range(10):
+        page = await paginate(
+            session, select(Item), keys, cursor, limit=3, descending=descending
+        )
+        names.append([item.name for item in page.items])
+        if not page.has_next:
+            return names
+        cursor = page.next_cursor
+    pytest.fail(f"Pagination didn't end: {names}")
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("items")
+async def test_paginate_by_id(session_factory):
+    async with session_factory() as session:
+        pages = await collect_pages(session, keyset_by_id(Item))
+
+    assert pages == [
+        ["orm 0", "orm 1", "orm 2"],
+        ["bulk 0", "bulk 1", "bulk 2"],
+        ["bulk 3"],
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("items")
+async def test_paginate_by_created_at(session_factory):
+    async with session_factory() as session:
+        pages = await collect_pages(session, keyset_by_created_at(Item))
+        descending = await collect_pages(
+            session, keyset_by_created_at(Item), descending=True
+        )
+
+    names = [name for page in pages for name in page]
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert names == ["orm 0", "orm 1", "orm 2", "bulk 0", "bulk 1", "bulk 2", "bulk 3"]
+    assert [name for page in descending for name in page] == names[::-1]
+
+
+@pytest.mark.asyncio
+async def test_mixed_sort_directions_are_rejected(session_factory):
+    async with session_factory() as session:
+        with pytest.raises(ValueError):
+            await paginate(session, select(Item).order_by(Item.name), (Item.id,))
+        with pytest.raises(ValueError):
+            await paginate(session, select(Item), (Item.created_at, Item.id.desc()))
+
+
+def test_invalid_cursor():
+    with pytest.raises(ValueError):
+        decode_cursor("not a cursor", keyset_by_id(Item))
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("items")
+async def test_streaming(session_factory):
+    async with session_factory() as session:
+        names = [item.name async for item in stream_scalars(session, select(Item))]
+        chunks = [
+            len(chunk)
+            async for chunk in stream_chunks(session, select(Item), fetch_size=3)
+        ]
+
+    assert len(names) == 7
+    assert chunks == [3, 3, 1]
@@ -0,0 +1,54 @@
+import uuid
+
+import pytest
+
+from zion_db.pid import (
+    CROCKFORD_ALPHABET,
+    PID_LENGTHS,
+    get_pid_generator,
+    nanoid,
+    ulid,
+    uuid7,
+)
+
+from .models import Item
+
+
+def test_default_strategy_is_nanoid():
+    assert Item.__table__.c.pid.type.length is None
+    assert len(Item(name="item").pid) == PID_LENGTHS["nanoid"]
+
+
+@pytest.mark.parametrize("generate", [ulid, uuid7])
+def test_time_ordered_ids_are_strictly_increasing(generate):
+    ids = [generate() for _ in range(10_000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_ulid_format():
+    value = ulid()
+
+    assert len(value) == PID_LENGTHS["ulid"]
+    assert set(value) <= set(CROCKFORD_ALPHABET)
+
+
+def test_uuid7_format():
+    value = uuid7()
+
+    assert len(value) == PID_LENGTHS["uuid7"]
+    assert uuid.UUID(value).version == 7
+
+
+def test_generator_reset_starts_a_new_sequence():
+    ulid()
+    ulid.reset()
+
+    assert ulid.next_value()[1] < 1 << 79
+
+
+def test_get_pid_generator():
+    assert get_pid_generator("nanoid") is nanoid
+    with pytest.raises(ValueError, match="Unknown pid strategy"):
+        get_pid_generator("uuid4")
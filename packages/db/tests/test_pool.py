@@ -0,0 +1,69 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool, StaticPool
+
+from zion_db.conf import settings
+from zion_db.engine import create_engine, get_engine_options, get_pool_class
+from zion_db.pool import MeteredAsyncAdaptedQueuePool, get_pool_stats, reset_pool_stats
+
+
+def test_queue_pools_are_metered(database_uri):
+    # When
+    options = get_engine_options(database_uri)
+
+    # Then
+    assert options["poolclass"] is MeteredAsyncAdaptedQueuePool
+    assert options["pool_size"] == settings.DB_POOL_SIZE
+
+
+def test_other_pools_are_kept():
+    # When
+    options = get_engine_options("sqlite+aiosqlite:///:memory:")
+
+    # Then
+    assert options["poolclass"] is StaticPool
+    assert "pool_size" not in options
+
+
+def test_pool_class_setting(monkeypatch: pytest.MonkeyPatch, database_uri):
+    # Given
+    monkeypatch.setattr(settings, "DB_POOL_CLASS", "sqlalchemy.pool.NullPool")
+
+    # When / Then
+    assert get_pool_class(database_uri) is NullPool
+    assert "pool_size" not in get_engine_options(database_uri)
+
+
+@pytest.mark.asyncio
+async def test_in_memory_database_works():
+    # Given
+    engine = create_engine("sqlite+aiosqlite:///:memory:")
+
+    # When
+    async with engine.connect() as connection:
+        await connection.execute(text("CREATE TABLE t (x INTEGER)"))
+        await connection.execute(text("INSERT INTO t VALUES (1)"))
+        value = await connection.scalar(text("SELECT x FROM t"))
+    await engine.dispose()
+
+    # Then
+    assert value == 1
+
+
+@pytest.mark.asyncio
+async def test_checkouts_are_measured(engine):
+    # Given
+    reset_pool_stats(engine)
+
+    # When
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+        during = get_pool_stats(engine)
+    after = get_pool_stats(engine)
+
+    # Then
+    assert during.checked_out == 1
+    assert after.checked_out == 0
+    assert after.idle == 1
+    assert after.checkouts == 1
+    assert after.checkout_wait_max >= after.checkout_wait_avg > 0
@@ -0,0 +1,69 @@
+import datetime as dt
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from zion_db.purge import purge_soft_deleted
+from zion_db.session import INCLUDE_DELETED
+
+from .models import ArchivedNote, Note
+
+
+@pytest_asyncio.fixture
+async def notes(session_factory):
+    long_ago = dt.datetime.now(dt.UTC) - dt.timedelta(days=40)
+    async with session_factory() as session, session.begin():
+        for number in range(5):
+            note = Note(title=f"old {number}")
+            note.soft_delete()
+            note.deleted_at = long_ago
+            session.add(note)
+
+        recent = Note(title="recent")
+        recent.soft_delete()
+        session.add_all([recent, Note(title="kept")])
+
+
+async def remaining_titles(session_factory) -> list[str]:
+    async with session_factory() as session:
+        statement = (
+            select(Note.title)
+            .order_by(Note.id)
+            .execution_options(**{INCLUDE_DELETED: True})
+        )
+        return list((await session.scalars(statement)).all())
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("notes")
+async def test_purge_in_batches_and_archive(session_factory):
+    # When
+    purged = await purge_soft_deleted(
+        Note,
+        archive_to=ArchivedNote,
+        batch_size=2,
+        pause=0,
+        session_factory=session_factory,
+    )
+
+    # Then
+    async with session_factory() as session:
+        archived = (await session.scalars(select(ArchivedNote))).all()
+    assert purged == 5
+    assert await remaining_titles(session_factory) == ["recent", "kept"]
+    assert sorted(note.title for note in archived) == [f"old {n}" for n in range(5)]
+    assert all(note.deleted_at is not None for note in archived)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("notes")
+async def test_purge_stops_after_max_batches(session_factory):
+    # When
+    purged = await purge_soft_deleted(
+        Note, batch_size=2, pause=0, max_batches=1, session_factory=session_factory
+    )
+
+    # Then
+    assert purged == 2
+    assert len(await remaining_titles(session_factory)) == 5
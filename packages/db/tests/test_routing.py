@@ -0,0 +1,105 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, text
+
+from zion_db.base import DbBaseModel
+from zion_db.conf import settings
+from zion_db.routing import USE_PRIMARY
+
+from .models import Item
+
+
+@pytest_asyncio.fixture
+async def router(registry, monkeypatch: pytest.MonkeyPatch, tmp_path):
+    monkeypatch.setattr(
+        settings,
+        "DB_REPLICA_URIS",
+        [f"sqlite+aiosqlite:///{tmp_path / name}" for name in ("r0.db", "r1.db")],
+    )
+    router = registry.get_router()
+    for index, replica in enumerate(router.replicas):
+        async with replica.begin() as connection:
+            await connection.run_sync(DbBaseModel.metadata.create_all)
+            await connection.execute(
+                Item.__table__.insert().values(name=f"replica {index}", pid=str(index))
+            )
+    return router
+
+
+@pytest.fixture
+def read_session(registry):
+    return registry.get_read_sessionmaker()()
+
+
+def bind_of(session, clause):
+    return session.sync_session.get_bind(clause=clause)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("router")
+async def test_reads_go_to_a_replica(read_session):
+    async with read_session as session:
+        name = await session.scalar(select(Item.name))
+        second = await session.scalar(select(Item.name))
+
+    # The session sticks to its replica
+    assert name == second
+    assert name in ("replica 0", "replica 1")
+
+
+@pytest.mark.asyncio
+async def test_statements_that_may_write_go_to_the_primary(router, read_session):
+    primary = router.primary.sync_engine
+
+    async with read_session as session:
+        assert bind_of(session, text("UPDATE items SET price = 1")) is primary
+        assert bind_of(session, text("SELECT 1")) is primary
+        assert bind_of(session, select(Item).with_for_update()) is primary
+        assert bind_of(session, None) is primary
+
+        read_only = text("SELECT 1").execution_options(read_only=True)
+        assert bind_of(session, read_only) is not primary
+
+
+@pytest.mark.asyncio
+async def test_explicit_transactions_read_from_the_primary(router, read_session):
+    async with read_session as session:
+        async with session.begin():
+            assert bind_of(session, select(Item)) is router.primary.sync_engine
+        assert bind_of(session, select(Item)) is not router.primary.sync_engine
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("router")
+async def test_reads_after_a_write_go_to_the_primary(read_session):
+    async with read_session as session:
+        session.add(Item(name="written"))
+        await session.flush()
+
+        names = (await session.scalars(select(Item.name))).all()
+        await session.rollback()
+
+    # Only the primary has the written row and no replica rows
+    assert names == ["written"]
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_sticky_replica_is_replaced(router, read_session):
+    async with read_session as session:
+        first = bind_of(session, select(Item))
+        index = [replica.sync_engine for replica in router.replicas].index(first)
+
+        router.mark_unhealthy(index)
+        second = bind_of(session, select(Item))
+        router.mark_unhealthy(1 - index)
+        third = bind_of(session, select(Item))
+
+    assert second is router.replicas[1 - index].sync_engine
+    # Without healthy replicas, reads go to the primary
+    assert third is router.primary.sync_engine
+
+
+@pytest.mark.asyncio
+async def test_use_primary(router, registry):
+    async with registry.get_read_sessionmaker()(info={USE_PRIMARY: True}) as session:
+        assert bind_of(session, select(Item)) is router.primary.sync_engine
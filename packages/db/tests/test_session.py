@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy import select
+
+from zion_db.engine import async_get_lazy_db
+from zion_db.pool import get_pool_stats
+from zion_db.session import LazySession
+
+from .models import Item
+
+
+@pytest.mark.asyncio
+async def test_session_is_created_on_first_use(session_factory):
+    # Given
+    lazy_session = LazySession(session_factory)
+
+    # When / Then
+    assert not lazy_session.is_used
+    await lazy_session.close()
+    assert not lazy_session.is_used
+    assert lazy_session.timer.checkouts == 0
+
+
+@pytest.mark.asyncio
+async def test_release_returns_the_connection(engine, session_factory):
+    # Given
+    lazy_session = LazySession(session_factory)
+    lazy_session.add(Item(name="first"))
+    await lazy_session.commit()
+
+    # When
+    item = await lazy_session.scalar(select(Item))
+    checked_out = get_pool_stats(engine).checked_out
+    await lazy_session.release()
+
+    # Then
+    assert checked_out == 1
+    assert get_pool_stats(engine).checked_out == 0
+    # Loaded objects stay usable
+    assert item.name == "first"
+    assert lazy_session.timer.checkouts == 2
+    assert lazy_session.checkout_time > 0
+    await lazy_session.close()
+
+
+@pytest.mark.asyncio
+async def test_lazy_dependency_closes_the_session(registry):
+    # Given
+    dependency = async_get_lazy_db()
+    lazy_session = await anext(dependency)
+    await lazy_session.scalar(select(Item))
+
+    # When
+    await dependency.aclose()
+
+    # Then
+    assert not lazy_session.is_used
+    assert get_pool_stats(registry.get_engine()).checked_out == 0
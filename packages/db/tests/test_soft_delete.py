@@ -0,0 +1,62 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select, text
+
+from zion_db.session import INCLUDE_DELETED
+
+from .models import Note
+
+
+@pytest_asyncio.fixture
+async def notes(session_factory):
+    async with session_factory() as session, session.begin():
+        deleted = Note(title="deleted")
+        deleted.soft_delete()
+        session.add_all([Note(title="kept"), deleted])
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("notes")
+async def test_deleted_rows_are_hidden(session_factory):
+    async with session_factory() as session:
+        titles = (await session.scalars(select(Note.title))).all()
+        notes = (await session.scalars(select(Note))).all()
+
+    assert [note.title for note in notes] == ["kept"]
+    # Column only selects are filtered too
+    assert titles == ["kept"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("notes")
+async def test_deleted_rows_can_be_included(session_factory):
+    statement = select(Note).execution_options(**{INCLUDE_DELETED: True})
+
+    async with session_factory() as session:
+        with_option = (await session.scalars(statement)).all()
+    async with session_factory(info={INCLUDE_DELETED: True}) as session:
+        with_info = (await session.scalars(select(Note))).all()
+
+    assert len(with_option) == 2
+    assert len(with_info) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("notes")
+async def test_partial_unique_index_allows_reusing_deleted_values(session_factory):
+    async with session_factory() as session, session.begin():
+        session.add(Note(title="deleted"))
+
+    async with session_factory() as session:
+        count = await session.scalar(
+            select(func.count())
+            .select_from(Note)
+            .where(Note.title == "deleted")
+            .execution_options(**{INCLUDE_DELETED: True})
+        )
+        index_sql = await session.scalar(
+            text("SELECT sql FROM sqlite_master WHERE name = 'ix_notes_title'")
+        )
+
+    assert count == 2
+    assert "WHERE is_deleted = 0" in index_sql
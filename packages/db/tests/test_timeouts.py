@@ -0,0 +1,127 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.dialects import mysql, postgresql
+
+from zion_db.timeouts import (
+    STATEMENT_TIMEOUT,
+    CancelOnDisconnectMiddleware,
+    apply_statement_timeout,
+)
+
+
+# Counts to a large number, long enough to outlive a short timeout
+SLOW_QUERY = text(
+    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c "
+    "WHERE x < 100000000) SELECT count(*) FROM c"
+)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_statements_are_interrupted(session_factory):
+    async with session_factory(info={STATEMENT_TIMEOUT: 0.05}) as session:
+        with pytest.raises(exc.OperationalError, match="interrupted"):
+            await session.execute(SLOW_QUERY)
+
+
+@pytest.mark.asyncio
+async def test_fast_statements_run(session_factory):
+    async with session_factory(info={STATEMENT_TIMEOUT: 5}) as session:
+        assert await session.scalar(text("SELECT 1")) == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_outlives_a_rolled_back_session(session_factory):
+    # Given
+    async with session_factory(info={STATEMENT_TIMEOUT: 0.05}) as session:
+        await session.execute(text("SELECT 1"))
+        await session.rollback()
+
+    # When / Then
+    async with session_factory(info={STATEMENT_TIMEOUT: 0.05}) as session:
+        with pytest.raises(exc.OperationalError, match="interrupted"):
+            await session.execute(SLOW_QUERY)
+
+
+def recording_connection(dialect):
+    statements = []
+    connection = SimpleNamespace(
+        dialect=dialect, info={}, exec_driver_sql=statements.append
+    )
+    return connection, statements
+
+
+def test_postgres_timeout_is_set_in_every_transaction():
+    # Given
+    connection, statements = recording_connection(postgresql.dialect())
+
+    # When, for a transaction that's rolled back, then the next one
+    apply_statement_timeout(connection, 1.5)
+    apply_statement_timeout(connection, 1.5)
+    apply_statement_timeout(connection, None)
+
+    # Then
+    assert statements == ["SET LOCAL statement_timeout = 1500"] * 2
+
+
+def test_mysql_timeout_is_only_set_when_it_changes():
+    # Given
+    connection, statements = recording_connection(mysql.dialect())
+
+    # When
+    apply_statement_timeout(connection, 1.5)
+    apply_statement_timeout(connection, 1.5)
+    apply_statement_timeout(connection, None)
+
+    # Then
+    assert statements == [
+        "SET SESSION max_execution_time = 1500",
+        "SET SESSION max_execution_time = 0",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_request_is_cancelled_on_disconnect():
+    started, cancelled = asyncio.Event(), asyncio.Event()
+
+    async def app(_scope, _receive, _send):
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def receive():
+        await started.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(_message):
+        pass
+
+    middleware = CancelOnDisconnectMiddleware(app)
+    await asyncio.wait_for(middleware({"type": "http"}, receive, send), timeout=1)
+
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_completed_request_is_not_cancelled():
+    messages = []
+
+    async def app(_scope, _receive, send):
+        await send({"type": "http.response.start", "status": 200})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    async def receive():
+        await asyncio.sleep(10)
+
+    async def send(message):
+        messages.append(message["type"])
+
+    middleware = CancelOnDisconnectMiddleware(app)
+    await middleware({"type": "http"}, receive, send)
+
+    assert messages == ["http.response.start", "http.response.body"]
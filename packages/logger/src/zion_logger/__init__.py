@@ -1,8 +1,21 @@
 from .decorators import log
-from .logger import get_logger, initialize_logger
+from .logger import (
+    bind_loggers,
+    follow_level_setting,
+    get_level,
+    get_logger,
+    initialize_logger,
+    set_level,
+)
+from .writer import BackgroundWriter
 
 __all__ = [
+    "BackgroundWriter",
+    "bind_loggers",
+    "follow_level_setting",
+    "get_level",
     "get_logger",
     "initialize_logger",
     "log",
+    "set_level",
 ]
@@ -1,16 +1,39 @@
 import logging
+import weakref
 
 import orjson
 import structlog
 from structlog.typing import Processor
 
 from . import processors
+from .writer import BackgroundWriter
+
+
+# Shared by every configuration, so the level can change without reconfiguring
+# structlog, whose loggers may already be cached
+_level_filter = processors.LevelFilter()
+
+# Loggers returned by `get_logger`, bound ahead of use by `bind_loggers`
+_loggers: weakref.WeakSet = weakref.WeakSet()
+
+
+def _to_level(level: int | str) -> int:
+    if isinstance(level, str):
+        return logging.getLevelNamesMapping()[level.upper()]
+    return level
 
 
 def initialize_logger(
     custom_processors: list[Processor] | None = None,
     cache_logger_on_first_use: bool = True,
+    level: int | str = logging.DEBUG,
+    writer: BackgroundWriter | None = None,
 ):
+    """Configure structlog to render JSON lines to stdout.
+
+    Pass a `BackgroundWriter` to write them from a separate thread.
+    """
+    set_level(level)
     if custom_processors is None:
         custom_processors = []
 
@@ -18,6 +41,7 @@ def initialize_logger(
         cache_logger_on_first_use=cache_logger_on_first_use,
         wrapper_class=structlog.make_filtering_bound_logger(logging.DEBUG),
         processors=[
+            *_level_filter.setup(),
             *processors.LoggerName().setup(),
             *processors.CodeLocation().setup(),
             *custom_processors,
@@ -25,17 +49,67 @@ def initialize_logger(
             # to bytes for performance reasons.
             structlog.processors.JSONRenderer(serializer=orjson.dumps),
         ],
-        logger_factory=structlog.BytesLoggerFactory(),
+        logger_factory=(
+            structlog.BytesLoggerFactory() if writer is None else writer.logger_factory
+        ),
     )
 
 
+def set_level(level: int | str) -> None:
+    """Drop the events below `level`, e.g. `logging.INFO` or `"info"`, from now on."""
+    _level_filter.level = _to_level(level)
+
+
+def get_level() -> int:
+    return _level_filter.level
+
+
+def follow_level_setting(
+    name: str = "LOG_LEVEL", default: int | str = logging.DEBUG
+) -> None:
+    """Keep the level in sync with a `zion_config` setting, also across reloads.
+
+    While the setting is missing, e.g. removed on reload, the level is
+    `default`. Requires `zion_config`. See `zion_config.reloading`.
+    """
+    from zion_config import settings
+    from zion_config.reloading import subscribe
+
+    def follow(level: int | str | None) -> None:
+        set_level(default if level is None else level)
+
+    follow(getattr(settings, name, None))
+    subscribe(lambda changes: follow(changes[name][1]), names=[name])
+
+
 def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
     if name is not None:
         logger = structlog.get_logger(logger_name=name)
     else:
         logger = structlog.get_logger()
 
+    _loggers.add(logger)
     return logger
 
 
-__all__ = ["get_logger", "initialize_logger"]
+def bind_loggers() -> int:
+    """Assemble the loggers created so far, instead of on their first event.
+
+    With `cache_logger_on_first_use`, the assembled logger is kept, so call
+    it after `initialize_logger()`. It's a `zion.warmup` step. Returns the
+    number of loggers.
+    """
+    loggers = list(_loggers)
+    for logger in loggers:
+        logger.bind()
+    return len(loggers)
+
+
+__all__ = [
+    "bind_loggers",
+    "follow_level_setting",
+    "get_level",
+    "get_logger",
+    "initialize_logger",
+    "set_level",
+]
@@ -1,7 +1,9 @@
 from .code_location import CodeLocation
+from .level_filter import LevelFilter
 from .logger_name import LoggerName
 
 __all__ = [
     "CodeLocation",
+    "LevelFilter",
     "LoggerName",
 ]
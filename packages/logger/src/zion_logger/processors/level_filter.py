@@ -0,0 +1,25 @@
+import logging
+
+import structlog
+from structlog.processors import NAME_TO_LEVEL
+from structlog.typing import EventDict, Processor, WrappedLogger
+
+
+class LevelFilter:
+    """Drops the events below the level, which can be changed at runtime"""
+
+    def __init__(self, level: int = logging.DEBUG):
+        self.level = level
+
+    def setup(self) -> list[Processor]:
+        return [self]
+
+    def __call__(
+        self, logger: WrappedLogger, method_name: str, event_dict: EventDict
+    ) -> EventDict:
+        if NAME_TO_LEVEL.get(method_name, logging.CRITICAL) < self.level:
+            raise structlog.DropEvent
+        return event_dict
+
+
+__all__ = ["LevelFilter"]
@@ -0,0 +1,195 @@
+import atexit
+import functools
+import itertools
+import os
+import sys
+import threading
+import weakref
+from collections import deque
+from typing import Literal
+
+
+OverflowPolicy = Literal["drop", "block", "sample"]
+
+
+class BackgroundWriter:
+    """Writes the log lines from a dedicated thread, in large batches.
+
+    Logging only appends the line to a bounded queue; the writer thread
+    joins the queued lines into `os.write` calls of up to `batch_size`
+    bytes, so a slow stdout pipe doesn't slow down the request path. It's
+    used as the structlog logger factory:
+
+    ```python
+    initialize_logger(writer=BackgroundWriter())
+    ```
+
+    When the queue holds `max_size` lines, the `overflow` policy applies:
+
+    - `drop`: the new line is dropped.
+    - `block`: logging waits until the writer thread makes room.
+    - `sample`: only one in `sample_every` lines is kept once the queue is
+      three quarters full, and the new line is dropped when it's full.
+
+    Dropped lines are counted in `dropped`. The queue is flushed by
+    `close()`, which runs at exit. A forked child starts its own writer
+    thread, leaving the lines queued before the fork to the parent.
+    """
+
+    def __init__(
+        self,
+        fd: int | None = None,
+        max_size: int = 10_000,
+        overflow: OverflowPolicy = "drop",
+        batch_size: int = 64 * 1024,
+        flush_interval: float = 0.1,
+        sample_every: int = 10,
+    ):
+        if overflow not in ("drop", "block", "sample"):
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
+
+        self.fd = sys.stdout.fileno() if fd is None else fd
+        self.max_size = max_size
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.sample_every = sample_every
+        self.dropped = 0
+
+        # `deque.append` and `popleft` are atomic, so logging threads and the
+        # writer thread share the queue without a lock
+        self._queue: deque[bytes] = deque()
+        self._sample_from = max_size * 3 // 4
+        self._sample_counter = itertools.count()
+        self._dropped_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._room = threading.Event()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(
+                after_in_child=functools.partial(_after_fork, weakref.ref(self))
+            )
+
+    def logger_factory(self, *args) -> "BackgroundWriter":
+        self.start()
+        return self
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="zion-logger-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def msg(self, message: bytes) -> None:
+        line = message + b"\n"
+        if self._closed:
+            # Too late for the thread, e.g. logging from other `atexit` hooks
+            with self._write_lock:
+                self._write(line)
+            return
+
+        queue = self._queue
+        if len(queue) >= self._sample_from and self.overflow != "block":
+            if len(queue) >= self.max_size or (
+                self.overflow == "sample"
+                and next(self._sample_counter) % self.sample_every
+            ):
+                self._drop()
+                return
+        elif len(queue) >= self.max_size:
+            while len(queue) >= self.max_size and not self._closed:
+                self._room.clear()
+                self._wakeup.set()
+                self._room.wait(self.flush_interval)
+
+        queue.append(line)
+        if len(queue) >= self._sample_from:
+            self._wakeup.set()
+
+    log = debug = info = warn = warning = msg
+    fatal = failure = err = error = critical = exception = msg
+
+    def flush(self) -> None:
+        """Write the queued lines now, from the calling thread."""
+        with self._write_lock:
+            self._drain()
+
+    def close(self) -> None:
+        """Stop the writer thread and write the lines still queued."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self._room.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        atexit.unregister(self.close)
+        self.flush()
+
+    def _reset_after_fork(self) -> None:
+        # Only the forking thread runs in the child, so the writer thread is
+        # gone, and a lock it held would stay locked
+        running = self._thread is not None and not self._closed
+        self._queue = deque()
+        self._dropped_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._room = threading.Event()
+        self._thread = None
+        if running:
+            atexit.unregister(self.close)
+            self.start()
+
+    def _drop(self) -> None:
+        with self._dropped_lock:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            with self._write_lock:
+                self._drain()
+
+    def _drain(self) -> None:
+        queue = self._queue
+        batch: list[bytes] = []
+        size = 0
+        while queue:
+            line = queue.popleft()
+            batch.append(line)
+            size += len(line)
+            if size >= self.batch_size:
+                self._write(b"".join(batch))
+                self._room.set()
+                batch.clear()
+                size = 0
+        if batch:
+            self._write(b"".join(batch))
+        self._room.set()
+
+    def _write(self, data: bytes) -> None:
+        view = memoryview(data)
+        try:
+            while view:
+                view = view[os.write(self.fd, view) :]
+        except OSError:
+            # The lines of the batch that weren't written are lost
+            with self._dropped_lock:
+                self.dropped += bytes(view).count(b"\n")
+
+
+def _after_fork(writer_ref: "weakref.ref[BackgroundWriter]") -> None:
+    writer = writer_ref()
+    if writer is not None:
+        writer._reset_after_fork()
+
+
+__all__ = ["BackgroundWriter", "OverflowPolicy"]
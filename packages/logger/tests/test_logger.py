@@ -0,0 +1,80 @@
+import logging
+
+import pytest
+import structlog
+
+from zion_logger import (
+    bind_loggers,
+    follow_level_setting,
+    get_level,
+    get_logger,
+    initialize_logger,
+    set_level,
+)
+from zion_logger.processors import LevelFilter
+
+
+@pytest.fixture
+def reset_logger():
+    yield
+    set_level(logging.DEBUG)
+    structlog.reset_defaults()
+
+
+def test_level_filter_drops_events_below_level():
+    level_filter = LevelFilter(logging.INFO)
+
+    with pytest.raises(structlog.DropEvent):
+        level_filter(None, "debug", {"event": "hidden"})
+    assert level_filter(None, "warning", {"event": "shown"}) == {"event": "shown"}
+
+
+@pytest.mark.usefixtures("reset_logger")
+def test_set_level_applies_to_existing_loggers(capfdbinary):
+    initialize_logger(level="info")
+    logger = get_logger("tests")
+
+    logger.debug("first debug")
+    logger.info("first info")
+    set_level("debug")
+    logger.debug("second debug")
+
+    output = capfdbinary.readouterr().out
+    assert get_level() == logging.DEBUG
+    assert b"first debug" not in output
+    assert b"first info" in output
+    assert b"second debug" in output
+
+
+@pytest.mark.usefixtures("reset_logger")
+def test_bind_loggers_assembles_created_loggers():
+    initialize_logger()
+    logger = get_logger("tests.bind")
+
+    assert bind_loggers() >= 1
+    # The proxy now returns the cached logger
+    assert logger.bind() is logger.bind()
+
+
+@pytest.mark.usefixtures("reset_logger")
+def test_level_follows_the_setting_until_it_is_removed(monkeypatch):
+    zion_config = pytest.importorskip("zion_config")
+    from zion_config import reloading
+
+    # Given
+    callbacks = []
+    monkeypatch.setattr(
+        reloading, "subscribe", lambda callback, names: callbacks.append(callback)
+    )
+    monkeypatch.setitem(zion_config.settings.__dict__, "LOG_LEVEL", "info")
+    follow_level_setting(default="warning")
+    assert get_level() == logging.INFO
+
+    # When
+    callbacks[0]({"LOG_LEVEL": ("info", "error")})
+    error_level = get_level()
+    callbacks[0]({"LOG_LEVEL": ("error", None)})
+
+    # Then
+    assert error_level == logging.ERROR
+    assert get_level() == logging.WARNING
@@ -0,0 +1,124 @@
+import os
+import signal
+import time
+
+import pytest
+import structlog
+
+from zion_logger import BackgroundWriter, get_logger, initialize_logger
+
+
+@pytest.fixture
+def pipe():
+    read_fd, write_fd = os.pipe()
+    yield read_fd, write_fd
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+def read_lines(fd: int) -> list[bytes]:
+    os.set_blocking(fd, False)
+    try:
+        return os.read(fd, 1 << 20).splitlines()
+    except BlockingIOError:
+        return []
+
+
+def test_close_flushes_queued_lines(pipe):
+    read_fd, write_fd = pipe
+    writer = BackgroundWriter(write_fd, flush_interval=60)
+    writer.start()
+
+    for number in range(3):
+        writer.msg(b"line %d" % number)
+    writer.close()
+
+    assert read_lines(read_fd) == [b"line 0", b"line 1", b"line 2"]
+    assert writer.dropped == 0
+
+
+def test_drop_policy_counts_dropped_lines(pipe):
+    read_fd, write_fd = pipe
+    writer = BackgroundWriter(write_fd, max_size=4, overflow="drop")
+
+    # Without the thread started, nothing empties the queue
+    for number in range(6):
+        writer.msg(b"line %d" % number)
+    writer.flush()
+
+    assert read_lines(read_fd) == [b"line 0", b"line 1", b"line 2", b"line 3"]
+    assert writer.dropped == 2
+
+
+def test_sample_policy_keeps_some_lines_when_nearly_full(pipe):
+    read_fd, write_fd = pipe
+    writer = BackgroundWriter(write_fd, max_size=8, overflow="sample", sample_every=2)
+
+    for number in range(8):
+        writer.msg(b"line %d" % number)
+    writer.flush()
+
+    assert len(read_lines(read_fd)) == 7
+    assert writer.dropped == 1
+
+
+def test_block_policy_waits_for_the_writer_thread(pipe):
+    read_fd, write_fd = pipe
+    writer = BackgroundWriter(write_fd, max_size=2, overflow="block")
+    writer.start()
+
+    for number in range(10):
+        writer.msg(b"line %d" % number)
+    writer.close()
+
+    assert len(read_lines(read_fd)) == 10
+    assert writer.dropped == 0
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Needs fork()")
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded")
+def test_forked_child_starts_its_own_writer_thread(pipe):
+    read_fd, write_fd = pipe
+    writer = BackgroundWriter(write_fd, max_size=2, overflow="block")
+    writer.start()
+    writer.msg(b"parent")
+
+    pid = os.fork()
+    if pid == 0:
+        # The child would block forever without a writer thread
+        for number in range(10):
+            writer.msg(b"child %d" % number)
+        writer.close()
+        os._exit(0)
+
+    deadline = time.monotonic() + 5
+    while (waited := os.waitpid(pid, os.WNOHANG)) == (0, 0):
+        if time.monotonic() > deadline:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            pytest.fail("The forked child hung")
+        time.sleep(0.01)
+    writer.close()
+
+    lines = read_lines(read_fd)
+    assert os.waitstatus_to_exitcode(waited[1]) == 0
+    assert sorted(lines) == sorted([b"parent", *(b"child %d" % n for n in range(10))])
+
+
+def test_unknown_overflow_policy():
+    with pytest.raises(ValueError):
+        BackgroundWriter(overflow="ignore")
+
+
+def test_initialize_logger_with_writer(pipe):
+    read_fd, write_fd = pipe
+    writer = BackgroundWriter(write_fd)
+    initialize_logger(writer=writer)
+
+    try:
+        get_logger("tests.writer").info("through the writer")
+    finally:
+        writer.close()
+        structlog.reset_defaults()
+
+    assert b"through the writer" in read_lines(read_fd)[0]
@@ -0,0 +1,160 @@
+"""Report what importing modules costs, from `python -X importtime`.
+
+```bash
+python -m zion_utils.importtime zion_auth.deps zion_db --max-ms 400
+python -m zion_utils.importtime zion_auth.deps --write-baseline importtime.json
+python -m zion_utils.importtime zion_auth.deps --baseline importtime.json
+```
+
+Every module is imported in a fresh interpreter, `--repeat` times, keeping
+the fastest run. The command exits with 1 when a module takes longer than
+`--max-ms`, than its baseline plus `--tolerance`, or when a top level
+package takes longer than its `--budget`, so it can guard CI.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+@dataclass
+class ImportTimes:
+    """Microseconds spent importing `module`, in total and by top level package."""
+
+    module: str
+    cumulative: int = 0
+    packages: dict[str, int] = field(default_factory=dict)
+
+
+def parse_importtime(module: str, output: str) -> ImportTimes:
+    """Parse the `-X importtime` lines written to stderr."""
+    times = ImportTimes(module)
+    packages: dict[str, int] = defaultdict(int)
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        if not self_us.strip().isdigit():
+            # The header line
+            continue
+
+        name = name.strip()
+        packages[name.split(".", 1)[0]] += int(self_us)
+        if name == module:
+            times.cumulative = int(cumulative_us)
+
+    times.packages = dict(packages)
+    return times
+
+
+def measure(module: str, repeat: int = 3) -> ImportTimes:
+    """Import `module` in fresh interpreters and keep the fastest run."""
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            env=os.environ,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"Importing {module} failed:\n{result.stderr.strip().splitlines()[-1]}"
+            )
+
+        times = parse_importtime(module, result.stderr)
+        if best is None or times.cumulative < best.cumulative:
+            best = times
+    return best
+
+
+def _parse_budgets(values: Sequence[str]) -> dict[str, float]:
+    budgets = {}
+    for value in values:
+        package, _, milliseconds = value.partition("=")
+        budgets[package] = float(milliseconds)
+    return budgets
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m zion_utils.importtime",
+        description="Report the import time of modules, by top level package.",
+    )
+    parser.add_argument("modules", nargs="+", metavar="MODULE")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10, help="Packages to list.")
+    parser.add_argument(
+        "--max-ms", type=float, help="Fail when a module takes longer to import."
+    )
+    parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        metavar="PACKAGE=MS",
+        help="Fail when a top level package takes longer.",
+    )
+    parser.add_argument("--baseline", help="JSON file of earlier import times.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed growth over the baseline, 0.25 by default.",
+    )
+    parser.add_argument("--write-baseline", metavar="PATH")
+    arguments = parser.parse_args(argv)
+
+    budgets = _parse_budgets(arguments.budget)
+    baseline = {}
+    if arguments.baseline:
+        baseline = json.loads(Path(arguments.baseline).read_text())
+
+    failures = []
+    results = {}
+    for module in arguments.modules:
+        times = measure(module, arguments.repeat)
+        milliseconds = times.cumulative / 1000
+        results[module] = round(milliseconds, 1)
+
+        print(f"{module}: {milliseconds:.1f} ms")
+        ranked = sorted(times.packages.items(), key=lambda item: -item[1])
+        for package, microseconds in ranked[: arguments.top]:
+            print(f"  {package:<32} {microseconds / 1000:8.1f} ms")
+
+        if arguments.max_ms is not None and milliseconds > arguments.max_ms:
+            failures.append(f"{module} took {milliseconds:.1f} ms")
+        if module in baseline:
+            allowed = baseline[module] * (1 + arguments.tolerance)
+            if milliseconds > allowed:
+                failures.append(
+                    f"{module} took {milliseconds:.1f} ms, "
+                    f"over its baseline of {baseline[module]} ms"
+                )
+        for package, budget in budgets.items():
+            package_ms = times.packages.get(package, 0) / 1000
+            if package_ms > budget:
+                failures.append(
+                    f"{package} took {package_ms:.1f} ms importing {module}"
+                )
+
+    if arguments.write_baseline:
+        Path(arguments.write_baseline).write_text(
+            json.dumps(results, indent=2, sort_keys=True) + "\n"
+        )
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+__all__ = ["ImportTimes", "measure", "parse_importtime"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
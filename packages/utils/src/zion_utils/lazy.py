@@ -0,0 +1,59 @@
+import sys
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from .module_loading import import_string
+
+
+class LazyAttributes:
+    """Module attributes created on first access, via the module `__getattr__`.
+
+    Each attribute is a dotted path, imported with `import_string`, or a
+    function building the value. Resolved values are stored in the module
+    globals, so later lookups don't reach `__getattr__` again:
+
+    ```python
+    _lazy = LazyAttributes(
+        __name__,
+        {
+            "DbBaseModel": "zion_db.base.DbBaseModel",
+            "SessionDep": lambda: Annotated[AsyncSession, Depends(get_db)],
+        },
+    )
+
+
+    def __getattr__(name: str):
+        return _lazy.getattr(name)
+    ```
+    """
+
+    def __init__(
+        self, module_name: str, attributes: dict[str, str | Callable[[], Any]]
+    ):
+        self.module_name = module_name
+        self.attributes = attributes
+        self._lock = threading.RLock()
+
+    def getattr(self, name: str) -> Any:
+        module_globals = vars(sys.modules[self.module_name])
+        if name in module_globals:
+            return module_globals[name]
+
+        target = self.attributes.get(name)
+        if target is None:
+            raise AttributeError(
+                f"module {self.module_name!r} has no attribute {name!r}"
+            )
+
+        with self._lock:
+            if name not in module_globals:
+                value = import_string(target) if isinstance(target, str) else target()
+                module_globals[name] = value
+            return module_globals[name]
+
+    def dir(self) -> list[str]:
+        return sorted(set(vars(sys.modules[self.module_name])) | self.attributes.keys())
+
+
+__all__ = ["LazyAttributes"]
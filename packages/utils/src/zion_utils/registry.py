@@ -0,0 +1,184 @@
+import importlib.metadata
+import threading
+from collections.abc import Callable, Iterable
+from types import SimpleNamespace
+from typing import Any
+
+from .exceptions import ImproperlyConfiguredError
+from .module_loading import import_string
+
+
+class Slot:
+    """A name providers are registered under, and what they must provide."""
+
+    __slots__ = ("name", "protocol", "required")
+
+    def __init__(self, name: str, protocol: type | None, required: bool):
+        self.name = name
+        self.protocol = protocol
+        self.required = required
+
+
+class Provider:
+    __slots__ = ("name", "target", "requires")
+
+    def __init__(self, name: str, target: Any, requires: tuple[str, ...]):
+        self.name = name
+        self.target = target
+        self.requires = requires
+
+
+class Registry:
+    """Providers registered by name and resolved into direct references.
+
+    A provider is the object itself, a dotted path imported with
+    `import_string`, or an entry point. `compile()`, called at startup,
+    resolves every provider, following `requires` and the `get()` calls made
+    while importing them, checks them against their slot and raises one
+    error listing every problem. Afterwards, `get()` is a dict lookup and
+    `refs.<name>` a plain attribute access:
+
+    ```python
+    registry = Registry("myapp")
+    registry.declare("mailer", protocol=MailerProtocol)
+    registry.register_entry_points("myapp.providers")
+    registry.register("mailer", "myapp.mail.SmtpMailer")
+    registry.compile()
+
+    registry.refs.mailer
+    ```
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.refs = SimpleNamespace()
+        self._slots: dict[str, Slot] = {}
+        self._providers: dict[str, Provider] = {}
+        self._resolved: dict[str, Any] = {}
+        self._resolving: list[str] = []
+        self._lock = threading.RLock()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._providers
+
+    def declare(
+        self, name: str, protocol: type | None = None, required: bool = True
+    ) -> None:
+        """Require a provider for `name` implementing `protocol`, if given.
+
+        Classes must be subclasses of the protocol; other providers only
+        have to be callable.
+        """
+        self._slots[name] = Slot(name, protocol, required)
+
+    def register(self, name: str, target: Any, requires: Iterable[str] = ()) -> None:
+        """Register `target` for `name`, replacing an earlier provider."""
+        with self._lock:
+            self._providers[name] = Provider(name, target, tuple(requires))
+            self._resolved.pop(name, None)
+            self.refs.__dict__.pop(name, None)
+
+    def provider(self, name: str, requires: Iterable[str] = ()) -> Callable[[Any], Any]:
+        """Decorator registering the decorated class or function."""
+
+        def decorator(target: Any) -> Any:
+            self.register(name, target, requires)
+            return target
+
+        return decorator
+
+    def register_entry_points(self, group: str) -> None:
+        """Register the entry points of `group`, keeping registered providers.
+
+        Installed packages can provide defaults in their `pyproject.toml`:
+
+        ```toml
+        [project.entry-points."myapp.providers"]
+        mailer = "mypackage.mail:SesMailer"
+        ```
+        """
+        for entry_point in importlib.metadata.entry_points(group=group):
+            if entry_point.name not in self._providers:
+                self.register(entry_point.name, entry_point)
+
+    def get(self, name: str) -> Any:
+        try:
+            return self._resolved[name]
+        except KeyError:
+            return self._resolve(name)
+
+    def compile(self) -> None:
+        """Resolve and check every provider and required slot at once.
+
+        Raises `ImproperlyConfiguredError` describing every failure.
+        """
+        errors = []
+        names = dict.fromkeys([*self._providers, *self._slots])
+        for name in names:
+            slot = self._slots.get(name)
+            if name not in self._providers and slot is not None and not slot.required:
+                continue
+            try:
+                self.get(name)
+            except Exception as error:
+                errors.append(f"{name}: {error}")
+
+        if errors:
+            raise ImproperlyConfiguredError(
+                f"The {self.name} providers are misconfigured:\n"
+                + "\n".join(f"- {error}" for error in errors)
+            )
+
+    def _resolve(self, name: str) -> Any:
+        with self._lock:
+            if name in self._resolved:
+                return self._resolved[name]
+
+            provider = self._providers.get(name)
+            if provider is None:
+                raise ImproperlyConfiguredError(
+                    f"No provider is registered for `{name}`."
+                )
+            if name in self._resolving:
+                cycle = " -> ".join([*self._resolving, name])
+                raise ImproperlyConfiguredError(f"Circular providers: {cycle}.")
+
+            self._resolving.append(name)
+            try:
+                for required in provider.requires:
+                    self.get(required)
+                value = self._load(provider)
+                self._check(name, value)
+            finally:
+                self._resolving.pop()
+
+            self._resolved[name] = value
+            setattr(self.refs, name, value)
+            return value
+
+    def _load(self, provider: Provider) -> Any:
+        target = provider.target
+        try:
+            if isinstance(target, importlib.metadata.EntryPoint):
+                return target.load()
+            if isinstance(target, str):
+                return import_string(target)
+        except (ImportError, AttributeError) as error:
+            raise ImproperlyConfiguredError(
+                f"`{target}` cannot be imported: {error}"
+            ) from error
+        return target
+
+    def _check(self, name: str, value: Any) -> None:
+        slot = self._slots.get(name)
+        protocol = slot.protocol if slot is not None else None
+        if isinstance(value, type) and protocol is not None:
+            if not issubclass(value, protocol):
+                raise ImproperlyConfiguredError(
+                    f"{value.__qualname__} doesn't implement {protocol.__qualname__}."
+                )
+        elif not callable(value):
+            raise ImproperlyConfiguredError(f"{value!r} isn't callable.")
+
+
+__all__ = ["Registry"]
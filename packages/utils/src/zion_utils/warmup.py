@@ -0,0 +1,164 @@
+"""Warm-up steps run before an application serves its first request.
+
+Packages register steps through the `zion.warmup` entry points:
+
+```toml
+[project.entry-points."zion.warmup"]
+"mypackage.cache" = "mypackage.cache:fill_cache"
+```
+
+or with `register()`, and the application runs them from its lifespan:
+
+```python
+from fastapi import FastAPI
+from zion_utils.warmup import warm_up_lifespan
+
+app = FastAPI(lifespan=warm_up_lifespan)
+```
+
+Steps run concurrently. Coroutine functions run on the event loop and
+regular functions in threads, so slow synchronous steps, like hashing a
+password, don't hold the others back.
+"""
+
+import asyncio
+import importlib.metadata
+import inspect
+import logging
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "zion.warmup"
+
+Step = Callable[[], Any]
+
+_steps: dict[str, Step] = {}
+
+
+@dataclass
+class StepResult:
+    name: str
+    duration: float
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def register(name: str, step: Step | None = None) -> Any:
+    """Register a warm-up step, directly or as a decorator."""
+    if step is None:
+
+        def decorator(step: Step) -> Step:
+            _steps[name] = step
+            return step
+
+        return decorator
+
+    _steps[name] = step
+    return step
+
+
+def unregister(name: str) -> None:
+    _steps.pop(name, None)
+
+
+def get_steps(
+    entry_points: bool = True,
+) -> dict[str, Step | importlib.metadata.EntryPoint]:
+    """Registered steps, with those of the installed packages' entry points.
+
+    Entry points are loaded when their step runs. Registered steps replace
+    entry points of the same name.
+    """
+    steps: dict[str, Step | importlib.metadata.EntryPoint] = {}
+    if entry_points:
+        for entry_point in importlib.metadata.entry_points(group=ENTRY_POINT_GROUP):
+            steps[entry_point.name] = entry_point
+    steps.update(_steps)
+    return steps
+
+
+async def _run_step(
+    name: str, step: Step | importlib.metadata.EntryPoint, timeout: float | None
+) -> StepResult:
+    started = time.perf_counter()
+    error = None
+    try:
+        async with asyncio.timeout(timeout):
+            if isinstance(step, importlib.metadata.EntryPoint):
+                step = await asyncio.to_thread(step.load)
+            if inspect.iscoroutinefunction(step):
+                await step()
+            else:
+                result = await asyncio.to_thread(step)
+                if inspect.isawaitable(result):
+                    await result
+    except Exception as exception:
+        error = exception
+    return StepResult(name, time.perf_counter() - started, error)
+
+
+async def warm_up(
+    names: Iterable[str] | None = None,
+    timeout: float | None = None,
+    entry_points: bool = True,
+    raise_errors: bool = True,
+) -> list[StepResult]:
+    """Run the steps, or the given ones, concurrently and return their results.
+
+    Every step is timed and logged. A failing step doesn't stop the others;
+    the failures are raised together, once all steps finished, as an
+    `ExceptionGroup`. Without `raise_errors`, they're only logged.
+    """
+    steps = get_steps(entry_points)
+    if names is not None:
+        steps = {name: steps[name] for name in names}
+
+    results = await asyncio.gather(
+        *(_run_step(name, step, timeout) for name, step in steps.items())
+    )
+
+    for result in results:
+        duration_ms = round(result.duration * 1000, 2)
+        if result.ok:
+            logger.info("Warm-up step %s took %s ms", result.name, duration_ms)
+        else:
+            logger.warning(
+                "Warm-up step %s failed after %s ms: %r",
+                result.name,
+                duration_ms,
+                result.error,
+            )
+
+    errors = [result.error for result in results if result.error is not None]
+    if raise_errors and errors:
+        raise ExceptionGroup("Warm-up failed", errors)
+    return results
+
+
+@asynccontextmanager
+async def warm_up_lifespan(_app: Any = None) -> AsyncIterator[None]:
+    """FastAPI lifespan running every warm-up step before serving requests.
+
+    A failing step stops the startup, e.g. on misconfigured providers.
+    """
+    await warm_up()
+    yield
+
+
+__all__ = [
+    "StepResult",
+    "get_steps",
+    "register",
+    "unregister",
+    "warm_up",
+    "warm_up_lifespan",
+]
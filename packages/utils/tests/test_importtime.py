@@ -0,0 +1,46 @@
+import json
+
+from zion_utils.importtime import main, parse_importtime
+
+
+OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        300 |     mypackage.models
+import time:       200 |        500 |   mypackage
+import time:       150 |        650 | myapp
+some other line
+"""
+
+
+def test_parse_importtime_sums_packages():
+    # When
+    times = parse_importtime("myapp", OUTPUT)
+
+    # Then
+    assert times.cumulative == 650
+    assert times.packages == {"_io": 120, "mypackage": 500, "myapp": 150}
+
+
+def test_main_checks_the_limits(capsys):
+    # When
+    within = main(["json", "--repeat", "1", "--max-ms", "100000"])
+    over = main(["json", "--repeat", "1", "--max-ms", "0"])
+
+    # Then
+    assert (within, over) == (0, 1)
+    assert "FAIL: json took" in capsys.readouterr().err
+
+
+def test_main_compares_with_the_baseline(tmp_path):
+    # Given
+    baseline = tmp_path / "importtime.json"
+    main(["json", "--repeat", "1", "--write-baseline", str(baseline)])
+    assert json.loads(baseline.read_text()).keys() == {"json"}
+
+    # When
+    baseline.write_text(json.dumps({"json": 0}))
+    result = main(["json", "--repeat", "1", "--baseline", str(baseline)])
+
+    # Then
+    assert result == 1
@@ -0,0 +1,63 @@
+import sys
+import types
+
+import pytest
+
+from zion_utils.lazy import LazyAttributes
+
+
+@pytest.fixture
+def module(monkeypatch: pytest.MonkeyPatch):
+    module = types.ModuleType("lazy_module")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    return module
+
+
+def test_attributes_are_created_once(module):
+    # Given
+    calls = []
+
+    def build():
+        calls.append(1)
+        return object()
+
+    lazy = LazyAttributes(module.__name__, {"value": build})
+
+    # When
+    first = lazy.getattr("value")
+    second = lazy.getattr("value")
+
+    # Then
+    assert first is second is module.value
+    assert calls == [1]
+
+
+def test_dotted_paths_are_imported(module):
+    # Given
+    lazy = LazyAttributes(module.__name__, {"join": "os.path.join"})
+
+    # When
+    join = lazy.getattr("join")
+
+    # Then
+    import os.path
+
+    assert join is os.path.join
+
+
+def test_unknown_attribute_raises_attribute_error(module):
+    # Given
+    lazy = LazyAttributes(module.__name__, {})
+
+    # When / Then
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        lazy.getattr("missing")
+
+
+def test_dir_lists_lazy_attributes(module):
+    # Given
+    module.loaded = 1
+    lazy = LazyAttributes(module.__name__, {"value": object})
+
+    # When / Then
+    assert {"loaded", "value"} <= set(lazy.dir())
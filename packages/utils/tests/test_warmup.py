@@ -0,0 +1,101 @@
+import asyncio
+import threading
+
+import pytest
+
+from zion_utils import warmup
+
+
+@pytest.fixture(autouse=True)
+def steps(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(warmup, "_steps", {})
+
+
+@pytest.mark.asyncio
+async def test_steps_run_concurrently():
+    # Given
+    started = threading.Event()
+
+    def sync_step():
+        assert started.wait(1)
+
+    @warmup.register("async")
+    async def async_step():
+        started.set()
+
+    warmup.register("sync", sync_step)
+
+    # When
+    results = await warmup.warm_up(entry_points=False)
+
+    # Then
+    assert [(result.name, result.ok) for result in results] == [
+        ("async", True),
+        ("sync", True),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failures_are_raised_once_every_step_finished():
+    # Given
+    finished = []
+
+    async def slow():
+        await asyncio.sleep(0.01)
+        finished.append("slow")
+
+    def broken():
+        raise RuntimeError("broken")
+
+    warmup.register("slow", slow)
+    warmup.register("broken", broken)
+
+    # When
+    with pytest.raises(ExceptionGroup) as error:
+        await warmup.warm_up(entry_points=False)
+
+    # Then
+    assert finished == ["slow"]
+    assert [str(exception) for exception in error.value.exceptions] == ["broken"]
+
+
+@pytest.mark.asyncio
+async def test_failures_are_only_logged_without_raise_errors():
+    # Given
+    warmup.register("broken", lambda: 1 / 0)
+    warmup.register("timed_out", lambda: asyncio.sleep(1))
+
+    # When
+    results = await warmup.warm_up(entry_points=False, timeout=0.01, raise_errors=False)
+
+    # Then
+    errors = {result.name: type(result.error) for result in results}
+    assert errors == {"broken": ZeroDivisionError, "timed_out": TimeoutError}
+
+
+@pytest.mark.asyncio
+async def test_only_the_given_steps_run():
+    # Given
+    ran = []
+    warmup.register("first", lambda: ran.append("first"))
+    warmup.register("second", lambda: ran.append("second"))
+
+    # When
+    await warmup.warm_up(["second"], entry_points=False)
+
+    # Then
+    assert ran == ["second"]
+
+
+@pytest.mark.asyncio
+async def test_lifespan_fails_the_startup(monkeypatch: pytest.MonkeyPatch):
+    # Given
+    # Leave the entry points of the installed packages out
+    monkeypatch.setattr(
+        warmup, "get_steps", lambda _entry_points: {"broken": lambda: 1 / 0}
+    )
+
+    # When / Then
+    with pytest.raises(ExceptionGroup):
+        async with warmup.warm_up_lifespan():
+            pytest.fail("The application started")